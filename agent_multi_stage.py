@@ -6,8 +6,8 @@ Explorer (Discovery) → Explorer (Selection) → Reader → Coder → Executor
 
 import os
 import sys
-import subprocess
-import tempfile
+import json
+import time
 from pathlib import Path
 
 try:
@@ -23,6 +23,13 @@ except ImportError:
     print("Install with: pip install anthropic")
     sys.exit(1)
 
+from servers.mcp_client import open_client, close_client
+from servers.code_executor import get_executor, close_executor, dump_results
+from servers.tool_registry import get_registry, get_interface
+from servers.tool_selector import get_selector
+from servers.code_templates import template_code
+from servers.response_reducer import reduce_response, reduce_results
+
 # Initialize Anthropic client
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
 if not ANTHROPIC_API_KEY and __name__ == "__main__":
@@ -34,6 +41,24 @@ client = anthropic.Anthropic(api_key=ANTHROPIC_API_KEY) if ANTHROPIC_API_KEY els
 # Working directory
 WORKING_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# Upper bound on a single run of generated code, in seconds
+EXECUTION_TIMEOUT = 30
+
+# How stage 1a finds the available tools: "registry" reads the in-process
+# tool registry; "agent" has the Explorer write and run a directory-listing
+# script (slower, but shows the code execution pattern end to end)
+TOOL_DISCOVERY = os.getenv("TOOL_DISCOVERY", "registry").lower()
+
+# How stage 1b picks the tool: "auto" ranks the tools locally and only asks
+# the LLM (with every tool, best-ranked first) when the top candidates are
+# close; "llm" always asks the LLM with the full tool list
+TOOL_SELECTION = os.getenv("TOOL_SELECTION", "auto").lower()
+
+# How stage 3 writes the code: "auto" fills the single-call template when
+# every parameter can be read from the query and only asks the Coder LLM for
+# anything else; "llm" always asks the Coder LLM
+CODE_GENERATION = os.getenv("CODE_GENERATION", "auto").lower()
+
 # ============================================================================
 # AGENT 1A: EXPLORER - DISCOVERY (Find all available tools)
 # ============================================================================
@@ -183,35 +208,61 @@ Generate clean Python code that:
 1. Imports from servers.alphavantage
 2. Calls the tool with parameters in the EXACT format shown in documentation examples
 3. Handles the response appropriately
-4. Prints the RAW result as JSON (this will be parsed by the Parser Agent)
+4. Passes the RAW result to emit() (this will be parsed by the Parser Agent)
 
 Guidelines:
 - Wrap code in ```python blocks
 - Use try/except for error handling
-- Output MUST be valid JSON that can be parsed
-- Use json.dumps() to ensure clean JSON output
+- Hand results to the pipeline with emit(value) from servers.code_executor; pass the value
+  itself (emit serializes it, NumPy arrays included), not json.dumps of it. print() output is
+  only kept as a log
 - Include comments showing parameter format
+- If the query needs several independent calls (e.g. multiple symbols), fetch them concurrently
+  instead of calling in a loop:
+    from servers.mcp_client import gather_tools
+    results = gather_tools([("{tool_name}", {{"symbol": s}}) for s in symbols], concurrency=8)
+  Results come back in the same order; a failed call yields a dict with an "error" key
+- For tools that return CSV (datatype=csv), do not emit the whole CSV. Iterate the rows and
+  emit only what the query needs:
+    from servers.mcp_client import call_mcp_tool
+    rows = call_mcp_tool("{tool_name}", params, decode="rows")  # iterator of dicts
+  If the call fails or the API returns a message instead of CSV, you get a dict, not an iterator
 
 Example structure:
 ```python
-import json
 from servers.alphavantage import {tool_name}
+from servers.code_executor import emit
 
 try:
     # Call the tool with parameters in correct format
     result = {tool_name}({{"param": "value"}})  # Use format from documentation!
 
-    # Output raw result as JSON for Parser Agent
-    print(json.dumps(result, indent=2))
+    # Hand the raw result to the Parser Agent
+    emit(result)
 
 except Exception as e:
-    # Output error as JSON
-    print(json.dumps({{"error": str(e)}}))
+    # Report the error the same way
+    emit({{"error": str(e)}})
 ```
 
 Generate ONLY the code block, minimal explanation.
 """
 
+# Appended to the coder prompt when the client rejected the generated call's
+# parameters before sending it
+CODER_RETRY_PROMPT = """
+
+Your previous code was:
+```python
+{code}
+```
+
+The tool rejected its parameters before calling the API:
+{error}
+
+Fix the parameters listed under "invalid_parameters" and generate the corrected code block.
+"""
+
 # ============================================================================
 # AGENT 4: PARSER (Response Formatting)
 # ============================================================================
@@ -308,52 +359,111 @@ def extract_python_code(text: str) -> list:
     return code_blocks
 
 
-def execute_python_code(code: str, working_dir: str) -> dict:
-    """Execute Python code and return results."""
-    try:
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, dir=working_dir) as f:
-            f.write(code)
-            temp_file = f.name
-
-        result = subprocess.run(
-            [sys.executable, temp_file],
-            capture_output=True,
-            text=True,
-            timeout=30,
-            cwd=working_dir
-        )
-
-        os.unlink(temp_file)
-
-        return {
-            "stdout": result.stdout,
-            "stderr": result.stderr,
-            "returncode": result.returncode,
-            "success": result.returncode == 0
-        }
+def execute_python_code(code: str, working_dir: str, deadline: float = None) -> dict:
+    """
+    Execute Python code and return results.
+
+    The code runs in a process of its own on the CODE_EXECUTOR backend (a
+    pre-warmed worker pool by default, or a fresh subprocess per snippet).
+    If a deadline (epoch seconds) is given, the run is cut short when it
+    passes, and tool calls inside the code inherit it via MCP_DEADLINE.
+    """
+    timeout = EXECUTION_TIMEOUT
+    env = None
+    if deadline is not None:
+        timeout = min(timeout, deadline - time.time())
+        if timeout <= 0:
+            return {
+                "stdout": "",
+                "stderr": "Request deadline exceeded before execution",
+                "returncode": -1,
+                "success": False,
+                "results": []
+            }
+        env = {**os.environ, "MCP_DEADLINE": str(deadline)}
 
-    except subprocess.TimeoutExpired:
-        return {
-            "stdout": "",
-            "stderr": "Execution timed out after 30 seconds",
-            "returncode": -1,
-            "success": False
-        }
+    try:
+        return get_executor().run(code, working_dir, timeout, env)
     except Exception as e:
         return {
             "stdout": "",
             "stderr": str(e),
             "returncode": -1,
-            "success": False
+            "success": False,
+            "results": []
         }
 
 
+def rejected_parameters(result: dict) -> list:
+    """
+    The tool calls in a run whose parameters the tool's validator rejected.
+
+    Looks at the emitted records (or stdout, for code that printed JSON) for
+    the error dicts mcp_client returns, which carry "invalid_parameters".
+    """
+    records = result.get("results")
+    if not records:
+        try:
+            records = [json.loads(result.get("stdout", ""))]
+        except ValueError:
+            return []
+
+    rejected = []
+    pending = list(records)
+    while pending:
+        record = pending.pop(0)
+        if isinstance(record, dict):
+            problems = record.get("invalid_parameters")
+            if isinstance(problems, list) and problems:
+                rejected.append(record)
+            else:
+                pending.extend(record.values())
+        elif isinstance(record, list):
+            pending.extend(record)
+    return rejected
+
+
 # ============================================================================
 # 5-AGENT PIPELINE
 # ============================================================================
 
-def run_pipeline(user_query: str):
-    """Run the 5-agent pipeline: Explorer → Reader → Coder → Executor → Parser"""
+def discover_tools_with_agent(deadline: float = None):
+    """
+    Discover tools the original way: the Explorer writes a directory-listing
+    script, which is run and its "- NAME" lines collected.
+
+    Returns (tool names, error message); the error is None on success.
+    """
+    discovery_response = call_agent(EXPLORER_DISCOVERY_PROMPT)
+
+    # Execute discovery code
+    code_blocks = extract_python_code(discovery_response)
+    if not code_blocks:
+        print("❌ No discovery code generated")
+        return [], "No discovery code generated"
+
+    result = execute_python_code(code_blocks[0], WORKING_DIR, deadline)
+    if not result["success"]:
+        print("❌ Discovery failed:")
+        print(result["stderr"])
+        return [], result["stderr"]
+
+    print(result["stdout"])
+    # Parse the tool list from stdout
+    tools = []
+    for line in result["stdout"].split('\n'):
+        if line.strip().startswith('- '):
+            tools.append(line.strip()[2:].strip())
+    return tools, None
+
+
+def run_pipeline(user_query: str, deadline: float = None):
+    """
+    Run the 5-agent pipeline: Explorer → Reader → Coder → Executor → Parser
+
+    deadline is an optional absolute time (epoch seconds) for the whole
+    query; code execution and the tool calls it makes are bounded by it.
+    """
 
     # Initialize client if not already done (when imported as module)
     global client
@@ -373,28 +483,13 @@ def run_pipeline(user_query: str):
     print("\n[1a/4] 🔍 EXPLORER AGENT (Discovery) - Finding all available tools...")
     print("-"*70)
 
-    discovery_response = call_agent(EXPLORER_DISCOVERY_PROMPT)
-
-    # Execute discovery code
-    code_blocks = extract_python_code(discovery_response)
-    available_tools_list = []
-
-    if code_blocks:
-        result = execute_python_code(code_blocks[0], WORKING_DIR)
-        if result["success"]:
-            print(result["stdout"])
-            # Parse the tool list from stdout
-            for line in result["stdout"].split('\n'):
-                if line.strip().startswith('- '):
-                    tool_name = line.strip()[2:].strip()
-                    available_tools_list.append(tool_name)
-        else:
-            print("❌ Discovery failed:")
-            print(result["stderr"])
-            return {"success": False, "answer": result["stderr"], "tool_used": None, "generated_code": None, "raw_api_response": None}
+    if TOOL_DISCOVERY == "agent":
+        available_tools_list, error = discover_tools_with_agent(deadline)
+        if error:
+            return {"success": False, "answer": error, "tool_used": None, "generated_code": None, "raw_api_response": None}
     else:
-        print("❌ No discovery code generated")
-        return {"success": False, "answer": "No discovery code generated", "tool_used": None, "generated_code": None, "raw_api_response": None}
+        available_tools_list = list(get_registry())
+        print(f"✓ {len(available_tools_list)} tools in the registry")
 
     if not available_tools_list:
         print("❌ No tools discovered")
@@ -406,26 +501,40 @@ def run_pipeline(user_query: str):
     print(f"\n[1b/4] 🎯 EXPLORER AGENT (Selection) - Choosing best tool for query...")
     print("-"*70)
 
-    # Format the tools list for the selection prompt
-    tools_formatted = "\n".join([f"  - {tool}" for tool in available_tools_list])
-
-    selection_prompt = EXPLORER_SELECTION_PROMPT.format(
-        user_query=user_query,
-        available_tools=tools_formatted
-    )
-    selection_response = call_agent(selection_prompt)
-
-    # Extract selected tool
     selected_tool = None
-    for line in selection_response.split('\n'):
-        if line.startswith('SELECTED_TOOL:'):
-            selected_tool = line.replace('SELECTED_TOOL:', '').strip()
-            break
+    candidate_tools = available_tools_list
+    if TOOL_SELECTION != "llm":
+        selected_tool, ranked = get_selector().select(user_query, available_tools_list)
+        if selected_tool:
+            print(f"✓ Selected locally (score {ranked[0][1]:.1f}, next {ranked[1][1] if len(ranked) > 1 else 0:.1f})")
+        elif ranked:
+            # Top candidates are close; let the LLM choose, best-ranked first.
+            # The full list is kept, since the right tool can rank well below the top few.
+            ranked_names = [name for name, _ in ranked]
+            unranked = set(available_tools_list) - set(ranked_names)
+            candidate_tools = ranked_names + [name for name in available_tools_list if name in unranked]
+            print(f"Local ranking not decisive; asking the LLM (top local candidates: {', '.join(ranked_names[:3])})")
 
     if not selected_tool:
-        print("❌ Explorer failed to select a tool")
-        print("Response:", selection_response)
-        return {"success": False, "answer": "Failed to select appropriate tool", "tool_used": None, "generated_code": None, "raw_api_response": None}
+        # Format the tools list for the selection prompt
+        tools_formatted = "\n".join([f"  - {tool}" for tool in candidate_tools])
+
+        selection_prompt = EXPLORER_SELECTION_PROMPT.format(
+            user_query=user_query,
+            available_tools=tools_formatted
+        )
+        selection_response = call_agent(selection_prompt)
+
+        # Extract selected tool
+        for line in selection_response.split('\n'):
+            if line.startswith('SELECTED_TOOL:'):
+                selected_tool = line.replace('SELECTED_TOOL:', '').strip()
+                break
+
+        if not selected_tool:
+            print("❌ Explorer failed to select a tool")
+            print("Response:", selection_response)
+            return {"success": False, "answer": "Failed to select appropriate tool", "tool_used": None, "generated_code": None, "raw_api_response": None}
 
     print(f"✓ Selected: {selected_tool}")
 
@@ -449,12 +558,17 @@ def run_pipeline(user_query: str):
         print(f"❌ Error reading tool file: {e}")
         return {"success": False, "answer": f"Error reading tool file: {e}", "tool_used": selected_tool, "generated_code": None, "raw_api_response": None}
 
-    # Now call the reader agent with the actual file content
-    reader_prompt = READER_PROMPT.format(
-        tool_name=selected_tool,
-        tool_content=tool_content
-    )
-    reader_response = call_agent(reader_prompt)
+    # The generator precomputes the interface; only ask the reader agent when
+    # there is no summary for this exact version of the file
+    reader_response = get_interface(selected_tool, tool_content)
+    if reader_response:
+        print("✓ Interface loaded from interfaces.json")
+    else:
+        reader_prompt = READER_PROMPT.format(
+            tool_name=selected_tool,
+            tool_content=tool_content
+        )
+        reader_response = call_agent(reader_prompt)
 
     # Extract and display interface summary
     print("\nTool Interface:")
@@ -482,10 +596,23 @@ def run_pipeline(user_query: str):
         tool_name=selected_tool,
         tool_interface=reader_response
     )
-    coder_response = call_agent(coder_prompt)
+
+    code_blocks = []
+    if CODE_GENERATION != "llm":
+        registry = get_registry()
+        input_schema = registry.get(selected_tool, {}).get("inputSchema", {})
+        code, reason = template_code(user_query, selected_tool, input_schema, registry)
+        if code:
+            print("✓ Filled the single-call template")
+            code_blocks = [code]
+        else:
+            print(f"Template not applicable ({reason}); asking the coder agent")
+
+    if not code_blocks:
+        coder_response = call_agent(coder_prompt)
+        code_blocks = extract_python_code(coder_response)
 
     print("\nGenerated Code:")
-    code_blocks = extract_python_code(coder_response)
     if code_blocks:
         print(code_blocks[0])
 
@@ -496,12 +623,37 @@ def run_pipeline(user_query: str):
         print("\n[4/5] ⚡ EXECUTING CODE...")
         print("="*70 + "\n")
 
-        result = execute_python_code(code_blocks[0], WORKING_DIR)
-
+        result = execute_python_code(code_blocks[0], WORKING_DIR, deadline)
+        output = dump_results(result["results"]) if result.get("results") else result["stdout"]
+
+        # Invalid parameters are caught locally; give the coder one chance to fix them
+        rejected = rejected_parameters(result) if result["success"] else []
+        if rejected:
+            print("⚠️  Parameters rejected by the tool's validator, asking the coder to fix them...")
+            error = json.dumps(rejected, indent=2, default=str)
+            print(error)
+            retry_response = call_agent(coder_prompt + CODER_RETRY_PROMPT.format(
+                code=code_blocks[0],
+                error=error[:4000]
+            ))
+            retry_blocks = extract_python_code(retry_response)
+            if retry_blocks:
+                code_blocks = retry_blocks
+                print("\nCorrected Code:")
+                print(code_blocks[0])
+                print()
+                result = execute_python_code(code_blocks[0], WORKING_DIR, deadline)
+                output = dump_results(result["results"]) if result.get("results") else result["stdout"]
+
+        results = result.get("results") or []
         if result["success"]:
+            # With emit(), stdout only holds the code's own logging
+            if results and result["stdout"].strip():
+                print("Output:")
+                print(result["stdout"])
             print("Raw API Response:")
-            print(result["stdout"])
-            api_response = result["stdout"]
+            print(output)
+            api_response = output
         else:
             print("❌ Execution failed:")
             print(result["stderr"])
@@ -513,10 +665,21 @@ def run_pipeline(user_query: str):
         print(f"\n[5/5] 📝 PARSER AGENT - Formatting response...")
         print("-"*70 + "\n")
 
+        # Keep only what the query needs, so the parser prompt stays within budget
+        parser_input = api_response
+        if result["success"]:
+            if results:
+                parser_input, note = reduce_results(results, user_query)
+            else:
+                parser_input, note = reduce_response(api_response, user_query)
+            if note:
+                print(f"Response reduced for the parser: {note}")
+                parser_input = f"(Reduced to fit the prompt: {note})\n{parser_input}"
+
         parser_prompt = PARSER_PROMPT.format(
             user_query=user_query,
             tool_name=selected_tool,
-            api_response=api_response
+            api_response=parser_input
         )
         parser_response = call_agent(parser_prompt)
 
@@ -532,7 +695,8 @@ def run_pipeline(user_query: str):
             "answer": parser_response,
             "tool_used": selected_tool,
             "generated_code": code_blocks[0] if code_blocks else None,
-            "raw_api_response": api_response
+            "raw_api_response": api_response,
+            "results": results
         }
     else:
         print("\n❌ No code generated")
@@ -572,6 +736,10 @@ def main():
     print("  - Get the last 5 days of NVDA stock data")
     print("="*70)
 
+    open_client()
+    get_selector()  # builds the registry and its search index
+    get_executor()  # starts the worker pool
+
     while True:
         try:
             user_input = input("\n\n💬 You: ").strip()
@@ -594,6 +762,9 @@ def main():
             import traceback
             traceback.print_exc()
 
+    close_executor()
+    close_client()
+
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,7 @@ Exposes the 5-agent pipeline as a REST API
 
 import os
 import sys
+import time
 from typing import Optional
 from contextlib import asynccontextmanager
 from io import StringIO
@@ -22,6 +23,10 @@ from pydantic import BaseModel, Field
 
 # Import the agent pipeline
 from agent_multi_stage import run_pipeline
+from servers.mcp_client import open_client_async, close_client_async
+from servers.tool_registry import get_registry
+from servers.tool_selector import get_selector
+from servers.code_executor import get_executor, close_executor
 
 # Verify API keys are set
 ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY")
@@ -32,6 +37,10 @@ if not ANTHROPIC_API_KEY:
 if not ALPHA_VANTAGE_API_KEY:
     print("Warning: ALPHA_VANTAGE_API_KEY not set")
 
+# Time budget for one /query request, in seconds. Tool calls made while
+# answering it (including retries) stop when the budget runs out.
+QUERY_TIMEOUT = float(os.getenv("QUERY_TIMEOUT", "120"))
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -43,9 +52,15 @@ async def lifespan(app: FastAPI):
     print(f"ANTHROPIC_API_KEY: {'✓ Set' if ANTHROPIC_API_KEY else '✗ Not Set'}")
     print(f"ALPHA_VANTAGE_API_KEY: {'✓ Set' if ALPHA_VANTAGE_API_KEY else '✗ Not Set'}")
     print("="*70)
+    await open_client_async()
+    print(f"Tool registry: {len(get_registry())} tools")
+    get_selector()
+    get_executor()
     yield
     # Shutdown
     print("\nShutting down API server...")
+    close_executor()
+    await close_client_async()
 
 
 # Initialize FastAPI app
@@ -158,7 +173,7 @@ async def process_query(request: QueryRequest):
 
         try:
             # Run the 5-agent pipeline and get structured response
-            result = run_pipeline(request.query)
+            result = run_pipeline(request.query, deadline=time.time() + QUERY_TIMEOUT)
 
             # Get the full output for debug purposes
             full_output = captured_output.getvalue()
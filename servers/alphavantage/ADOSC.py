@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def ADOSC(params: dict = None) -> dict:
@@ -24,6 +24,17 @@ def ADOSC(params: dict = None) -> dict:
     return call_mcp_tool("ADOSC", params)
 
 
+async def ADOSC_async(params: dict = None) -> dict:
+    """
+    Awaitable version of ADOSC. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("ADOSC", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
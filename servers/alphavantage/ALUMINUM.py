@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def ALUMINUM(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def ALUMINUM(params: dict = None) -> dict:
     return call_mcp_tool("ALUMINUM", params)
 
 
+async def ALUMINUM_async(params: dict = None) -> dict:
+    """
+    Awaitable version of ALUMINUM. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("ALUMINUM", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def ANALYTICS_FIXED_WINDOW(params: dict = None) -> dict:
@@ -22,6 +22,17 @@ def ANALYTICS_FIXED_WINDOW(params: dict = None) -> dict:
     return call_mcp_tool("ANALYTICS_FIXED_WINDOW", params)
 
 
+async def ANALYTICS_FIXED_WINDOW_async(params: dict = None) -> dict:
+    """
+    Awaitable version of ANALYTICS_FIXED_WINDOW. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("ANALYTICS_FIXED_WINDOW", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def ANALYTICS_SLIDING_WINDOW(params: dict = None) -> dict:
@@ -23,6 +23,17 @@ def ANALYTICS_SLIDING_WINDOW(params: dict = None) -> dict:
     return call_mcp_tool("ANALYTICS_SLIDING_WINDOW", params)
 
 
+async def ANALYTICS_SLIDING_WINDOW_async(params: dict = None) -> dict:
+    """
+    Awaitable version of ANALYTICS_SLIDING_WINDOW. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("ANALYTICS_SLIDING_WINDOW", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def BBANDS(params: dict = None) -> dict:
@@ -27,6 +27,17 @@ def BBANDS(params: dict = None) -> dict:
     return call_mcp_tool("BBANDS", params)
 
 
+async def BBANDS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of BBANDS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("BBANDS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def BRENT(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def BRENT(params: dict = None) -> dict:
     return call_mcp_tool("BRENT", params)
 
 
+async def BRENT_async(params: dict = None) -> dict:
+    """
+    Awaitable version of BRENT. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("BRENT", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def CASH_FLOW(params: dict = None) -> dict:
@@ -18,6 +18,17 @@ def CASH_FLOW(params: dict = None) -> dict:
     return call_mcp_tool("CASH_FLOW", params)
 
 
+async def CASH_FLOW_async(params: dict = None) -> dict:
+    """
+    Awaitable version of CASH_FLOW. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("CASH_FLOW", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def COFFEE(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def COFFEE(params: dict = None) -> dict:
     return call_mcp_tool("COFFEE", params)
 
 
+async def COFFEE_async(params: dict = None) -> dict:
+    """
+    Awaitable version of COFFEE. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("COFFEE", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def CPI(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ CPI is widely regarded as the barometer of inflation levels in the broader econo
     return call_mcp_tool("CPI", params)
 
 
+async def CPI_async(params: dict = None) -> dict:
+    """
+    Awaitable version of CPI. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("CPI", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
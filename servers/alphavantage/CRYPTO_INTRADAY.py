@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def CRYPTO_INTRADAY(params: dict = None) -> dict:
@@ -22,6 +22,17 @@ def CRYPTO_INTRADAY(params: dict = None) -> dict:
     return call_mcp_tool("CRYPTO_INTRADAY", params)
 
 
+async def CRYPTO_INTRADAY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of CRYPTO_INTRADAY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("CRYPTO_INTRADAY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
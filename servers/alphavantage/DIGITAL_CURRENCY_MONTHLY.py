@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def DIGITAL_CURRENCY_MONTHLY(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def DIGITAL_CURRENCY_MONTHLY(params: dict = None) -> dict:
     return call_mcp_tool("DIGITAL_CURRENCY_MONTHLY", params)
 
 
+async def DIGITAL_CURRENCY_MONTHLY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of DIGITAL_CURRENCY_MONTHLY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("DIGITAL_CURRENCY_MONTHLY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def ETF_PROFILE(params: dict = None) -> dict:
@@ -18,6 +18,17 @@ def ETF_PROFILE(params: dict = None) -> dict:
     return call_mcp_tool("ETF_PROFILE", params)
 
 
+async def ETF_PROFILE_async(params: dict = None) -> dict:
+    """
+    Awaitable version of ETF_PROFILE. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("ETF_PROFILE", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
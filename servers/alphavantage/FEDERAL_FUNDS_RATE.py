@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def FEDERAL_FUNDS_RATE(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def FEDERAL_FUNDS_RATE(params: dict = None) -> dict:
     return call_mcp_tool("FEDERAL_FUNDS_RATE", params)
 
 
+async def FEDERAL_FUNDS_RATE_async(params: dict = None) -> dict:
+    """
+    Awaitable version of FEDERAL_FUNDS_RATE. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("FEDERAL_FUNDS_RATE", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
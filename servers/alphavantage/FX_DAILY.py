@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def FX_DAILY(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ def FX_DAILY(params: dict = None) -> dict:
     return call_mcp_tool("FX_DAILY", params)
 
 
+async def FX_DAILY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of FX_DAILY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("FX_DAILY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def FX_MONTHLY(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ The latest data point is the prices information for the month (or partial month)
     return call_mcp_tool("FX_MONTHLY", params)
 
 
+async def FX_MONTHLY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of FX_MONTHLY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("FX_MONTHLY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def FX_WEEKLY(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ The latest data point is the price information for the week (or partial week) co
     return call_mcp_tool("FX_WEEKLY", params)
 
 
+async def FX_WEEKLY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of FX_WEEKLY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("FX_WEEKLY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def GLOBAL_QUOTE(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def GLOBAL_QUOTE(params: dict = None) -> dict:
     return call_mcp_tool("GLOBAL_QUOTE", params)
 
 
+async def GLOBAL_QUOTE_async(params: dict = None) -> dict:
+    """
+    Awaitable version of GLOBAL_QUOTE. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("GLOBAL_QUOTE", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def HISTORICAL_OPTIONS(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ def HISTORICAL_OPTIONS(params: dict = None) -> dict:
     return call_mcp_tool("HISTORICAL_OPTIONS", params)
 
 
+async def HISTORICAL_OPTIONS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of HISTORICAL_OPTIONS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("HISTORICAL_OPTIONS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def HT_SINE(params: dict = None) -> dict:
@@ -23,6 +23,17 @@ def HT_SINE(params: dict = None) -> dict:
     return call_mcp_tool("HT_SINE", params)
 
 
+async def HT_SINE_async(params: dict = None) -> dict:
+    """
+    Awaitable version of HT_SINE. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("HT_SINE", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def INCOME_STATEMENT(params: dict = None) -> dict:
@@ -18,6 +18,17 @@ def INCOME_STATEMENT(params: dict = None) -> dict:
     return call_mcp_tool("INCOME_STATEMENT", params)
 
 
+async def INCOME_STATEMENT_async(params: dict = None) -> dict:
+    """
+    Awaitable version of INCOME_STATEMENT. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("INCOME_STATEMENT", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
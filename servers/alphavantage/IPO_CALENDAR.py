@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def IPO_CALENDAR(params: dict = None) -> dict:
@@ -18,6 +18,17 @@ def IPO_CALENDAR(params: dict = None) -> dict:
     return call_mcp_tool("IPO_CALENDAR", params)
 
 
+async def IPO_CALENDAR_async(params: dict = None) -> dict:
+    """
+    Awaitable version of IPO_CALENDAR. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("IPO_CALENDAR", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def KAMA(params: dict = None) -> dict:
@@ -24,6 +24,17 @@ def KAMA(params: dict = None) -> dict:
     return call_mcp_tool("KAMA", params)
 
 
+async def KAMA_async(params: dict = None) -> dict:
+    """
+    Awaitable version of KAMA. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("KAMA", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
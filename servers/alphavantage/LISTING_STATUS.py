@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def LISTING_STATUS(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def LISTING_STATUS(params: dict = None) -> dict:
     return call_mcp_tool("LISTING_STATUS", params)
 
 
+async def LISTING_STATUS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of LISTING_STATUS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("LISTING_STATUS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def MACD(params: dict = None) -> dict:
@@ -26,6 +26,17 @@ def MACD(params: dict = None) -> dict:
     return call_mcp_tool("MACD", params)
 
 
+async def MACD_async(params: dict = None) -> dict:
+    """
+    Awaitable version of MACD. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("MACD", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def MACDEXT(params: dict = None) -> dict:
@@ -29,6 +29,17 @@ def MACDEXT(params: dict = None) -> dict:
     return call_mcp_tool("MACDEXT", params)
 
 
+async def MACDEXT_async(params: dict = None) -> dict:
+    """
+    Awaitable version of MACDEXT. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("MACDEXT", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
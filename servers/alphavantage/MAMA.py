@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def MAMA(params: dict = None) -> dict:
@@ -25,6 +25,17 @@ def MAMA(params: dict = None) -> dict:
     return call_mcp_tool("MAMA", params)
 
 
+async def MAMA_async(params: dict = None) -> dict:
+    """
+    Awaitable version of MAMA. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("MAMA", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
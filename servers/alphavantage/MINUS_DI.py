@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def MINUS_DI(params: dict = None) -> dict:
@@ -23,6 +23,17 @@ def MINUS_DI(params: dict = None) -> dict:
     return call_mcp_tool("MINUS_DI", params)
 
 
+async def MINUS_DI_async(params: dict = None) -> dict:
+    """
+    Awaitable version of MINUS_DI. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("MINUS_DI", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def MINUS_DM(params: dict = None) -> dict:
@@ -23,6 +23,17 @@ def MINUS_DM(params: dict = None) -> dict:
     return call_mcp_tool("MINUS_DM", params)
 
 
+async def MINUS_DM_async(params: dict = None) -> dict:
+    """
+    Awaitable version of MINUS_DM. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("MINUS_DM", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def NATURAL_GAS(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def NATURAL_GAS(params: dict = None) -> dict:
     return call_mcp_tool("NATURAL_GAS", params)
 
 
+async def NATURAL_GAS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of NATURAL_GAS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("NATURAL_GAS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
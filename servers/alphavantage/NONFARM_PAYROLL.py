@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def NONFARM_PAYROLL(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ unpaid volunteers, farm employees, and the unincorporated self-employed.
     return call_mcp_tool("NONFARM_PAYROLL", params)
 
 
+async def NONFARM_PAYROLL_async(params: dict = None) -> dict:
+    """
+    Awaitable version of NONFARM_PAYROLL. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("NONFARM_PAYROLL", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
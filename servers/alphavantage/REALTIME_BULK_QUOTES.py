@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def REALTIME_BULK_QUOTES(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def REALTIME_BULK_QUOTES(params: dict = None) -> dict:
     return call_mcp_tool("REALTIME_BULK_QUOTES", params)
 
 
+async def REALTIME_BULK_QUOTES_async(params: dict = None) -> dict:
+    """
+    Awaitable version of REALTIME_BULK_QUOTES. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("REALTIME_BULK_QUOTES", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def REALTIME_OPTIONS(params: dict = None) -> dict:
@@ -22,6 +22,17 @@ def REALTIME_OPTIONS(params: dict = None) -> dict:
     return call_mcp_tool("REALTIME_OPTIONS", params)
 
 
+async def REALTIME_OPTIONS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of REALTIME_OPTIONS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("REALTIME_OPTIONS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def STOCH(params: dict = None) -> dict:
@@ -27,6 +27,17 @@ def STOCH(params: dict = None) -> dict:
     return call_mcp_tool("STOCH", params)
 
 
+async def STOCH_async(params: dict = None) -> dict:
+    """
+    Awaitable version of STOCH. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("STOCH", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def STOCHRSI(params: dict = None) -> dict:
@@ -27,6 +27,17 @@ def STOCHRSI(params: dict = None) -> dict:
     return call_mcp_tool("STOCHRSI", params)
 
 
+async def STOCHRSI_async(params: dict = None) -> dict:
+    """
+    Awaitable version of STOCHRSI. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("STOCHRSI", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def SYMBOL_SEARCH(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def SYMBOL_SEARCH(params: dict = None) -> dict:
     return call_mcp_tool("SYMBOL_SEARCH", params)
 
 
+async def SYMBOL_SEARCH_async(params: dict = None) -> dict:
+    """
+    Awaitable version of SYMBOL_SEARCH. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("SYMBOL_SEARCH", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
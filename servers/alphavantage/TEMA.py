@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TEMA(params: dict = None) -> dict:
@@ -24,6 +24,17 @@ def TEMA(params: dict = None) -> dict:
     return call_mcp_tool("TEMA", params)
 
 
+async def TEMA_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TEMA. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TEMA", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
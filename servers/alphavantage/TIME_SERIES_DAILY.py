@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TIME_SERIES_DAILY(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ def TIME_SERIES_DAILY(params: dict = None) -> dict:
     return call_mcp_tool("TIME_SERIES_DAILY", params)
 
 
+async def TIME_SERIES_DAILY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TIME_SERIES_DAILY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TIME_SERIES_DAILY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
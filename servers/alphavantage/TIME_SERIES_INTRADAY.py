@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TIME_SERIES_INTRADAY(params: dict = None) -> dict:
@@ -25,6 +25,17 @@ def TIME_SERIES_INTRADAY(params: dict = None) -> dict:
     return call_mcp_tool("TIME_SERIES_INTRADAY", params)
 
 
+async def TIME_SERIES_INTRADAY_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TIME_SERIES_INTRADAY. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TIME_SERIES_INTRADAY", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TIME_SERIES_MONTHLY_ADJUSTED(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def TIME_SERIES_MONTHLY_ADJUSTED(params: dict = None) -> dict:
     return call_mcp_tool("TIME_SERIES_MONTHLY_ADJUSTED", params)
 
 
+async def TIME_SERIES_MONTHLY_ADJUSTED_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TIME_SERIES_MONTHLY_ADJUSTED. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TIME_SERIES_MONTHLY_ADJUSTED", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
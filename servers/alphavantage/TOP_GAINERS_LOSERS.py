@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TOP_GAINERS_LOSERS(params: dict = None) -> dict:
@@ -18,6 +18,17 @@ def TOP_GAINERS_LOSERS(params: dict = None) -> dict:
     return call_mcp_tool("TOP_GAINERS_LOSERS", params)
 
 
+async def TOP_GAINERS_LOSERS_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TOP_GAINERS_LOSERS. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TOP_GAINERS_LOSERS", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def TREASURY_YIELD(params: dict = None) -> dict:
@@ -20,6 +20,17 @@ def TREASURY_YIELD(params: dict = None) -> dict:
     return call_mcp_tool("TREASURY_YIELD", params)
 
 
+async def TREASURY_YIELD_async(params: dict = None) -> dict:
+    """
+    Awaitable version of TREASURY_YIELD. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("TREASURY_YIELD", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def UNEMPLOYMENT(params: dict = None) -> dict:
@@ -21,6 +21,17 @@ who currently reside in 1 of the 50 states or the District of Columbia, who do n
     return call_mcp_tool("UNEMPLOYMENT", params)
 
 
+async def UNEMPLOYMENT_async(params: dict = None) -> dict:
+    """
+    Awaitable version of UNEMPLOYMENT. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("UNEMPLOYMENT", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def WILLR(params: dict = None) -> dict:
@@ -23,6 +23,17 @@ def WILLR(params: dict = None) -> dict:
     return call_mcp_tool("WILLR", params)
 
 
+async def WILLR_async(params: dict = None) -> dict:
+    """
+    Awaitable version of WILLR. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("WILLR", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
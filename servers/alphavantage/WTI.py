@@ -1,5 +1,5 @@
 
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def WTI(params: dict = None) -> dict:
@@ -19,6 +19,17 @@ def WTI(params: dict = None) -> dict:
     return call_mcp_tool("WTI", params)
 
 
+async def WTI_async(params: dict = None) -> dict:
+    """
+    Awaitable version of WTI. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {}
+    return await call_tool_async("WTI", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -5,244 +5,534 @@ All available financial data tools from Alpha Vantage.
 Usage:
     from alphavantage import TIME_SERIES_DAILY
     result = TIME_SERIES_DAILY({"symbol": "NVDA"})
+
+Every tool also has an awaitable TOOL_async variant; the same functions are
+available under their plain names in the alphavantage.aio namespace.
+
+Tool modules are imported on first access, so using one tool does not load
+the other modules.
 """
 
-from .TIME_SERIES_INTRADAY import TIME_SERIES_INTRADAY
-from .TIME_SERIES_DAILY import TIME_SERIES_DAILY
-from .TIME_SERIES_DAILY_ADJUSTED import TIME_SERIES_DAILY_ADJUSTED
-from .TIME_SERIES_WEEKLY import TIME_SERIES_WEEKLY
-from .TIME_SERIES_WEEKLY_ADJUSTED import TIME_SERIES_WEEKLY_ADJUSTED
-from .TIME_SERIES_MONTHLY import TIME_SERIES_MONTHLY
-from .TIME_SERIES_MONTHLY_ADJUSTED import TIME_SERIES_MONTHLY_ADJUSTED
-from .GLOBAL_QUOTE import GLOBAL_QUOTE
-from .REALTIME_BULK_QUOTES import REALTIME_BULK_QUOTES
-from .SYMBOL_SEARCH import SYMBOL_SEARCH
-from .MARKET_STATUS import MARKET_STATUS
-from .REALTIME_OPTIONS import REALTIME_OPTIONS
-from .HISTORICAL_OPTIONS import HISTORICAL_OPTIONS
-from .NEWS_SENTIMENT import NEWS_SENTIMENT
-from .EARNINGS_CALL_TRANSCRIPT import EARNINGS_CALL_TRANSCRIPT
-from .TOP_GAINERS_LOSERS import TOP_GAINERS_LOSERS
-from .INSIDER_TRANSACTIONS import INSIDER_TRANSACTIONS
-from .ANALYTICS_FIXED_WINDOW import ANALYTICS_FIXED_WINDOW
-from .ANALYTICS_SLIDING_WINDOW import ANALYTICS_SLIDING_WINDOW
-from .WTI import WTI
-from .BRENT import BRENT
-from .NATURAL_GAS import NATURAL_GAS
-from .COPPER import COPPER
-from .ALUMINUM import ALUMINUM
-from .WHEAT import WHEAT
-from .CORN import CORN
-from .COTTON import COTTON
-from .SUGAR import SUGAR
-from .COFFEE import COFFEE
-from .ALL_COMMODITIES import ALL_COMMODITIES
-from .CURRENCY_EXCHANGE_RATE import CURRENCY_EXCHANGE_RATE
-from .CRYPTO_INTRADAY import CRYPTO_INTRADAY
-from .DIGITAL_CURRENCY_DAILY import DIGITAL_CURRENCY_DAILY
-from .DIGITAL_CURRENCY_WEEKLY import DIGITAL_CURRENCY_WEEKLY
-from .DIGITAL_CURRENCY_MONTHLY import DIGITAL_CURRENCY_MONTHLY
-from .REAL_GDP import REAL_GDP
-from .REAL_GDP_PER_CAPITA import REAL_GDP_PER_CAPITA
-from .TREASURY_YIELD import TREASURY_YIELD
-from .FEDERAL_FUNDS_RATE import FEDERAL_FUNDS_RATE
-from .CPI import CPI
-from .INFLATION import INFLATION
-from .RETAIL_SALES import RETAIL_SALES
-from .DURABLES import DURABLES
-from .UNEMPLOYMENT import UNEMPLOYMENT
-from .NONFARM_PAYROLL import NONFARM_PAYROLL
-from .FX_INTRADAY import FX_INTRADAY
-from .FX_DAILY import FX_DAILY
-from .FX_WEEKLY import FX_WEEKLY
-from .FX_MONTHLY import FX_MONTHLY
-from .COMPANY_OVERVIEW import COMPANY_OVERVIEW
-from .ETF_PROFILE import ETF_PROFILE
-from .DIVIDENDS import DIVIDENDS
-from .SPLITS import SPLITS
-from .INCOME_STATEMENT import INCOME_STATEMENT
-from .BALANCE_SHEET import BALANCE_SHEET
-from .CASH_FLOW import CASH_FLOW
-from .EARNINGS import EARNINGS
-from .EARNINGS_ESTIMATES import EARNINGS_ESTIMATES
-from .LISTING_STATUS import LISTING_STATUS
-from .EARNINGS_CALENDAR import EARNINGS_CALENDAR
-from .IPO_CALENDAR import IPO_CALENDAR
-from .SMA import SMA
-from .EMA import EMA
-from .WMA import WMA
-from .DEMA import DEMA
-from .TEMA import TEMA
-from .TRIMA import TRIMA
-from .KAMA import KAMA
-from .MAMA import MAMA
-from .VWAP import VWAP
-from .T3 import T3
-from .MACD import MACD
-from .MACDEXT import MACDEXT
-from .STOCH import STOCH
-from .STOCHF import STOCHF
-from .RSI import RSI
-from .STOCHRSI import STOCHRSI
-from .WILLR import WILLR
-from .ADX import ADX
-from .ADXR import ADXR
-from .APO import APO
-from .PPO import PPO
-from .MOM import MOM
-from .BOP import BOP
-from .CCI import CCI
-from .CMO import CMO
-from .ROC import ROC
-from .ROCR import ROCR
-from .AROON import AROON
-from .AROONOSC import AROONOSC
-from .MFI import MFI
-from .TRIX import TRIX
-from .ULTOSC import ULTOSC
-from .DX import DX
-from .MINUS_DI import MINUS_DI
-from .PLUS_DI import PLUS_DI
-from .MINUS_DM import MINUS_DM
-from .PLUS_DM import PLUS_DM
-from .BBANDS import BBANDS
-from .MIDPOINT import MIDPOINT
-from .MIDPRICE import MIDPRICE
-from .SAR import SAR
-from .TRANGE import TRANGE
-from .ATR import ATR
-from .NATR import NATR
-from .AD import AD
-from .ADOSC import ADOSC
-from .OBV import OBV
-from .HT_TRENDLINE import HT_TRENDLINE
-from .HT_SINE import HT_SINE
-from .HT_TRENDMODE import HT_TRENDMODE
-from .HT_DCPERIOD import HT_DCPERIOD
-from .HT_DCPHASE import HT_DCPHASE
-from .HT_PHASOR import HT_PHASOR
-from .PING import PING
-from .ADD_TWO_NUMBERS import ADD_TWO_NUMBERS
-from .SEARCH import SEARCH
-from .FETCH import FETCH
+import os
+import sys
+import types
+import importlib
+
+# With MCP_COMPACT_TOOLS=1, tools are served from the single-module table in
+# alphavantage.compact instead of importing one module per tool
+_COMPACT = os.getenv("MCP_COMPACT_TOOLS", "").lower() in ("1", "true", "yes")
+
+# Exported name -> module defining it
+_MODULES = {
+    "TIME_SERIES_INTRADAY": "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_INTRADAY_async": "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY": "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_async": "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED": "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_DAILY_ADJUSTED_async": "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_WEEKLY": "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_async": "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_ADJUSTED": "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_WEEKLY_ADJUSTED_async": "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY": "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_async": "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_ADJUSTED": "TIME_SERIES_MONTHLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY_ADJUSTED_async": "TIME_SERIES_MONTHLY_ADJUSTED",
+    "GLOBAL_QUOTE": "GLOBAL_QUOTE",
+    "GLOBAL_QUOTE_async": "GLOBAL_QUOTE",
+    "REALTIME_BULK_QUOTES": "REALTIME_BULK_QUOTES",
+    "REALTIME_BULK_QUOTES_async": "REALTIME_BULK_QUOTES",
+    "SYMBOL_SEARCH": "SYMBOL_SEARCH",
+    "SYMBOL_SEARCH_async": "SYMBOL_SEARCH",
+    "MARKET_STATUS": "MARKET_STATUS",
+    "MARKET_STATUS_async": "MARKET_STATUS",
+    "REALTIME_OPTIONS": "REALTIME_OPTIONS",
+    "REALTIME_OPTIONS_async": "REALTIME_OPTIONS",
+    "HISTORICAL_OPTIONS": "HISTORICAL_OPTIONS",
+    "HISTORICAL_OPTIONS_async": "HISTORICAL_OPTIONS",
+    "NEWS_SENTIMENT": "NEWS_SENTIMENT",
+    "NEWS_SENTIMENT_async": "NEWS_SENTIMENT",
+    "EARNINGS_CALL_TRANSCRIPT": "EARNINGS_CALL_TRANSCRIPT",
+    "EARNINGS_CALL_TRANSCRIPT_async": "EARNINGS_CALL_TRANSCRIPT",
+    "TOP_GAINERS_LOSERS": "TOP_GAINERS_LOSERS",
+    "TOP_GAINERS_LOSERS_async": "TOP_GAINERS_LOSERS",
+    "INSIDER_TRANSACTIONS": "INSIDER_TRANSACTIONS",
+    "INSIDER_TRANSACTIONS_async": "INSIDER_TRANSACTIONS",
+    "ANALYTICS_FIXED_WINDOW": "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_FIXED_WINDOW_async": "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW": "ANALYTICS_SLIDING_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW_async": "ANALYTICS_SLIDING_WINDOW",
+    "WTI": "WTI",
+    "WTI_async": "WTI",
+    "BRENT": "BRENT",
+    "BRENT_async": "BRENT",
+    "NATURAL_GAS": "NATURAL_GAS",
+    "NATURAL_GAS_async": "NATURAL_GAS",
+    "COPPER": "COPPER",
+    "COPPER_async": "COPPER",
+    "ALUMINUM": "ALUMINUM",
+    "ALUMINUM_async": "ALUMINUM",
+    "WHEAT": "WHEAT",
+    "WHEAT_async": "WHEAT",
+    "CORN": "CORN",
+    "CORN_async": "CORN",
+    "COTTON": "COTTON",
+    "COTTON_async": "COTTON",
+    "SUGAR": "SUGAR",
+    "SUGAR_async": "SUGAR",
+    "COFFEE": "COFFEE",
+    "COFFEE_async": "COFFEE",
+    "ALL_COMMODITIES": "ALL_COMMODITIES",
+    "ALL_COMMODITIES_async": "ALL_COMMODITIES",
+    "CURRENCY_EXCHANGE_RATE": "CURRENCY_EXCHANGE_RATE",
+    "CURRENCY_EXCHANGE_RATE_async": "CURRENCY_EXCHANGE_RATE",
+    "CRYPTO_INTRADAY": "CRYPTO_INTRADAY",
+    "CRYPTO_INTRADAY_async": "CRYPTO_INTRADAY",
+    "DIGITAL_CURRENCY_DAILY": "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_DAILY_async": "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_WEEKLY": "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_WEEKLY_async": "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_MONTHLY": "DIGITAL_CURRENCY_MONTHLY",
+    "DIGITAL_CURRENCY_MONTHLY_async": "DIGITAL_CURRENCY_MONTHLY",
+    "REAL_GDP": "REAL_GDP",
+    "REAL_GDP_async": "REAL_GDP",
+    "REAL_GDP_PER_CAPITA": "REAL_GDP_PER_CAPITA",
+    "REAL_GDP_PER_CAPITA_async": "REAL_GDP_PER_CAPITA",
+    "TREASURY_YIELD": "TREASURY_YIELD",
+    "TREASURY_YIELD_async": "TREASURY_YIELD",
+    "FEDERAL_FUNDS_RATE": "FEDERAL_FUNDS_RATE",
+    "FEDERAL_FUNDS_RATE_async": "FEDERAL_FUNDS_RATE",
+    "CPI": "CPI",
+    "CPI_async": "CPI",
+    "INFLATION": "INFLATION",
+    "INFLATION_async": "INFLATION",
+    "RETAIL_SALES": "RETAIL_SALES",
+    "RETAIL_SALES_async": "RETAIL_SALES",
+    "DURABLES": "DURABLES",
+    "DURABLES_async": "DURABLES",
+    "UNEMPLOYMENT": "UNEMPLOYMENT",
+    "UNEMPLOYMENT_async": "UNEMPLOYMENT",
+    "NONFARM_PAYROLL": "NONFARM_PAYROLL",
+    "NONFARM_PAYROLL_async": "NONFARM_PAYROLL",
+    "FX_INTRADAY": "FX_INTRADAY",
+    "FX_INTRADAY_async": "FX_INTRADAY",
+    "FX_DAILY": "FX_DAILY",
+    "FX_DAILY_async": "FX_DAILY",
+    "FX_WEEKLY": "FX_WEEKLY",
+    "FX_WEEKLY_async": "FX_WEEKLY",
+    "FX_MONTHLY": "FX_MONTHLY",
+    "FX_MONTHLY_async": "FX_MONTHLY",
+    "COMPANY_OVERVIEW": "COMPANY_OVERVIEW",
+    "COMPANY_OVERVIEW_async": "COMPANY_OVERVIEW",
+    "ETF_PROFILE": "ETF_PROFILE",
+    "ETF_PROFILE_async": "ETF_PROFILE",
+    "DIVIDENDS": "DIVIDENDS",
+    "DIVIDENDS_async": "DIVIDENDS",
+    "SPLITS": "SPLITS",
+    "SPLITS_async": "SPLITS",
+    "INCOME_STATEMENT": "INCOME_STATEMENT",
+    "INCOME_STATEMENT_async": "INCOME_STATEMENT",
+    "BALANCE_SHEET": "BALANCE_SHEET",
+    "BALANCE_SHEET_async": "BALANCE_SHEET",
+    "CASH_FLOW": "CASH_FLOW",
+    "CASH_FLOW_async": "CASH_FLOW",
+    "EARNINGS": "EARNINGS",
+    "EARNINGS_async": "EARNINGS",
+    "EARNINGS_ESTIMATES": "EARNINGS_ESTIMATES",
+    "EARNINGS_ESTIMATES_async": "EARNINGS_ESTIMATES",
+    "LISTING_STATUS": "LISTING_STATUS",
+    "LISTING_STATUS_async": "LISTING_STATUS",
+    "EARNINGS_CALENDAR": "EARNINGS_CALENDAR",
+    "EARNINGS_CALENDAR_async": "EARNINGS_CALENDAR",
+    "IPO_CALENDAR": "IPO_CALENDAR",
+    "IPO_CALENDAR_async": "IPO_CALENDAR",
+    "SMA": "SMA",
+    "SMA_async": "SMA",
+    "EMA": "EMA",
+    "EMA_async": "EMA",
+    "WMA": "WMA",
+    "WMA_async": "WMA",
+    "DEMA": "DEMA",
+    "DEMA_async": "DEMA",
+    "TEMA": "TEMA",
+    "TEMA_async": "TEMA",
+    "TRIMA": "TRIMA",
+    "TRIMA_async": "TRIMA",
+    "KAMA": "KAMA",
+    "KAMA_async": "KAMA",
+    "MAMA": "MAMA",
+    "MAMA_async": "MAMA",
+    "VWAP": "VWAP",
+    "VWAP_async": "VWAP",
+    "T3": "T3",
+    "T3_async": "T3",
+    "MACD": "MACD",
+    "MACD_async": "MACD",
+    "MACDEXT": "MACDEXT",
+    "MACDEXT_async": "MACDEXT",
+    "STOCH": "STOCH",
+    "STOCH_async": "STOCH",
+    "STOCHF": "STOCHF",
+    "STOCHF_async": "STOCHF",
+    "RSI": "RSI",
+    "RSI_async": "RSI",
+    "STOCHRSI": "STOCHRSI",
+    "STOCHRSI_async": "STOCHRSI",
+    "WILLR": "WILLR",
+    "WILLR_async": "WILLR",
+    "ADX": "ADX",
+    "ADX_async": "ADX",
+    "ADXR": "ADXR",
+    "ADXR_async": "ADXR",
+    "APO": "APO",
+    "APO_async": "APO",
+    "PPO": "PPO",
+    "PPO_async": "PPO",
+    "MOM": "MOM",
+    "MOM_async": "MOM",
+    "BOP": "BOP",
+    "BOP_async": "BOP",
+    "CCI": "CCI",
+    "CCI_async": "CCI",
+    "CMO": "CMO",
+    "CMO_async": "CMO",
+    "ROC": "ROC",
+    "ROC_async": "ROC",
+    "ROCR": "ROCR",
+    "ROCR_async": "ROCR",
+    "AROON": "AROON",
+    "AROON_async": "AROON",
+    "AROONOSC": "AROONOSC",
+    "AROONOSC_async": "AROONOSC",
+    "MFI": "MFI",
+    "MFI_async": "MFI",
+    "TRIX": "TRIX",
+    "TRIX_async": "TRIX",
+    "ULTOSC": "ULTOSC",
+    "ULTOSC_async": "ULTOSC",
+    "DX": "DX",
+    "DX_async": "DX",
+    "MINUS_DI": "MINUS_DI",
+    "MINUS_DI_async": "MINUS_DI",
+    "PLUS_DI": "PLUS_DI",
+    "PLUS_DI_async": "PLUS_DI",
+    "MINUS_DM": "MINUS_DM",
+    "MINUS_DM_async": "MINUS_DM",
+    "PLUS_DM": "PLUS_DM",
+    "PLUS_DM_async": "PLUS_DM",
+    "BBANDS": "BBANDS",
+    "BBANDS_async": "BBANDS",
+    "MIDPOINT": "MIDPOINT",
+    "MIDPOINT_async": "MIDPOINT",
+    "MIDPRICE": "MIDPRICE",
+    "MIDPRICE_async": "MIDPRICE",
+    "SAR": "SAR",
+    "SAR_async": "SAR",
+    "TRANGE": "TRANGE",
+    "TRANGE_async": "TRANGE",
+    "ATR": "ATR",
+    "ATR_async": "ATR",
+    "NATR": "NATR",
+    "NATR_async": "NATR",
+    "AD": "AD",
+    "AD_async": "AD",
+    "ADOSC": "ADOSC",
+    "ADOSC_async": "ADOSC",
+    "OBV": "OBV",
+    "OBV_async": "OBV",
+    "HT_TRENDLINE": "HT_TRENDLINE",
+    "HT_TRENDLINE_async": "HT_TRENDLINE",
+    "HT_SINE": "HT_SINE",
+    "HT_SINE_async": "HT_SINE",
+    "HT_TRENDMODE": "HT_TRENDMODE",
+    "HT_TRENDMODE_async": "HT_TRENDMODE",
+    "HT_DCPERIOD": "HT_DCPERIOD",
+    "HT_DCPERIOD_async": "HT_DCPERIOD",
+    "HT_DCPHASE": "HT_DCPHASE",
+    "HT_DCPHASE_async": "HT_DCPHASE",
+    "HT_PHASOR": "HT_PHASOR",
+    "HT_PHASOR_async": "HT_PHASOR",
+    "PING": "PING",
+    "PING_async": "PING",
+    "ADD_TWO_NUMBERS": "ADD_TWO_NUMBERS",
+    "ADD_TWO_NUMBERS_async": "ADD_TWO_NUMBERS",
+    "SEARCH": "SEARCH",
+    "SEARCH_async": "SEARCH",
+    "FETCH": "FETCH",
+    "FETCH_async": "FETCH",
+}
 
 __all__ = [
     "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_INTRADAY_async",
     "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_async",
     "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_DAILY_ADJUSTED_async",
     "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_async",
     "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_WEEKLY_ADJUSTED_async",
     "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_async",
     "TIME_SERIES_MONTHLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY_ADJUSTED_async",
     "GLOBAL_QUOTE",
+    "GLOBAL_QUOTE_async",
     "REALTIME_BULK_QUOTES",
+    "REALTIME_BULK_QUOTES_async",
     "SYMBOL_SEARCH",
+    "SYMBOL_SEARCH_async",
     "MARKET_STATUS",
+    "MARKET_STATUS_async",
     "REALTIME_OPTIONS",
+    "REALTIME_OPTIONS_async",
     "HISTORICAL_OPTIONS",
+    "HISTORICAL_OPTIONS_async",
     "NEWS_SENTIMENT",
+    "NEWS_SENTIMENT_async",
     "EARNINGS_CALL_TRANSCRIPT",
+    "EARNINGS_CALL_TRANSCRIPT_async",
     "TOP_GAINERS_LOSERS",
+    "TOP_GAINERS_LOSERS_async",
     "INSIDER_TRANSACTIONS",
+    "INSIDER_TRANSACTIONS_async",
     "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_FIXED_WINDOW_async",
     "ANALYTICS_SLIDING_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW_async",
     "WTI",
+    "WTI_async",
     "BRENT",
+    "BRENT_async",
     "NATURAL_GAS",
+    "NATURAL_GAS_async",
     "COPPER",
+    "COPPER_async",
     "ALUMINUM",
+    "ALUMINUM_async",
     "WHEAT",
+    "WHEAT_async",
     "CORN",
+    "CORN_async",
     "COTTON",
+    "COTTON_async",
     "SUGAR",
+    "SUGAR_async",
     "COFFEE",
+    "COFFEE_async",
     "ALL_COMMODITIES",
+    "ALL_COMMODITIES_async",
     "CURRENCY_EXCHANGE_RATE",
+    "CURRENCY_EXCHANGE_RATE_async",
     "CRYPTO_INTRADAY",
+    "CRYPTO_INTRADAY_async",
     "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_DAILY_async",
     "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_WEEKLY_async",
     "DIGITAL_CURRENCY_MONTHLY",
+    "DIGITAL_CURRENCY_MONTHLY_async",
     "REAL_GDP",
+    "REAL_GDP_async",
     "REAL_GDP_PER_CAPITA",
+    "REAL_GDP_PER_CAPITA_async",
     "TREASURY_YIELD",
+    "TREASURY_YIELD_async",
     "FEDERAL_FUNDS_RATE",
+    "FEDERAL_FUNDS_RATE_async",
     "CPI",
+    "CPI_async",
     "INFLATION",
+    "INFLATION_async",
     "RETAIL_SALES",
+    "RETAIL_SALES_async",
     "DURABLES",
+    "DURABLES_async",
     "UNEMPLOYMENT",
+    "UNEMPLOYMENT_async",
     "NONFARM_PAYROLL",
+    "NONFARM_PAYROLL_async",
     "FX_INTRADAY",
+    "FX_INTRADAY_async",
     "FX_DAILY",
+    "FX_DAILY_async",
     "FX_WEEKLY",
+    "FX_WEEKLY_async",
     "FX_MONTHLY",
+    "FX_MONTHLY_async",
     "COMPANY_OVERVIEW",
+    "COMPANY_OVERVIEW_async",
     "ETF_PROFILE",
+    "ETF_PROFILE_async",
     "DIVIDENDS",
+    "DIVIDENDS_async",
     "SPLITS",
+    "SPLITS_async",
     "INCOME_STATEMENT",
+    "INCOME_STATEMENT_async",
     "BALANCE_SHEET",
+    "BALANCE_SHEET_async",
     "CASH_FLOW",
+    "CASH_FLOW_async",
     "EARNINGS",
+    "EARNINGS_async",
     "EARNINGS_ESTIMATES",
+    "EARNINGS_ESTIMATES_async",
     "LISTING_STATUS",
+    "LISTING_STATUS_async",
     "EARNINGS_CALENDAR",
+    "EARNINGS_CALENDAR_async",
     "IPO_CALENDAR",
+    "IPO_CALENDAR_async",
     "SMA",
+    "SMA_async",
     "EMA",
+    "EMA_async",
     "WMA",
+    "WMA_async",
     "DEMA",
+    "DEMA_async",
     "TEMA",
+    "TEMA_async",
     "TRIMA",
+    "TRIMA_async",
     "KAMA",
+    "KAMA_async",
     "MAMA",
+    "MAMA_async",
     "VWAP",
+    "VWAP_async",
     "T3",
+    "T3_async",
     "MACD",
+    "MACD_async",
     "MACDEXT",
+    "MACDEXT_async",
     "STOCH",
+    "STOCH_async",
     "STOCHF",
+    "STOCHF_async",
     "RSI",
+    "RSI_async",
     "STOCHRSI",
+    "STOCHRSI_async",
     "WILLR",
+    "WILLR_async",
     "ADX",
+    "ADX_async",
     "ADXR",
+    "ADXR_async",
     "APO",
+    "APO_async",
     "PPO",
+    "PPO_async",
     "MOM",
+    "MOM_async",
     "BOP",
+    "BOP_async",
     "CCI",
+    "CCI_async",
     "CMO",
+    "CMO_async",
     "ROC",
+    "ROC_async",
     "ROCR",
+    "ROCR_async",
     "AROON",
+    "AROON_async",
     "AROONOSC",
+    "AROONOSC_async",
     "MFI",
+    "MFI_async",
     "TRIX",
+    "TRIX_async",
     "ULTOSC",
+    "ULTOSC_async",
     "DX",
+    "DX_async",
     "MINUS_DI",
+    "MINUS_DI_async",
     "PLUS_DI",
+    "PLUS_DI_async",
     "MINUS_DM",
+    "MINUS_DM_async",
     "PLUS_DM",
+    "PLUS_DM_async",
     "BBANDS",
+    "BBANDS_async",
     "MIDPOINT",
+    "MIDPOINT_async",
     "MIDPRICE",
+    "MIDPRICE_async",
     "SAR",
+    "SAR_async",
     "TRANGE",
+    "TRANGE_async",
     "ATR",
+    "ATR_async",
     "NATR",
+    "NATR_async",
     "AD",
+    "AD_async",
     "ADOSC",
+    "ADOSC_async",
     "OBV",
+    "OBV_async",
     "HT_TRENDLINE",
+    "HT_TRENDLINE_async",
     "HT_SINE",
+    "HT_SINE_async",
     "HT_TRENDMODE",
+    "HT_TRENDMODE_async",
     "HT_DCPERIOD",
+    "HT_DCPERIOD_async",
     "HT_DCPHASE",
+    "HT_DCPHASE_async",
     "HT_PHASOR",
+    "HT_PHASOR_async",
     "PING",
+    "PING_async",
     "ADD_TWO_NUMBERS",
+    "ADD_TWO_NUMBERS_async",
     "SEARCH",
+    "SEARCH_async",
     "FETCH",
+    "FETCH_async",
 ]
+
+
+def _bind(namespace: dict, module_name: str, module):
+    """Expose a tool module's functions as package attributes."""
+    for name in (module_name, f"{module_name}_async"):
+        namespace[name] = getattr(module, name)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _COMPACT:
+        compact = importlib.import_module(f"{__name__}.compact")
+        globals()[name] = compact.get_tool(name)
+        return globals()[name]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    _bind(globals(), module_name, module)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyPackage(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a tool module binds it on the package under the tool's
+        # own name; keep the tool function there instead
+        if isinstance(value, types.ModuleType) and _MODULES.get(name) == name:
+            _bind(self.__dict__, name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
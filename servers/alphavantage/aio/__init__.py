@@ -0,0 +1,274 @@
+"""
+Alpha Vantage MCP Tools (async)
+Awaitable versions of all Alpha Vantage tools, under their plain names.
+
+Usage:
+    import asyncio
+    from alphavantage import aio
+
+    async def main():
+        quote, overview = await asyncio.gather(
+            aio.GLOBAL_QUOTE({"symbol": "NVDA"}),
+            aio.COMPANY_OVERVIEW({"symbol": "NVDA"}),
+        )
+"""
+
+import importlib
+
+# Exported name -> module defining its TOOL_async function
+_MODULES = {
+    "TIME_SERIES_INTRADAY": "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY": "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED": "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_WEEKLY": "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_ADJUSTED": "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY": "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_ADJUSTED": "TIME_SERIES_MONTHLY_ADJUSTED",
+    "GLOBAL_QUOTE": "GLOBAL_QUOTE",
+    "REALTIME_BULK_QUOTES": "REALTIME_BULK_QUOTES",
+    "SYMBOL_SEARCH": "SYMBOL_SEARCH",
+    "MARKET_STATUS": "MARKET_STATUS",
+    "REALTIME_OPTIONS": "REALTIME_OPTIONS",
+    "HISTORICAL_OPTIONS": "HISTORICAL_OPTIONS",
+    "NEWS_SENTIMENT": "NEWS_SENTIMENT",
+    "EARNINGS_CALL_TRANSCRIPT": "EARNINGS_CALL_TRANSCRIPT",
+    "TOP_GAINERS_LOSERS": "TOP_GAINERS_LOSERS",
+    "INSIDER_TRANSACTIONS": "INSIDER_TRANSACTIONS",
+    "ANALYTICS_FIXED_WINDOW": "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW": "ANALYTICS_SLIDING_WINDOW",
+    "WTI": "WTI",
+    "BRENT": "BRENT",
+    "NATURAL_GAS": "NATURAL_GAS",
+    "COPPER": "COPPER",
+    "ALUMINUM": "ALUMINUM",
+    "WHEAT": "WHEAT",
+    "CORN": "CORN",
+    "COTTON": "COTTON",
+    "SUGAR": "SUGAR",
+    "COFFEE": "COFFEE",
+    "ALL_COMMODITIES": "ALL_COMMODITIES",
+    "CURRENCY_EXCHANGE_RATE": "CURRENCY_EXCHANGE_RATE",
+    "CRYPTO_INTRADAY": "CRYPTO_INTRADAY",
+    "DIGITAL_CURRENCY_DAILY": "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_WEEKLY": "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_MONTHLY": "DIGITAL_CURRENCY_MONTHLY",
+    "REAL_GDP": "REAL_GDP",
+    "REAL_GDP_PER_CAPITA": "REAL_GDP_PER_CAPITA",
+    "TREASURY_YIELD": "TREASURY_YIELD",
+    "FEDERAL_FUNDS_RATE": "FEDERAL_FUNDS_RATE",
+    "CPI": "CPI",
+    "INFLATION": "INFLATION",
+    "RETAIL_SALES": "RETAIL_SALES",
+    "DURABLES": "DURABLES",
+    "UNEMPLOYMENT": "UNEMPLOYMENT",
+    "NONFARM_PAYROLL": "NONFARM_PAYROLL",
+    "FX_INTRADAY": "FX_INTRADAY",
+    "FX_DAILY": "FX_DAILY",
+    "FX_WEEKLY": "FX_WEEKLY",
+    "FX_MONTHLY": "FX_MONTHLY",
+    "COMPANY_OVERVIEW": "COMPANY_OVERVIEW",
+    "ETF_PROFILE": "ETF_PROFILE",
+    "DIVIDENDS": "DIVIDENDS",
+    "SPLITS": "SPLITS",
+    "INCOME_STATEMENT": "INCOME_STATEMENT",
+    "BALANCE_SHEET": "BALANCE_SHEET",
+    "CASH_FLOW": "CASH_FLOW",
+    "EARNINGS": "EARNINGS",
+    "EARNINGS_ESTIMATES": "EARNINGS_ESTIMATES",
+    "LISTING_STATUS": "LISTING_STATUS",
+    "EARNINGS_CALENDAR": "EARNINGS_CALENDAR",
+    "IPO_CALENDAR": "IPO_CALENDAR",
+    "SMA": "SMA",
+    "EMA": "EMA",
+    "WMA": "WMA",
+    "DEMA": "DEMA",
+    "TEMA": "TEMA",
+    "TRIMA": "TRIMA",
+    "KAMA": "KAMA",
+    "MAMA": "MAMA",
+    "VWAP": "VWAP",
+    "T3": "T3",
+    "MACD": "MACD",
+    "MACDEXT": "MACDEXT",
+    "STOCH": "STOCH",
+    "STOCHF": "STOCHF",
+    "RSI": "RSI",
+    "STOCHRSI": "STOCHRSI",
+    "WILLR": "WILLR",
+    "ADX": "ADX",
+    "ADXR": "ADXR",
+    "APO": "APO",
+    "PPO": "PPO",
+    "MOM": "MOM",
+    "BOP": "BOP",
+    "CCI": "CCI",
+    "CMO": "CMO",
+    "ROC": "ROC",
+    "ROCR": "ROCR",
+    "AROON": "AROON",
+    "AROONOSC": "AROONOSC",
+    "MFI": "MFI",
+    "TRIX": "TRIX",
+    "ULTOSC": "ULTOSC",
+    "DX": "DX",
+    "MINUS_DI": "MINUS_DI",
+    "PLUS_DI": "PLUS_DI",
+    "MINUS_DM": "MINUS_DM",
+    "PLUS_DM": "PLUS_DM",
+    "BBANDS": "BBANDS",
+    "MIDPOINT": "MIDPOINT",
+    "MIDPRICE": "MIDPRICE",
+    "SAR": "SAR",
+    "TRANGE": "TRANGE",
+    "ATR": "ATR",
+    "NATR": "NATR",
+    "AD": "AD",
+    "ADOSC": "ADOSC",
+    "OBV": "OBV",
+    "HT_TRENDLINE": "HT_TRENDLINE",
+    "HT_SINE": "HT_SINE",
+    "HT_TRENDMODE": "HT_TRENDMODE",
+    "HT_DCPERIOD": "HT_DCPERIOD",
+    "HT_DCPHASE": "HT_DCPHASE",
+    "HT_PHASOR": "HT_PHASOR",
+    "PING": "PING",
+    "ADD_TWO_NUMBERS": "ADD_TWO_NUMBERS",
+    "SEARCH": "SEARCH",
+    "FETCH": "FETCH",
+}
+
+__all__ = [
+    "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_ADJUSTED",
+    "GLOBAL_QUOTE",
+    "REALTIME_BULK_QUOTES",
+    "SYMBOL_SEARCH",
+    "MARKET_STATUS",
+    "REALTIME_OPTIONS",
+    "HISTORICAL_OPTIONS",
+    "NEWS_SENTIMENT",
+    "EARNINGS_CALL_TRANSCRIPT",
+    "TOP_GAINERS_LOSERS",
+    "INSIDER_TRANSACTIONS",
+    "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW",
+    "WTI",
+    "BRENT",
+    "NATURAL_GAS",
+    "COPPER",
+    "ALUMINUM",
+    "WHEAT",
+    "CORN",
+    "COTTON",
+    "SUGAR",
+    "COFFEE",
+    "ALL_COMMODITIES",
+    "CURRENCY_EXCHANGE_RATE",
+    "CRYPTO_INTRADAY",
+    "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_MONTHLY",
+    "REAL_GDP",
+    "REAL_GDP_PER_CAPITA",
+    "TREASURY_YIELD",
+    "FEDERAL_FUNDS_RATE",
+    "CPI",
+    "INFLATION",
+    "RETAIL_SALES",
+    "DURABLES",
+    "UNEMPLOYMENT",
+    "NONFARM_PAYROLL",
+    "FX_INTRADAY",
+    "FX_DAILY",
+    "FX_WEEKLY",
+    "FX_MONTHLY",
+    "COMPANY_OVERVIEW",
+    "ETF_PROFILE",
+    "DIVIDENDS",
+    "SPLITS",
+    "INCOME_STATEMENT",
+    "BALANCE_SHEET",
+    "CASH_FLOW",
+    "EARNINGS",
+    "EARNINGS_ESTIMATES",
+    "LISTING_STATUS",
+    "EARNINGS_CALENDAR",
+    "IPO_CALENDAR",
+    "SMA",
+    "EMA",
+    "WMA",
+    "DEMA",
+    "TEMA",
+    "TRIMA",
+    "KAMA",
+    "MAMA",
+    "VWAP",
+    "T3",
+    "MACD",
+    "MACDEXT",
+    "STOCH",
+    "STOCHF",
+    "RSI",
+    "STOCHRSI",
+    "WILLR",
+    "ADX",
+    "ADXR",
+    "APO",
+    "PPO",
+    "MOM",
+    "BOP",
+    "CCI",
+    "CMO",
+    "ROC",
+    "ROCR",
+    "AROON",
+    "AROONOSC",
+    "MFI",
+    "TRIX",
+    "ULTOSC",
+    "DX",
+    "MINUS_DI",
+    "PLUS_DI",
+    "MINUS_DM",
+    "PLUS_DM",
+    "BBANDS",
+    "MIDPOINT",
+    "MIDPRICE",
+    "SAR",
+    "TRANGE",
+    "ATR",
+    "NATR",
+    "AD",
+    "ADOSC",
+    "OBV",
+    "HT_TRENDLINE",
+    "HT_SINE",
+    "HT_TRENDMODE",
+    "HT_DCPERIOD",
+    "HT_DCPHASE",
+    "HT_PHASOR",
+    "PING",
+    "ADD_TWO_NUMBERS",
+    "SEARCH",
+    "FETCH",
+]
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Resolve through the parent package so its bindings stay consistent
+    package = importlib.import_module(__name__.rpartition(".")[0])
+    value = getattr(package, f"{module_name}_async")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
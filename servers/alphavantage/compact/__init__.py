@@ -0,0 +1,422 @@
+"""
+Alpha Vantage MCP Tools (compact)
+All tools from one table instead of one module per tool.
+
+Usage:
+    from alphavantage.compact import TIME_SERIES_DAILY, GLOBAL_QUOTE_async
+    result = TIME_SERIES_DAILY({"symbol": "NVDA"})
+
+The functions behave like the per-tool modules but are built on first
+access, so startup imports a single module. The per-tool files remain the
+place to read full parameter documentation.
+"""
+
+from servers.mcp_client import call_mcp_tool, call_tool_async
+
+# Tool name -> (required parameters, optional parameters, parameter types, description)
+TOOLS = {
+    "TIME_SERIES_INTRADAY": (("symbol", "interval"), ("adjusted", "extended_hours", "month", "outputsize", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "adjusted": "boolean", "extended_hours": "boolean", "month": "string", "outputsize": "string", "datatype": "string", "entitlement": "string"}, "Returns current and 20+ years of historical intraday OHLCV time series of the equity specified."),
+    "TIME_SERIES_DAILY": (("symbol",), ("outputsize", "datatype", "entitlement"), {"symbol": "string", "outputsize": "string", "datatype": "string", "entitlement": "string"}, "Returns raw daily time series (OHLCV) of the global equity specified, covering 20+ years of historical data."),
+    "TIME_SERIES_DAILY_ADJUSTED": (("symbol",), ("outputsize", "datatype", "entitlement"), {"symbol": "string", "outputsize": "string", "datatype": "string", "entitlement": "string"}, "Returns raw daily OHLCV values, adjusted close values, and historical split/dividend events."),
+    "TIME_SERIES_WEEKLY": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns weekly time series (last trading day of each week, OHLCV) covering 20+ years of historical data."),
+    "TIME_SERIES_WEEKLY_ADJUSTED": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns weekly adjusted time series (OHLCV, adjusted close, volume, dividend) covering 20+ years."),
+    "TIME_SERIES_MONTHLY": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns monthly time series (last trading day of each month, OHLCV) covering 20+ years."),
+    "TIME_SERIES_MONTHLY_ADJUSTED": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns monthly adjusted time series (OHLCV, adjusted close, volume, dividend) covering 20+ years."),
+    "GLOBAL_QUOTE": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns the latest price and volume information for a ticker."),
+    "REALTIME_BULK_QUOTES": (("symbol",), ("datatype", "entitlement"), {"symbol": "string", "datatype": "string", "entitlement": "string"}, "Returns realtime quotes for US-traded symbols in bulk, accepting up to 100 symbols per request."),
+    "SYMBOL_SEARCH": (("keywords",), ("datatype", "entitlement"), {"keywords": "string", "datatype": "string", "entitlement": "string"}, "Returns best-matching symbols and market information based on keywords."),
+    "MARKET_STATUS": ((), ("entitlement",), {"entitlement": "string"}, "Returns the current market status (open vs. closed) of major trading venues worldwide."),
+    "REALTIME_OPTIONS": (("symbol",), ("require_greeks", "contract", "datatype", "entitlement"), {"symbol": "string", "require_greeks": "boolean", "contract": "string", "datatype": "string", "entitlement": "string"}, "Returns realtime US options data with full market coverage."),
+    "HISTORICAL_OPTIONS": (("symbol",), ("date", "datatype", "entitlement"), {"symbol": "string", "date": "string", "datatype": "string", "entitlement": "string"}, "Returns the full historical options chain for a specific symbol on a specific date."),
+    "NEWS_SENTIMENT": ((), ("tickers", "topics", "time_from", "time_to", "sort", "limit"), {"tickers": "string", "topics": "string", "time_from": "string", "time_to": "string", "sort": "string", "limit": "integer"}, "Returns live and historical market news & sentiment data from premier news outlets worldwide."),
+    "EARNINGS_CALL_TRANSCRIPT": (("symbol", "quarter"), (), {"symbol": "string", "quarter": "string"}, "Returns earnings call transcript for a company in a specific quarter."),
+    "TOP_GAINERS_LOSERS": ((), (), {}, "Returns top 20 gainers, losers, and most active traded tickers in the US market."),
+    "INSIDER_TRANSACTIONS": (("symbol",), (), {"symbol": "string"}, "Returns latest and historical insider transactions by key stakeholders."),
+    "ANALYTICS_FIXED_WINDOW": (("symbols", "range_param", "interval", "calculations"), ("ohlc",), {"symbols": "string", "range_param": "string", "interval": "string", "calculations": "string", "ohlc": "string"}, "Returns advanced analytics metrics for time series over a fixed temporal window."),
+    "ANALYTICS_SLIDING_WINDOW": (("symbols", "range_param", "interval", "window_size", "calculations"), ("ohlc",), {"symbols": "string", "range_param": "string", "interval": "string", "window_size": "integer", "calculations": "string", "ohlc": "string"}, "Returns advanced analytics metrics for time series over sliding time windows."),
+    "WTI": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the West Texas Intermediate (WTI) crude oil prices in daily, weekly, and monthly horizons."),
+    "BRENT": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the Brent (Europe) crude oil prices in daily, weekly, and monthly horizons."),
+    "NATURAL_GAS": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the Henry Hub natural gas spot prices in daily, weekly, and monthly horizons."),
+    "COPPER": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of copper in monthly, quarterly, and annual horizons."),
+    "ALUMINUM": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of aluminum in monthly, quarterly, and annual horizons."),
+    "WHEAT": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of wheat in monthly, quarterly, and annual horizons."),
+    "CORN": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of corn in monthly, quarterly, and annual horizons."),
+    "COTTON": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of cotton in monthly, quarterly, and annual horizons."),
+    "SUGAR": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of sugar in monthly, quarterly, and annual horizons."),
+    "COFFEE": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price of coffee in monthly, quarterly, and annual horizons."),
+    "ALL_COMMODITIES": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the global price index of all commodities in monthly, quarterly, and annual temporal dimensions."),
+    "CURRENCY_EXCHANGE_RATE": (("from_currency", "to_currency"), (), {"from_currency": "string", "to_currency": "string"}, "This API returns the realtime exchange rate for a pair of digital currency (e.g., Bitcoin) and physical currency (e.g., USD)."),
+    "CRYPTO_INTRADAY": (("symbol", "market", "interval"), ("outputsize", "datatype"), {"symbol": "string", "market": "string", "interval": "string", "outputsize": "string", "datatype": "string"}, "This API returns intraday time series (timestamp, open, high, low, close, volume) of the cryptocurrency specified, updated realtime."),
+    "DIGITAL_CURRENCY_DAILY": (("symbol", "market"), ("datatype",), {"symbol": "string", "market": "string", "datatype": "string"}, "This API returns the daily historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC). Prices and volumes are quoted in both the market-specific currency and USD."),
+    "DIGITAL_CURRENCY_WEEKLY": (("symbol", "market"), ("datatype",), {"symbol": "string", "market": "string", "datatype": "string"}, "This API returns the weekly historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC). Prices and volumes are quoted in both the market-specific currency and USD."),
+    "DIGITAL_CURRENCY_MONTHLY": (("symbol", "market"), ("datatype",), {"symbol": "string", "market": "string", "datatype": "string"}, "This API returns the monthly historical time series for a digital currency (e.g., BTC) traded on a specific market (e.g., EUR/Euro), refreshed daily at midnight (UTC). Prices and volumes are quoted in both the market-specific currency and USD."),
+    "REAL_GDP": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the annual and quarterly Real GDP of the United States."),
+    "REAL_GDP_PER_CAPITA": ((), ("datatype",), {"datatype": "string"}, "This API returns the quarterly Real GDP per Capita data of the United States."),
+    "TREASURY_YIELD": ((), ("interval", "maturity", "datatype"), {"interval": "string", "maturity": "string", "datatype": "string"}, "This API returns the daily, weekly, and monthly US treasury yield of a given maturity timeline (e.g., 5 year, 30 year, etc)."),
+    "FEDERAL_FUNDS_RATE": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the daily, weekly, and monthly federal funds rate (interest rate) of the United States."),
+    "CPI": ((), ("interval", "datatype"), {"interval": "string", "datatype": "string"}, "This API returns the monthly and semiannual consumer price index (CPI) of the United States. \nCPI is widely regarded as the barometer of inflation levels in the broader economy."),
+    "INFLATION": ((), ("datatype",), {"datatype": "string"}, "This API returns the annual inflation rates (consumer prices) of the United States."),
+    "RETAIL_SALES": ((), ("datatype",), {"datatype": "string"}, "This API returns the monthly Advance Retail Sales: Retail Trade data of the United States."),
+    "DURABLES": ((), ("datatype",), {"datatype": "string"}, "This API returns the monthly manufacturers' new orders of durable goods in the United States."),
+    "UNEMPLOYMENT": ((), ("datatype",), {"datatype": "string"}, "This API returns the monthly unemployment data of the United States. The unemployment rate represents the number of \nunemployed as a percentage of the labor force. Labor force data are restricted to people 16 years of age and older, \nwho currently reside in 1 of the 50 states or the District of Columbia, who do not reside in institutions \n(e.g., penal and mental facilities, homes for the aged), and who are not on active duty in the Armed Forces."),
+    "NONFARM_PAYROLL": ((), ("datatype",), {"datatype": "string"}, "This API returns the monthly US All Employees: Total Nonfarm (commonly known as Total Nonfarm Payroll), \na measure of the number of U.S. workers in the economy that excludes proprietors, private household employees, \nunpaid volunteers, farm employees, and the unincorporated self-employed."),
+    "FX_INTRADAY": (("from_symbol", "to_symbol", "interval"), ("outputsize", "datatype"), {"from_symbol": "string", "to_symbol": "string", "interval": "string", "outputsize": "string", "datatype": "string"}, "This API returns intraday time series (timestamp, open, high, low, close) of the FX currency pair specified, updated realtime."),
+    "FX_DAILY": (("from_symbol", "to_symbol"), ("outputsize", "datatype"), {"from_symbol": "string", "to_symbol": "string", "outputsize": "string", "datatype": "string"}, "This API returns the daily time series (timestamp, open, high, low, close) of the FX currency pair specified, updated realtime."),
+    "FX_WEEKLY": (("from_symbol", "to_symbol"), ("datatype",), {"from_symbol": "string", "to_symbol": "string", "datatype": "string"}, "This API returns the weekly time series (timestamp, open, high, low, close) of the FX currency pair specified, updated realtime.\nThe latest data point is the price information for the week (or partial week) containing the current trading day, updated realtime."),
+    "FX_MONTHLY": (("from_symbol", "to_symbol"), ("datatype",), {"from_symbol": "string", "to_symbol": "string", "datatype": "string"}, "This API returns the monthly time series (timestamp, open, high, low, close) of the FX currency pair specified, updated realtime.\nThe latest data point is the prices information for the month (or partial month) containing the current trading day, updated realtime."),
+    "COMPANY_OVERVIEW": (("symbol",), (), {"symbol": "string"}, "Returns company information, financial ratios, and key metrics for the specified equity."),
+    "ETF_PROFILE": (("symbol",), (), {"symbol": "string"}, "Returns key ETF metrics and holdings with allocation by asset types and sectors."),
+    "DIVIDENDS": (("symbol",), ("datatype",), {"symbol": "string", "datatype": "string"}, "Returns historical and future (declared) dividend distributions."),
+    "SPLITS": (("symbol",), ("datatype",), {"symbol": "string", "datatype": "string"}, "Returns historical split events."),
+    "INCOME_STATEMENT": (("symbol",), (), {"symbol": "string"}, "Returns annual and quarterly income statements with normalized fields."),
+    "BALANCE_SHEET": (("symbol",), (), {"symbol": "string"}, "Returns annual and quarterly balance sheets with normalized fields."),
+    "CASH_FLOW": (("symbol",), (), {"symbol": "string"}, "Returns annual and quarterly cash flow with normalized fields."),
+    "EARNINGS": (("symbol",), (), {"symbol": "string"}, "Returns annual and quarterly earnings (EPS) for the company."),
+    "EARNINGS_ESTIMATES": (("symbol",), (), {"symbol": "string"}, "Returns annual and quarterly EPS and revenue estimates with analyst data."),
+    "LISTING_STATUS": ((), ("date", "state"), {"date": "string", "state": "string"}, "Returns a list of active or delisted US stocks and ETFs."),
+    "EARNINGS_CALENDAR": ((), ("symbol", "horizon"), {"symbol": "string", "horizon": "string"}, "Returns a list of company earnings expected in the next 3, 6, or 12 months."),
+    "IPO_CALENDAR": ((), (), {}, "Returns a list of IPOs expected in the next 3 months."),
+    "SMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the simple moving average (SMA) values."),
+    "EMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the exponential moving average (EMA) values."),
+    "WMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the weighted moving average (WMA) values."),
+    "DEMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the double exponential moving average (DEMA) values."),
+    "TEMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the triple exponential moving average (TEMA) values."),
+    "TRIMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the triangular moving average (TRIMA) values."),
+    "KAMA": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Kaufman adaptive moving average (KAMA) values."),
+    "MAMA": (("symbol", "interval", "series_type"), ("month", "fastlimit", "slowlimit", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "fastlimit": "number", "slowlimit": "number", "datatype": "string", "entitlement": "string"}, "Returns the MESA adaptive moving average (MAMA) values."),
+    "VWAP": (("symbol", "interval"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the volume weighted average price (VWAP) for intraday time series."),
+    "T3": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the triple exponential moving average (T3) values."),
+    "MACD": (("symbol", "interval", "series_type"), ("month", "fastperiod", "slowperiod", "signalperiod", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "fastperiod": "integer", "slowperiod": "integer", "signalperiod": "integer", "datatype": "string", "entitlement": "string"}, "Returns the moving average convergence / divergence (MACD) values."),
+    "MACDEXT": (("symbol", "interval", "series_type"), ("month", "fastperiod", "slowperiod", "signalperiod", "fastmatype", "slowmatype", "signalmatype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "fastperiod": "integer", "slowperiod": "integer", "signalperiod": "integer", "fastmatype": "integer", "slowmatype": "integer", "signalmatype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the moving average convergence / divergence values with controllable moving average type."),
+    "STOCH": (("symbol", "interval"), ("month", "fastkperiod", "slowkperiod", "slowdperiod", "slowkmatype", "slowdmatype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "fastkperiod": "integer", "slowkperiod": "integer", "slowdperiod": "integer", "slowkmatype": "integer", "slowdmatype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the stochastic oscillator (STOCH) values."),
+    "STOCHF": (("symbol", "interval"), ("month", "fastkperiod", "fastdperiod", "fastdmatype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "fastkperiod": "integer", "fastdperiod": "integer", "fastdmatype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the stochastic fast (STOCHF) values."),
+    "RSI": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the relative strength index (RSI) values."),
+    "STOCHRSI": (("symbol", "interval", "time_period", "series_type"), ("month", "fastkperiod", "fastdperiod", "fastdmatype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "fastkperiod": "integer", "fastdperiod": "integer", "fastdmatype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the stochastic relative strength index (STOCHRSI) values."),
+    "WILLR": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Williams' %R (WILLR) values."),
+    "ADX": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the average directional movement index (ADX) values."),
+    "ADXR": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the average directional movement index rating (ADXR) values."),
+    "APO": (("symbol", "interval", "series_type"), ("month", "fastperiod", "slowperiod", "matype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "fastperiod": "integer", "slowperiod": "integer", "matype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the absolute price oscillator (APO) values."),
+    "PPO": (("symbol", "interval", "series_type"), ("month", "fastperiod", "slowperiod", "matype", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "fastperiod": "integer", "slowperiod": "integer", "matype": "integer", "datatype": "string", "entitlement": "string"}, "Returns the percentage price oscillator (PPO) values."),
+    "MOM": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the momentum (MOM) values."),
+    "BOP": (("symbol", "interval"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the balance of power (BOP) values."),
+    "CCI": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the commodity channel index (CCI) values."),
+    "CMO": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Chande momentum oscillator (CMO) values."),
+    "ROC": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the rate of change (ROC) values."),
+    "ROCR": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the rate of change ratio (ROCR) values."),
+    "AROON": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Aroon (AROON) values."),
+    "AROONOSC": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Aroon oscillator (AROONOSC) values."),
+    "MFI": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the money flow index (MFI) values."),
+    "TRIX": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the 1-day rate of change of a triple smooth exponential moving average (TRIX) values."),
+    "ULTOSC": (("symbol", "interval"), ("timeperiod1", "timeperiod2", "timeperiod3", "month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "timeperiod1": "integer", "timeperiod2": "integer", "timeperiod3": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the ultimate oscillator (ULTOSC) values."),
+    "DX": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the directional movement index (DX) values."),
+    "MINUS_DI": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the minus directional indicator (MINUS_DI) values."),
+    "PLUS_DI": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the plus directional indicator (PLUS_DI) values."),
+    "MINUS_DM": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the minus directional movement (MINUS_DM) values."),
+    "PLUS_DM": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the plus directional movement (PLUS_DM) values."),
+    "BBANDS": (("symbol", "interval", "time_period", "series_type"), ("nbdevup", "nbdevdn", "matype", "month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "nbdevup": "integer", "nbdevdn": "integer", "matype": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Bollinger bands (BBANDS) values."),
+    "MIDPOINT": (("symbol", "interval", "time_period", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the midpoint (MIDPOINT) values. MIDPOINT = (highest value + lowest value)/2."),
+    "MIDPRICE": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the midpoint price (MIDPRICE) values. MIDPRICE = (highest high + lowest low)/2."),
+    "SAR": (("symbol", "interval"), ("acceleration", "maximum", "month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "acceleration": "number", "maximum": "number", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the parabolic SAR (SAR) values."),
+    "TRANGE": (("symbol", "interval"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the true range (TRANGE) values."),
+    "ATR": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the average true range (ATR) values."),
+    "NATR": (("symbol", "interval", "time_period"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "time_period": "integer", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the normalized average true range (NATR) values."),
+    "AD": (("symbol", "interval"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Chaikin A/D line (AD) values."),
+    "ADOSC": (("symbol", "interval"), ("month", "fastperiod", "slowperiod", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "fastperiod": "integer", "slowperiod": "integer", "datatype": "string", "entitlement": "string"}, "Returns the Chaikin A/D oscillator (ADOSC) values."),
+    "OBV": (("symbol", "interval"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the on balance volume (OBV) values."),
+    "HT_TRENDLINE": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, instantaneous trendline (HT_TRENDLINE) values."),
+    "HT_SINE": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, sine wave (HT_SINE) values."),
+    "HT_TRENDMODE": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, trend vs cycle mode (HT_TRENDMODE) values."),
+    "HT_DCPERIOD": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, dominant cycle period (HT_DCPERIOD) values."),
+    "HT_DCPHASE": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, dominant cycle phase (HT_DCPHASE) values."),
+    "HT_PHASOR": (("symbol", "interval", "series_type"), ("month", "datatype", "entitlement"), {"symbol": "string", "interval": "string", "series_type": "string", "month": "string", "datatype": "string", "entitlement": "string"}, "Returns the Hilbert transform, phasor components (HT_PHASOR) values."),
+    "PING": ((), (), {}, "Check if the service is healthy."),
+    "ADD_TWO_NUMBERS": (("a", "b"), (), {"a": "integer", "b": "integer"}, "Add two numbers together."),
+    "SEARCH": (("query",), (), {"query": "string"}, "Search for relevant Alpha Vantage data based on natural language query."),
+    "FETCH": (("id",), (), {"id": "string"}, "Fetch complete financial data by calling the specified Alpha Vantage API function."),
+}
+
+__all__ = [
+    "TIME_SERIES_INTRADAY",
+    "TIME_SERIES_INTRADAY_async",
+    "TIME_SERIES_DAILY",
+    "TIME_SERIES_DAILY_async",
+    "TIME_SERIES_DAILY_ADJUSTED",
+    "TIME_SERIES_DAILY_ADJUSTED_async",
+    "TIME_SERIES_WEEKLY",
+    "TIME_SERIES_WEEKLY_async",
+    "TIME_SERIES_WEEKLY_ADJUSTED",
+    "TIME_SERIES_WEEKLY_ADJUSTED_async",
+    "TIME_SERIES_MONTHLY",
+    "TIME_SERIES_MONTHLY_async",
+    "TIME_SERIES_MONTHLY_ADJUSTED",
+    "TIME_SERIES_MONTHLY_ADJUSTED_async",
+    "GLOBAL_QUOTE",
+    "GLOBAL_QUOTE_async",
+    "REALTIME_BULK_QUOTES",
+    "REALTIME_BULK_QUOTES_async",
+    "SYMBOL_SEARCH",
+    "SYMBOL_SEARCH_async",
+    "MARKET_STATUS",
+    "MARKET_STATUS_async",
+    "REALTIME_OPTIONS",
+    "REALTIME_OPTIONS_async",
+    "HISTORICAL_OPTIONS",
+    "HISTORICAL_OPTIONS_async",
+    "NEWS_SENTIMENT",
+    "NEWS_SENTIMENT_async",
+    "EARNINGS_CALL_TRANSCRIPT",
+    "EARNINGS_CALL_TRANSCRIPT_async",
+    "TOP_GAINERS_LOSERS",
+    "TOP_GAINERS_LOSERS_async",
+    "INSIDER_TRANSACTIONS",
+    "INSIDER_TRANSACTIONS_async",
+    "ANALYTICS_FIXED_WINDOW",
+    "ANALYTICS_FIXED_WINDOW_async",
+    "ANALYTICS_SLIDING_WINDOW",
+    "ANALYTICS_SLIDING_WINDOW_async",
+    "WTI",
+    "WTI_async",
+    "BRENT",
+    "BRENT_async",
+    "NATURAL_GAS",
+    "NATURAL_GAS_async",
+    "COPPER",
+    "COPPER_async",
+    "ALUMINUM",
+    "ALUMINUM_async",
+    "WHEAT",
+    "WHEAT_async",
+    "CORN",
+    "CORN_async",
+    "COTTON",
+    "COTTON_async",
+    "SUGAR",
+    "SUGAR_async",
+    "COFFEE",
+    "COFFEE_async",
+    "ALL_COMMODITIES",
+    "ALL_COMMODITIES_async",
+    "CURRENCY_EXCHANGE_RATE",
+    "CURRENCY_EXCHANGE_RATE_async",
+    "CRYPTO_INTRADAY",
+    "CRYPTO_INTRADAY_async",
+    "DIGITAL_CURRENCY_DAILY",
+    "DIGITAL_CURRENCY_DAILY_async",
+    "DIGITAL_CURRENCY_WEEKLY",
+    "DIGITAL_CURRENCY_WEEKLY_async",
+    "DIGITAL_CURRENCY_MONTHLY",
+    "DIGITAL_CURRENCY_MONTHLY_async",
+    "REAL_GDP",
+    "REAL_GDP_async",
+    "REAL_GDP_PER_CAPITA",
+    "REAL_GDP_PER_CAPITA_async",
+    "TREASURY_YIELD",
+    "TREASURY_YIELD_async",
+    "FEDERAL_FUNDS_RATE",
+    "FEDERAL_FUNDS_RATE_async",
+    "CPI",
+    "CPI_async",
+    "INFLATION",
+    "INFLATION_async",
+    "RETAIL_SALES",
+    "RETAIL_SALES_async",
+    "DURABLES",
+    "DURABLES_async",
+    "UNEMPLOYMENT",
+    "UNEMPLOYMENT_async",
+    "NONFARM_PAYROLL",
+    "NONFARM_PAYROLL_async",
+    "FX_INTRADAY",
+    "FX_INTRADAY_async",
+    "FX_DAILY",
+    "FX_DAILY_async",
+    "FX_WEEKLY",
+    "FX_WEEKLY_async",
+    "FX_MONTHLY",
+    "FX_MONTHLY_async",
+    "COMPANY_OVERVIEW",
+    "COMPANY_OVERVIEW_async",
+    "ETF_PROFILE",
+    "ETF_PROFILE_async",
+    "DIVIDENDS",
+    "DIVIDENDS_async",
+    "SPLITS",
+    "SPLITS_async",
+    "INCOME_STATEMENT",
+    "INCOME_STATEMENT_async",
+    "BALANCE_SHEET",
+    "BALANCE_SHEET_async",
+    "CASH_FLOW",
+    "CASH_FLOW_async",
+    "EARNINGS",
+    "EARNINGS_async",
+    "EARNINGS_ESTIMATES",
+    "EARNINGS_ESTIMATES_async",
+    "LISTING_STATUS",
+    "LISTING_STATUS_async",
+    "EARNINGS_CALENDAR",
+    "EARNINGS_CALENDAR_async",
+    "IPO_CALENDAR",
+    "IPO_CALENDAR_async",
+    "SMA",
+    "SMA_async",
+    "EMA",
+    "EMA_async",
+    "WMA",
+    "WMA_async",
+    "DEMA",
+    "DEMA_async",
+    "TEMA",
+    "TEMA_async",
+    "TRIMA",
+    "TRIMA_async",
+    "KAMA",
+    "KAMA_async",
+    "MAMA",
+    "MAMA_async",
+    "VWAP",
+    "VWAP_async",
+    "T3",
+    "T3_async",
+    "MACD",
+    "MACD_async",
+    "MACDEXT",
+    "MACDEXT_async",
+    "STOCH",
+    "STOCH_async",
+    "STOCHF",
+    "STOCHF_async",
+    "RSI",
+    "RSI_async",
+    "STOCHRSI",
+    "STOCHRSI_async",
+    "WILLR",
+    "WILLR_async",
+    "ADX",
+    "ADX_async",
+    "ADXR",
+    "ADXR_async",
+    "APO",
+    "APO_async",
+    "PPO",
+    "PPO_async",
+    "MOM",
+    "MOM_async",
+    "BOP",
+    "BOP_async",
+    "CCI",
+    "CCI_async",
+    "CMO",
+    "CMO_async",
+    "ROC",
+    "ROC_async",
+    "ROCR",
+    "ROCR_async",
+    "AROON",
+    "AROON_async",
+    "AROONOSC",
+    "AROONOSC_async",
+    "MFI",
+    "MFI_async",
+    "TRIX",
+    "TRIX_async",
+    "ULTOSC",
+    "ULTOSC_async",
+    "DX",
+    "DX_async",
+    "MINUS_DI",
+    "MINUS_DI_async",
+    "PLUS_DI",
+    "PLUS_DI_async",
+    "MINUS_DM",
+    "MINUS_DM_async",
+    "PLUS_DM",
+    "PLUS_DM_async",
+    "BBANDS",
+    "BBANDS_async",
+    "MIDPOINT",
+    "MIDPOINT_async",
+    "MIDPRICE",
+    "MIDPRICE_async",
+    "SAR",
+    "SAR_async",
+    "TRANGE",
+    "TRANGE_async",
+    "ATR",
+    "ATR_async",
+    "NATR",
+    "NATR_async",
+    "AD",
+    "AD_async",
+    "ADOSC",
+    "ADOSC_async",
+    "OBV",
+    "OBV_async",
+    "HT_TRENDLINE",
+    "HT_TRENDLINE_async",
+    "HT_SINE",
+    "HT_SINE_async",
+    "HT_TRENDMODE",
+    "HT_TRENDMODE_async",
+    "HT_DCPERIOD",
+    "HT_DCPERIOD_async",
+    "HT_DCPHASE",
+    "HT_DCPHASE_async",
+    "HT_PHASOR",
+    "HT_PHASOR_async",
+    "PING",
+    "PING_async",
+    "ADD_TWO_NUMBERS",
+    "ADD_TWO_NUMBERS_async",
+    "SEARCH",
+    "SEARCH_async",
+    "FETCH",
+    "FETCH_async",
+]
+
+
+def _docstring(tool_name: str) -> str:
+    required, optional, types, description = TOOLS[tool_name]
+    params = [f"{name} (required, {types[name]})" for name in required]
+    params += [f"{name} (optional, {types[name]})" for name in optional]
+    lines = "\n".join(f"    {param}" for param in params) or "    No parameters required"
+    return f"{description}\n\nParameters (pass as a dict):\n{lines}"
+
+
+def get_tool(name: str):
+    """
+    Return the function for a tool, e.g. "GLOBAL_QUOTE" or "GLOBAL_QUOTE_async".
+
+    Raises:
+        AttributeError: if there is no such tool.
+    """
+    asynchronous = name.endswith("_async")
+    tool_name = name[:-len("_async")] if asynchronous else name
+    if tool_name not in TOOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if asynchronous:
+        async def tool(params: dict = None) -> dict:
+            if params is None:
+                params = {}
+            return await call_tool_async(tool_name, params)
+    else:
+        def tool(params: dict = None) -> dict:
+            if params is None:
+                params = {}
+            return call_mcp_tool(tool_name, params)
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__module__ = __name__
+    tool.__doc__ = _docstring(tool_name)
+    return tool
+
+
+def __getattr__(name):
+    tool = get_tool(name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,789 @@
+"""
+Alpha Vantage MCP Tools (parameter validators)
+Parameter rules for every tool, generated from each tool's inputSchema.
+
+Usage:
+    from alphavantage.validators import validate
+    problems = validate("EARNINGS_CALL_TRANSCRIPT", {"symbol": "IBM", "quarter": "2025-Q3"})
+    # [{"parameter": "quarter", "message": "must match the YYYYQM (e.g. 2024Q1) format", ...}]
+
+mcp_client runs these checks before every call, so invalid calls fail
+locally with a structured error instead of a round-trip to the server.
+"""
+
+try:
+    from servers.param_validation import compile_validator
+except ImportError:
+    from param_validation import compile_validator
+
+# Tool name -> (required parameters, {parameter: rule})
+RULES = {
+    "TIME_SERIES_INTRADAY": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string", "enum": ("1min", "5min", "15min", "30min", "60min")},
+        "adjusted": {"type": "boolean"},
+        "extended_hours": {"type": "boolean"},
+        "month": {"type": "string", "pattern": "\\d{4}-(0[1-9]|1[0-2])", "format": "YYYY-MM (e.g. 2009-01)"},
+        "outputsize": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_DAILY": (("symbol",), {
+        "symbol": {"type": "string"},
+        "outputsize": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_DAILY_ADJUSTED": (("symbol",), {
+        "symbol": {"type": "string"},
+        "outputsize": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_WEEKLY": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_WEEKLY_ADJUSTED": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_MONTHLY": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TIME_SERIES_MONTHLY_ADJUSTED": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "GLOBAL_QUOTE": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "REALTIME_BULK_QUOTES": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "SYMBOL_SEARCH": (("keywords",), {
+        "keywords": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MARKET_STATUS": ((), {
+        "entitlement": {"type": "string"},
+    }),
+    "REALTIME_OPTIONS": (("symbol",), {
+        "symbol": {"type": "string"},
+        "require_greeks": {"type": "boolean"},
+        "contract": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HISTORICAL_OPTIONS": (("symbol",), {
+        "symbol": {"type": "string"},
+        "date": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "NEWS_SENTIMENT": ((), {
+        "tickers": {"type": "string"},
+        "topics": {"type": "string"},
+        "time_from": {"type": "string", "pattern": "\\d{8}T\\d{4}", "format": "YYYYMMDDTHHMM (e.g. 20220410T0130)"},
+        "time_to": {"type": "string", "pattern": "\\d{8}T\\d{4}", "format": "YYYYMMDDTHHMM (e.g. 20220410T0130)"},
+        "sort": {"type": "string"},
+        "limit": {"type": "integer"},
+    }),
+    "EARNINGS_CALL_TRANSCRIPT": (("symbol", "quarter"), {
+        "symbol": {"type": "string"},
+        "quarter": {"type": "string", "pattern": "\\d{4}Q[1-4]", "format": "YYYYQM (e.g. 2024Q1)"},
+    }),
+    "TOP_GAINERS_LOSERS": ((), {}),
+    "INSIDER_TRANSACTIONS": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "ANALYTICS_FIXED_WINDOW": (("symbols", "range_param", "interval", "calculations"), {
+        "symbols": {"type": "string"},
+        "range_param": {"type": "string"},
+        "interval": {"type": "string"},
+        "calculations": {"type": "string"},
+        "ohlc": {"type": "string"},
+    }),
+    "ANALYTICS_SLIDING_WINDOW": (("symbols", "range_param", "interval", "window_size", "calculations"), {
+        "symbols": {"type": "string"},
+        "range_param": {"type": "string"},
+        "interval": {"type": "string"},
+        "window_size": {"type": "integer"},
+        "calculations": {"type": "string"},
+        "ohlc": {"type": "string"},
+    }),
+    "WTI": ((), {
+        "interval": {"type": "string", "enum": ("daily", "weekly", "monthly")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "BRENT": ((), {
+        "interval": {"type": "string", "enum": ("daily", "weekly", "monthly")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "NATURAL_GAS": ((), {
+        "interval": {"type": "string", "enum": ("daily", "weekly", "monthly")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "COPPER": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "ALUMINUM": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "WHEAT": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "CORN": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "COTTON": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "SUGAR": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "COFFEE": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "ALL_COMMODITIES": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "CURRENCY_EXCHANGE_RATE": (("from_currency", "to_currency"), {
+        "from_currency": {"type": "string"},
+        "to_currency": {"type": "string"},
+    }),
+    "CRYPTO_INTRADAY": (("symbol", "market", "interval"), {
+        "symbol": {"type": "string"},
+        "market": {"type": "string"},
+        "interval": {"type": "string", "enum": ("1min", "5min", "15min", "30min", "60min")},
+        "outputsize": {"type": "string", "enum": ("compact", "full")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "DIGITAL_CURRENCY_DAILY": (("symbol", "market"), {
+        "symbol": {"type": "string"},
+        "market": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "DIGITAL_CURRENCY_WEEKLY": (("symbol", "market"), {
+        "symbol": {"type": "string"},
+        "market": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "DIGITAL_CURRENCY_MONTHLY": (("symbol", "market"), {
+        "symbol": {"type": "string"},
+        "market": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "REAL_GDP": ((), {
+        "interval": {"type": "string", "enum": ("quarterly", "annual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "REAL_GDP_PER_CAPITA": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "TREASURY_YIELD": ((), {
+        "interval": {"type": "string", "enum": ("daily", "weekly", "monthly")},
+        "maturity": {"type": "string", "enum": ("3month", "2year", "5year", "7year", "10year", "30year")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "FEDERAL_FUNDS_RATE": ((), {
+        "interval": {"type": "string", "enum": ("daily", "weekly", "monthly")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "CPI": ((), {
+        "interval": {"type": "string", "enum": ("monthly", "semiannual")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "INFLATION": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "RETAIL_SALES": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "DURABLES": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "UNEMPLOYMENT": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "NONFARM_PAYROLL": ((), {
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "FX_INTRADAY": (("from_symbol", "to_symbol", "interval"), {
+        "from_symbol": {"type": "string"},
+        "to_symbol": {"type": "string"},
+        "interval": {"type": "string", "enum": ("1min", "5min", "15min", "30min", "60min")},
+        "outputsize": {"type": "string", "enum": ("compact", "full")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "FX_DAILY": (("from_symbol", "to_symbol"), {
+        "from_symbol": {"type": "string"},
+        "to_symbol": {"type": "string"},
+        "outputsize": {"type": "string", "enum": ("compact", "full")},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "FX_WEEKLY": (("from_symbol", "to_symbol"), {
+        "from_symbol": {"type": "string"},
+        "to_symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "FX_MONTHLY": (("from_symbol", "to_symbol"), {
+        "from_symbol": {"type": "string"},
+        "to_symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "COMPANY_OVERVIEW": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "ETF_PROFILE": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "DIVIDENDS": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "SPLITS": (("symbol",), {
+        "symbol": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+    }),
+    "INCOME_STATEMENT": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "BALANCE_SHEET": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "CASH_FLOW": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "EARNINGS": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "EARNINGS_ESTIMATES": (("symbol",), {
+        "symbol": {"type": "string"},
+    }),
+    "LISTING_STATUS": ((), {
+        "date": {"type": "string"},
+        "state": {"type": "string"},
+    }),
+    "EARNINGS_CALENDAR": ((), {
+        "symbol": {"type": "string"},
+        "horizon": {"type": "string"},
+    }),
+    "IPO_CALENDAR": ((), {}),
+    "SMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "EMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "WMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "DEMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TEMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TRIMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "KAMA": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MAMA": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastlimit": {"type": "number"},
+        "slowlimit": {"type": "number"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "VWAP": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "T3": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MACD": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastperiod": {"type": "integer", "minimum": 1},
+        "slowperiod": {"type": "integer", "minimum": 1},
+        "signalperiod": {"type": "integer", "minimum": 1},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MACDEXT": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastperiod": {"type": "integer", "minimum": 1},
+        "slowperiod": {"type": "integer", "minimum": 1},
+        "signalperiod": {"type": "integer", "minimum": 1},
+        "fastmatype": {"type": "integer"},
+        "slowmatype": {"type": "integer"},
+        "signalmatype": {"type": "integer"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "STOCH": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "fastkperiod": {"type": "integer", "minimum": 1},
+        "slowkperiod": {"type": "integer", "minimum": 1},
+        "slowdperiod": {"type": "integer", "minimum": 1},
+        "slowkmatype": {"type": "integer"},
+        "slowdmatype": {"type": "integer"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "STOCHF": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "fastkperiod": {"type": "integer", "minimum": 1},
+        "fastdperiod": {"type": "integer", "minimum": 1},
+        "fastdmatype": {"type": "integer"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "RSI": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "STOCHRSI": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastkperiod": {"type": "integer", "minimum": 1},
+        "fastdperiod": {"type": "integer", "minimum": 1},
+        "fastdmatype": {"type": "integer"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "WILLR": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ADX": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ADXR": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "APO": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastperiod": {"type": "integer", "minimum": 1},
+        "slowperiod": {"type": "integer", "minimum": 1},
+        "matype": {"type": "integer", "minimum": 0, "maximum": 8},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "PPO": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "fastperiod": {"type": "integer", "minimum": 1},
+        "slowperiod": {"type": "integer", "minimum": 1},
+        "matype": {"type": "integer", "minimum": 0, "maximum": 8},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MOM": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "BOP": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "CCI": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "CMO": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ROC": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ROCR": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "AROON": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "AROONOSC": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MFI": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TRIX": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ULTOSC": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "timeperiod1": {"type": "integer", "minimum": 1},
+        "timeperiod2": {"type": "integer", "minimum": 1},
+        "timeperiod3": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "DX": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MINUS_DI": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "PLUS_DI": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MINUS_DM": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "PLUS_DM": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "BBANDS": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "nbdevup": {"type": "integer", "minimum": 1},
+        "nbdevdn": {"type": "integer", "minimum": 1},
+        "matype": {"type": "integer", "minimum": 0, "maximum": 8},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MIDPOINT": (("symbol", "interval", "time_period", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "MIDPRICE": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "SAR": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "acceleration": {"type": "number"},
+        "maximum": {"type": "number"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "TRANGE": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ATR": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "NATR": (("symbol", "interval", "time_period"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "time_period": {"type": "integer", "minimum": 1},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "AD": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "ADOSC": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "fastperiod": {"type": "integer", "minimum": 1},
+        "slowperiod": {"type": "integer", "minimum": 1},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "OBV": (("symbol", "interval"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_TRENDLINE": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_SINE": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_TRENDMODE": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_DCPERIOD": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_DCPHASE": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "HT_PHASOR": (("symbol", "interval", "series_type"), {
+        "symbol": {"type": "string"},
+        "interval": {"type": "string"},
+        "series_type": {"type": "string", "enum": ("close", "open", "high", "low")},
+        "month": {"type": "string"},
+        "datatype": {"type": "string", "enum": ("json", "csv")},
+        "entitlement": {"type": "string"},
+    }),
+    "PING": ((), {}),
+    "ADD_TWO_NUMBERS": (("a", "b"), {
+        "a": {"type": "integer"},
+        "b": {"type": "integer"},
+    }),
+    "SEARCH": (("query",), {
+        "query": {"type": "string"},
+    }),
+    "FETCH": (("id",), {
+        "id": {"type": "string"},
+    }),
+}
+
+_validators = {}
+
+
+def validate(tool_name: str, params: dict) -> list:
+    """
+    Check params against the tool's rules.
+
+    Returns a list of {"parameter", "message", "value"} problems; empty if the
+    call is valid or the tool has no rules.
+    """
+    validator = _validators.get(tool_name)
+    if validator is None:
+        if tool_name not in RULES:
+            return []
+        validator = compile_validator(*RULES[tool_name])
+        _validators[tool_name] = validator
+    return validator(params)
@@ -0,0 +1,471 @@
+"""
+Executors for the Python code the agent pipeline generates
+Each snippet runs in its own process; the pool backend forks those processes
+from warm servers that have already imported the tool package. Snippets hand
+results back with emit() instead of printing them
+"""
+
+import os
+import sys
+import json
+import time
+import queue
+import atexit
+import runpy
+import select
+import signal
+import tempfile
+import threading
+import traceback
+import subprocess
+
+# "pool" forks snippets from pre-warmed worker servers; "subprocess" starts a
+# fresh interpreter for every snippet
+CODE_EXECUTOR = os.getenv("CODE_EXECUTOR", "pool").lower()
+
+# Worker servers, i.e. how many snippets can run at once from warm processes.
+# Further concurrent snippets fall back to a plain subprocess.
+CODE_EXECUTOR_POOL_SIZE = int(os.getenv("CODE_EXECUTOR_POOL_SIZE", "2"))
+
+# Imported once by each worker server, so forked snippets start with them loaded
+PRELOAD_MODULES = (
+    "json",
+    "servers.code_executor",
+    "httpx",
+    "servers.mcp_client",
+    "servers.alphavantage",
+    "servers.alphavantage.validators",
+)
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Extra seconds a worker server gets past a snippet's timeout to report back;
+# a server that misses this is killed and replaced
+SERVER_GRACE = 5.0
+
+# Executors tell the code they run where emit() should write through this variable
+RESULT_PATH_ENV = "CODE_RESULT_PATH"
+
+# Result files live in shared memory where the system has it
+RESULT_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def emit(value):
+    """
+    Hand a result to the pipeline.
+
+    The value is written as one line of JSON to the executor's result
+    channel, so stdout stays free for logs. NumPy arrays and scalars become
+    lists and numbers, other objects their str(). Only data crosses back to
+    the pipeline: nothing the snippet defines runs in the pipeline's process.
+    Call it once per result. Outside the executor the value is printed as
+    JSON instead.
+    """
+    path = os.environ.get(RESULT_PATH_ENV)
+    if not path:
+        print(json.dumps(value, indent=2, default=_jsonable))
+        return
+    line = json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_jsonable)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def _jsonable(value):
+    """json.dumps fallback for NumPy arrays and scalars, sets, dates and the like."""
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    return str(value)
+
+
+def dump_results(results: list) -> str:
+    """Compact JSON for emitted results: the value itself if there is one, else the list."""
+    value = results[0] if len(results) == 1 else results
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=_jsonable)
+
+
+def _result_channel(env: dict):
+    """Create a result file for one run. Returns (path, env for the run)."""
+    fd, path = tempfile.mkstemp(suffix=".results", dir=RESULT_DIR)
+    os.close(fd)
+    env = dict(os.environ) if env is None else dict(env)
+    env[RESULT_PATH_ENV] = path
+    return path, env
+
+
+def _read_results(path: str):
+    """
+    Values emitted during a run, in order.
+
+    Returns (results, problems): problems is text for the run's stderr about
+    results that could not be read, e.g. a line cut short when the run was
+    killed mid-write.
+    """
+    results = []
+    problems = []
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    results.append(json.loads(line))
+                except ValueError as e:
+                    problems.append(f"emit(): result {number} could not be decoded ({e})")
+    except OSError as e:
+        problems.append(f"emit(): results could not be read ({e})")
+    return results, "".join(problem + "\n" for problem in problems)
+
+
+def _finished(stdout: str, stderr: str, returncode: int, result_path: str) -> dict:
+    """Result dict for a run that ran to completion."""
+    results, problems = _read_results(result_path)
+    return {
+        "stdout": stdout,
+        "stderr": stderr + problems,
+        "returncode": returncode,
+        "success": returncode == 0,
+        "results": results
+    }
+
+
+def _timed_out(timeout: float, result_path: str) -> dict:
+    """Result dict for a run killed at its timeout, with what it emitted before then."""
+    results, problems = _read_results(result_path)
+    return {
+        "stdout": "",
+        "stderr": f"Execution timed out after {timeout:.0f} seconds" + ("\n" + problems if problems else ""),
+        "returncode": -1,
+        "success": False,
+        "results": results
+    }
+
+
+def _write_script(code: str, working_dir: str) -> str:
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False, dir=working_dir) as f:
+        f.write(code)
+        return f.name
+
+
+def _unlink(*paths):
+    for path in paths:
+        if path:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+
+
+class SubprocessExecutor:
+    """Run each snippet with a fresh `python <file>` subprocess."""
+
+    def run(self, code: str, working_dir: str, timeout: float, env: dict = None) -> dict:
+        temp_file = result_path = None
+        try:
+            temp_file = _write_script(code, working_dir)
+            result_path, env = _result_channel(env)
+            result = subprocess.run(
+                [sys.executable, temp_file],
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=working_dir,
+                env=env
+            )
+            return _finished(result.stdout, result.stderr, result.returncode, result_path)
+        except subprocess.TimeoutExpired:
+            return _timed_out(timeout, result_path)
+        finally:
+            _unlink(temp_file, result_path)
+
+    def close(self):
+        pass
+
+
+# ============================================================================
+# Worker server (runs in its own process: python -m servers.code_executor)
+# ============================================================================
+
+def _run_script(script: str, working_dir: str, env: dict, stdout_path: str, stderr_path: str) -> int:
+    """Run a script file the way `python <script>` would, with output going to the given files."""
+    with open(stdout_path, "wb") as out, open(stderr_path, "wb") as err:
+        os.dup2(out.fileno(), 1)
+        os.dup2(err.fileno(), 2)
+
+    os.chdir(working_dir)
+    os.environ.clear()
+    os.environ.update(env)
+    sys.path[0] = os.path.dirname(script)
+    sys.argv = [script]
+
+    returncode = 0
+    try:
+        runpy.run_path(script, run_name="__main__")
+    except SystemExit as e:
+        if e.code is None:
+            returncode = 0
+        elif isinstance(e.code, int):
+            returncode = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except BaseException as e:
+        # Same report as the interpreter's, without the runpy frames
+        tb = e.__traceback__
+        while tb is not None and tb.tb_frame.f_code.co_filename != script:
+            tb = tb.tb_next
+        traceback.print_exception(type(e), e, tb or e.__traceback__)
+        returncode = 1
+
+    try:
+        atexit._run_exitfuncs()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return returncode
+
+
+def serve():
+    """
+    Worker server loop.
+
+    Reads one JSON job per line on stdin, forks a child to run it and replies
+    {"returncode": ..., "timed_out": ...} once the child is done. The server
+    enforces the job's timeout itself: the child is killed while it is still
+    unreaped, so the signal can never reach a process that reused its pid.
+    """
+    # Keep the protocol pipes for ourselves; anything printed goes to stderr
+    requests = os.fdopen(os.dup(0), "r", encoding="utf-8")
+    replies = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    devnull = os.open(os.devnull, os.O_RDONLY)
+    os.dup2(devnull, 0)
+    os.dup2(2, 1)
+
+    for module in PRELOAD_MODULES:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+
+    def reply(message: dict):
+        replies.write(json.dumps(message) + "\n")
+        replies.flush()
+
+    running = {"pid": None, "killed": False}
+
+    def on_timeout(signum, frame):
+        if running["pid"] is not None:
+            running["killed"] = True
+            try:
+                os.kill(running["pid"], signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGALRM, on_timeout)
+
+    for line in requests:
+        job = json.loads(line)
+        timeout = job.pop("timeout")
+        pid = os.fork()
+        if pid == 0:
+            requests.close()
+            replies.close()
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGALRM, signal.SIG_DFL)
+            os._exit(_run_script(**job))
+
+        running.update(pid=pid, killed=False)
+        signal.setitimer(signal.ITIMER_REAL, max(timeout, 0.001))
+        if hasattr(os, "waitid"):
+            # Wait for the exit without reaping, so the pid stays ours until the timer is off
+            os.waitid(os.P_PID, pid, os.WEXITED | os.WNOWAIT)
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            running["pid"] = None
+            _, status = os.waitpid(pid, 0)
+        else:
+            _, status = os.waitpid(pid, 0)
+            running["pid"] = None
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+        # The timer may fire as the child exits on its own; only a kill that took counts
+        timed_out = running["killed"] and os.WIFSIGNALED(status) and os.WTERMSIG(status) == signal.SIGKILL
+        reply({"returncode": os.waitstatus_to_exitcode(status), "timed_out": timed_out})
+
+
+# ============================================================================
+# Pool (runs in the pipeline's process)
+# ============================================================================
+
+class _WorkerServer:
+    """Handle on one worker server process."""
+
+    def __init__(self):
+        # Its own session, so killing the server's process group also stops a running snippet
+        self.process = subprocess.Popen(
+            [sys.executable, "-m", "servers.code_executor"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            cwd=PROJECT_DIR,
+            bufsize=0,
+            start_new_session=True
+        )
+        self._buffer = b""
+
+    def alive(self) -> bool:
+        return self.process.poll() is None
+
+    def _send(self, job: dict):
+        data = (json.dumps(job) + "\n").encode("utf-8")
+        while data:
+            written = os.write(self.process.stdin.fileno(), data)
+            data = data[written:]
+
+    def _reply(self, timeout: float = None):
+        """
+        Next reply from the server, or None if none arrives within timeout.
+
+        Reads the pipe's file descriptor into our own line buffer, so select()
+        never waits on data that is already buffered.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        fd = self.process.stdout.fileno()
+        while b"\n" not in self._buffer:
+            if deadline is not None:
+                ready, _, _ = select.select([fd], [], [], max(deadline - time.monotonic(), 0))
+                if not ready:
+                    return None
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                raise EOFError("worker server exited")
+            self._buffer += chunk
+        line, _, self._buffer = self._buffer.partition(b"\n")
+        return json.loads(line)
+
+    def run(self, job: dict, timeout: float):
+        """Run a job; returns its return code, or None if it timed out (the server kills it)."""
+        self._send({**job, "timeout": timeout})
+        reply = self._reply(timeout + SERVER_GRACE)
+        if reply is None:
+            # The server itself is stuck; take it down along with its snippet
+            self.kill()
+            return None
+        if reply["timed_out"]:
+            return None
+        return reply["returncode"]
+
+    def kill(self):
+        try:
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            pass
+        self.process.wait()
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+
+class WorkerPoolExecutor:
+    """
+    Run each snippet in a process forked from a pre-warmed worker server.
+
+    Worker servers import PRELOAD_MODULES once at startup. Every snippet
+    still gets a fresh process of its own (a fork of the server, discarded
+    after the run), so isolation and timeouts match SubprocessExecutor.
+    Configuration read at import time (e.g. MCP_* settings) is taken from
+    the environment the pool was started with.
+    """
+
+    def __init__(self, size: int = CODE_EXECUTOR_POOL_SIZE):
+        self.servers = queue.Queue()
+        self.fallback = SubprocessExecutor()
+        for _ in range(max(size, 1)):
+            self.servers.put(_WorkerServer())
+
+    def run(self, code: str, working_dir: str, timeout: float, env: dict = None) -> dict:
+        try:
+            server = self.servers.get_nowait()
+        except queue.Empty:
+            return self.fallback.run(code, working_dir, timeout, env)
+
+        script = stdout_path = stderr_path = result_path = None
+        try:
+            if not server.alive():
+                server = _WorkerServer()
+            script = _write_script(code, working_dir)
+            result_path, env = _result_channel(env)
+            stdout_fd, stdout_path = tempfile.mkstemp(suffix=".out")
+            stderr_fd, stderr_path = tempfile.mkstemp(suffix=".err")
+            os.close(stdout_fd)
+            os.close(stderr_fd)
+
+            returncode = server.run({
+                "script": script,
+                "working_dir": working_dir,
+                "env": env,
+                "stdout_path": stdout_path,
+                "stderr_path": stderr_path,
+            }, timeout)
+            if returncode is None:
+                return _timed_out(timeout, result_path)
+
+            with open(stdout_path, "r", encoding="utf-8", errors="replace") as f:
+                stdout = f.read()
+            with open(stderr_path, "r", encoding="utf-8", errors="replace") as f:
+                stderr = f.read()
+            return _finished(stdout, stderr, returncode, result_path)
+        except (EOFError, OSError, ValueError):
+            # The worker server died mid-run; replace it and run this snippet the plain way
+            server.close()
+            server = _WorkerServer()
+            return self.fallback.run(code, working_dir, timeout, env)
+        finally:
+            self.servers.put(server)
+            _unlink(script, stdout_path, stderr_path, result_path)
+
+    def close(self):
+        while True:
+            try:
+                server = self.servers.get_nowait()
+            except queue.Empty:
+                break
+            server.close()
+
+
+def get_executor():
+    """Return the process-wide executor for CODE_EXECUTOR, starting it on first use."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is None:
+            if CODE_EXECUTOR == "pool" and hasattr(os, "fork"):
+                _executor = WorkerPoolExecutor()
+            else:
+                if CODE_EXECUTOR == "pool":
+                    print("Warning: the worker pool needs os.fork; using subprocess execution")
+                _executor = SubprocessExecutor()
+        return _executor
+
+
+def close_executor():
+    """Stop the process-wide executor's worker servers."""
+    global _executor
+
+    with _executor_lock:
+        if _executor is not None:
+            _executor.close()
+            _executor = None
+
+
+if __name__ == "__main__":
+    serve()
+else:
+    atexit.register(close_executor)
@@ -0,0 +1,288 @@
+"""
+Template code generation for single-call queries
+Fills the standard "call one tool, emit the result" script from parameters
+extracted from the query, so simple lookups need no Coder LLM call
+"""
+
+import re
+import json
+
+try:
+    from servers.alphavantage import validators
+except ImportError:  # imported from inside servers/
+    from alphavantage import validators
+
+# Queries that ask for more than one call's raw output go to the Coder LLM
+COMPUTATION_PATTERN = re.compile(
+    r"\b(compare|comparison|versus|vs\.?|average|mean|median|calculate|compute|"
+    r"difference|change|growth|return|percent|percentage|highest|lowest|max(imum)?|minimum|"
+    r"trend|correlat\w*|sum|total|rank|sort|plot|chart|between|each|every|"
+    r"last \d+|past \d+|first \d+|top \d+)\b",
+    re.IGNORECASE,
+)
+
+# Company names that users commonly write instead of tickers
+COMPANY_SYMBOLS = {
+    "apple": "AAPL", "microsoft": "MSFT", "tesla": "TSLA", "nvidia": "NVDA",
+    "amazon": "AMZN", "google": "GOOGL", "alphabet": "GOOGL", "meta": "META",
+    "facebook": "META", "netflix": "NFLX", "ibm": "IBM", "intel": "INTC",
+    "amd": "AMD", "oracle": "ORCL", "salesforce": "CRM", "adobe": "ADBE",
+    "walmart": "WMT", "disney": "DIS", "coca-cola": "KO", "coca cola": "KO",
+    "pepsi": "PEP", "pepsico": "PEP", "boeing": "BA", "visa": "V",
+    "mastercard": "MA", "jpmorgan": "JPM", "berkshire": "BRK.B",
+    "exxon": "XOM", "chevron": "CVX", "pfizer": "PFE", "nike": "NKE",
+}
+
+# Upper-case words in queries that are not tickers
+NOT_SYMBOLS = frozenset((
+    "A", "I", "US", "USA", "UK", "EU", "CEO", "CFO", "EPS", "ETF", "ETFS", "IPO",
+    "GDP", "CPI", "API", "OHLC", "OHLCV", "FX", "YTD", "AM", "PM", "EST", "UTC",
+    "Q1", "Q2", "Q3", "Q4", "FY", "NYSE", "NASDAQ", "JSON", "CSV", "AI", "OK",
+    "USD", "EUR", "GBP", "JPY", "CNY", "CAD", "AUD", "CHF",
+))
+
+_TICKER = re.compile(r"\b[A-Z]{1,5}(?:\.[A-Z])?\b")
+_CURRENCY_PAIR = re.compile(r"\b([A-Z]{3})\s*(?:/|to|in|-)\s*([A-Z]{3})\b")
+_INTERVAL = re.compile(r"\b(1|5|15|30|60)\s*-?\s*min(?:ute)?s?\b", re.IGNORECASE)
+_INTERVAL_WORDS = {"hourly": "60min", "daily": "daily", "weekly": "weekly", "monthly": "monthly"}
+_QUARTER = re.compile(r"\b(?:Q([1-4])\s*(?:of\s+)?(?:FY\s*)?(\d{4})|(\d{4})\s*-?\s*Q([1-4]))\b", re.IGNORECASE)
+_ORDINAL_QUARTER = re.compile(r"\b(first|second|third|fourth)\s+quarter\s+(?:of\s+)?(\d{4})\b", re.IGNORECASE)
+_ORDINALS = {"first": 1, "second": 2, "third": 3, "fourth": 4}
+_DATE = re.compile(r"\b(\d{4}-\d{2}-\d{2})\b")
+_MONTH = re.compile(r"\b(\d{4}-\d{2})\b(?!-)")
+_PERIOD = re.compile(r"\b(\d{1,3})\s*-?\s*(?:day|period|bar|week|month)s?\b", re.IGNORECASE)
+
+# Values used when a required parameter has a conventional default
+DEFAULTS = {"series_type": "close"}
+
+# Frequencies and spans ("quarterly", "2 year", "next 12 months"). Each one a
+# query mentions must end up in a parameter (or the tool's name, as "daily" in
+# TIME_SERIES_DAILY); otherwise the template would silently use the default
+_UNIT = re.compile(
+    r"\b\d+[\s-]*(?:min(?:ute)?|hour|day|week|month|quarter|year)s?\b|"
+    r"\b(?:hourly|daily|weekly|monthly|quarterly|annual(?:ly)?|yearly|semi[\s-]*annual(?:ly)?|intraday)\b",
+    re.IGNORECASE
+)
+
+# Dates, months and years ("2024-01-05", "March 2024", "in 2023"), times
+# relative to now ("a year ago", "yesterday", "last year") and currencies
+# ("in EUR", "in euros"). Like _UNIT, each one a query mentions must end up
+# in a parameter, or the template would fetch today's data in the default
+# currency instead.
+_DATE_MENTION = re.compile(
+    r"\b\d{4}-\d{2}(?:-\d{2})?\b|\b(?:19|20)\d{2}\b|"
+    r"\b(?:january|february|march|april|june|july|august|september|october|november|december)\b|"
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sept?|oct|nov|dec)\.?\s+\d{1,2}(?:st|nd|rd|th)?\b",
+    re.IGNORECASE
+)
+_RELATIVE_TIME = re.compile(
+    r"\bago\b|\b(?:yesterday|tomorrow|ytd)\b|\byear[\s-]+to[\s-]+date\b|"
+    r"\b(?:last|past|previous|this|next|coming)\s+(?:year|quarter|month|week|day|session)s?\b",
+    re.IGNORECASE
+)
+_CURRENCY = re.compile(
+    r"\b(?:USD|EUR|GBP|JPY|CNY|CAD|AUD|CHF)\b|"
+    r"\b(?:[Ee]uros?|[Dd]ollars?|[Yy]en|[Pp]ounds? sterling|[Yy]uan|[Ff]rancs?)\b"
+)
+_MENTIONS = (_UNIT, _DATE_MENTION, _RELATIVE_TIME, _CURRENCY)
+
+
+def find_symbols(query: str, tool_names=()) -> list:
+    """Tickers mentioned in a query, by company name or as upper-case words, in order."""
+    found = []
+    lowered = query.lower()
+    for name, symbol in COMPANY_SYMBOLS.items():
+        position = re.search(rf"\b{re.escape(name)}\b", lowered)
+        if position:
+            found.append((position.start(), symbol))
+
+    excluded = NOT_SYMBOLS | {part for name in tool_names for part in name.split("_")}
+    for match in _TICKER.finditer(query):
+        word = match.group(0)
+        if word not in excluded:
+            found.append((match.start(), word))
+
+    symbols = []
+    for _, symbol in sorted(found):
+        if symbol not in symbols:
+            symbols.append(symbol)
+    return symbols
+
+
+def _quarter(query: str):
+    """(value, span) of a fiscal quarter in the query, or None."""
+    match = _QUARTER.search(query)
+    if match:
+        quarter, year = (match.group(1), match.group(2)) if match.group(1) else (match.group(4), match.group(3))
+        return f"{year}Q{quarter}", match.span()
+    match = _ORDINAL_QUARTER.search(query)
+    if match:
+        return f"{match.group(2)}Q{_ORDINALS[match.group(1).lower()]}", match.span()
+    return None
+
+
+def _interval(query: str):
+    """(value, span) of a bar interval in the query, or None."""
+    match = _INTERVAL.search(query)
+    if match:
+        return f"{match.group(1)}min", match.span()
+    for word, interval in _INTERVAL_WORDS.items():
+        match = re.search(rf"\b{word}\b", query, re.IGNORECASE)
+        if match:
+            return interval, match.span()
+    return None
+
+
+def _value_pattern(value: str):
+    """Regex for an enum value as a query would write it: "2year" as "2 year" or "2-years"."""
+    parts = re.findall(r"\d+|semi(?=annual)|[a-z]+", value.lower())
+    if not parts or "".join(parts) != value.lower():
+        return None
+    words = [r"min(?:ute)?" if part == "min" else re.escape(part) for part in parts]
+    return re.compile(r"\b" + r"[\s-]*".join(words) + r"(?:s|ly)?\b", re.IGNORECASE)
+
+
+def _enum_value(query: str, allowed):
+    """
+    The enum value a query names, as (value, span).
+
+    Returns None if it names none, or False if it names more than one.
+    """
+    found = {}
+    for value in allowed:
+        pattern = _value_pattern(str(value))
+        match = pattern.search(query) if pattern else None
+        if match:
+            found[value] = match.span()
+    if len(found) > 1:
+        return False
+    return next(iter(found.items()), None)
+
+
+def _overlaps(span, spans) -> bool:
+    return any(start < span[1] and span[0] < end for start, end in spans)
+
+
+def extract_params(query: str, tool_name: str, input_schema: dict, tool_names=()):
+    """
+    Build a tool's params dict from a query.
+
+    Every required parameter must be found in the query (or have a DEFAULTS
+    value); optional ones are only set when the query states them. Parameters
+    with an enum in the tool's validator rules take the value the query
+    names ("2 year" -> maturity="2year", "quarterly" -> interval="quarterly").
+
+    Returns:
+        dict of params, or None if a required parameter could not be extracted,
+        the query names more than one symbol or more than one value of an
+        enum, or it mentions a frequency or span ("12 months"), a date or
+        relative time ("2024-01-05", "a year ago") or a currency ("in EUR")
+        that no parameter took, which a default would silently override.
+    """
+    properties = input_schema.get("properties", {})
+    required = input_schema.get("required", [])
+    rules = validators.RULES.get(tool_name, ((), {}))[1]
+
+    # Candidate values, each with the part of the query it came from
+    values = {
+        "interval": _interval(query),
+        "quarter": _quarter(query),
+    }
+    for name, pattern in (("date", _DATE), ("month", _MONTH), ("time_period", _PERIOD)):
+        match = pattern.search(query)
+        if match:
+            value = int(match.group(1)) if name == "time_period" else match.group(1)
+            values[name] = (value, match.span())
+
+    # News takes a day as a time range ("IBM news from 2024-01-05")
+    if "date" in values and "time_from" in properties:
+        day, span = values["date"]
+        day = day.replace("-", "")
+        values["time_from"] = (f"{day}T0000", span)
+        values["time_to"] = (f"{day}T2359", span)
+
+    # Currency tools take a pair ("EUR/USD", "USD to JPY"); those codes are not tickers
+    pair = _CURRENCY_PAIR.search(query)
+    if pair and ({"from_currency", "from_symbol"} & set(properties)):
+        for name, group in (("from_currency", 1), ("to_currency", 2), ("from_symbol", 1), ("to_symbol", 2)):
+            values[name] = (pair.group(group), pair.span(group))
+        tool_names = tuple(tool_names) + pair.groups()
+
+    symbols = find_symbols(query, tool_names)
+    if len(symbols) > 1:
+        return None
+    if symbols:
+        values["symbol"] = values["tickers"] = (symbols[0], None)
+
+    for name in properties:
+        allowed = rules.get(name, {}).get("enum")
+        if not allowed:
+            continue
+        named = _enum_value(query, allowed)
+        if named is False:
+            return None
+        if named is not None:
+            values[name] = named
+
+    params = {}
+    used = []
+    for name in properties:
+        value, span = values.get(name) or (None, None)
+        if value is None and name in required:
+            value = DEFAULTS.get(name)
+            if value is None:
+                return None
+        if value is not None:
+            params[name] = value
+            if span is not None:
+                used.append(span)
+
+    name_words = set(tool_name.lower().split("_"))
+    for pattern in _MENTIONS:
+        for match in pattern.finditer(query):
+            words = set(re.findall(r"[a-z]+", match.group(0).lower()))
+            if not _overlaps(match.span(), used) and not (words and words <= name_words):
+                return None
+    return params
+
+
+def render_code(tool_name: str, params: dict) -> str:
+    """The standard single-call script, as the Coder prompt's example structure."""
+    return f'''from servers.alphavantage import {tool_name}
+from servers.code_executor import emit
+
+try:
+    result = {tool_name}({json.dumps(params)})
+
+    # Hand the raw result to the Parser Agent
+    emit(result)
+
+except Exception as e:
+    # Report the error the same way
+    emit({{"error": str(e)}})
+'''
+
+
+def template_code(query: str, tool_name: str, input_schema: dict, tool_names=()):
+    """
+    Generate the script for a single-call query without an LLM.
+
+    Returns:
+        (code, None) on success, or (None, reason) when the query needs the
+        Coder agent: it asks for a computation or several calls, a required
+        parameter is missing, it states something no parameter took (see
+        extract_params), or the params fail the tool's validator.
+    """
+    match = COMPUTATION_PATTERN.search(query)
+    if match:
+        return None, f'query asks for more than a lookup ("{match.group(0)}")'
+
+    params = extract_params(query, tool_name, input_schema, tool_names)
+    if params is None:
+        return None, "could not map the query onto the tool's parameters"
+
+    problems = validators.validate(tool_name, params)
+    if problems:
+        return None, "; ".join(f"{problem['parameter']} {problem['message']}" for problem in problems)
+
+    return render_code(tool_name, params), None
@@ -0,0 +1,171 @@
+"""
+Incremental decoding of CSV tool responses (datatype=csv)
+Parses line by line into typed column arrays or a lazy row iterator
+"""
+
+import csv
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Cell values Alpha Vantage uses for missing data
+_MISSING = frozenset(("", ".", "null", "None", "-"))
+
+
+def _iter_lines(text: str):
+    """Yield the lines of text one at a time, without splitting it all up front."""
+    start = 0
+    length = len(text)
+    while start < length:
+        end = text.find("\n", start)
+        end = length if end == -1 else end + 1
+        yield text[start:end]
+        start = end
+
+
+def _narrow(kind: str, value: str):
+    """
+    Parse a non-missing cell of a column currently typed as kind.
+
+    Returns (kind, value): the column's type after seeing this cell, which
+    only ever widens int -> float -> str, and the parsed value. Numbers with
+    leading zeros (e.g. CUSIPs, zip codes) are text.
+    """
+    if kind == "int":
+        digits = value[1:] if value[0] == "-" else value
+        if digits.isdigit():
+            if digits[0] == "0" and len(digits) > 1:
+                return "str", value
+            return "int", int(value)
+        kind = "float"
+    if kind == "float":
+        try:
+            return "float", float(value)
+        except ValueError:
+            pass
+    return "str", value
+
+
+def looks_like_csv(text) -> bool:
+    """Whether a payload is CSV text rather than JSON or a plain message."""
+    if not isinstance(text, str):
+        return False
+    first = next(_iter_lines(text.lstrip()), "")
+    return "," in first and first[0] not in '{["'
+
+
+def iter_rows(text: str):
+    """
+    Lazily yield each CSV record as a dict keyed by the header.
+
+    Numeric columns yield int or float and missing values become None; a
+    column that turns out to hold text yields strings from then on. Only
+    one record is materialized at a time.
+    """
+    reader = csv.reader(_iter_lines(text))
+    header = next(reader, None)
+    if header is None:
+        return
+    kinds = ["int"] * len(header)
+    for record in reader:
+        if not record:
+            continue
+        row = {}
+        for i, (name, value) in enumerate(zip(header, record)):
+            if value in _MISSING:
+                row[name] = None
+            elif kinds[i] == "str":
+                row[name] = value
+            else:
+                kinds[i], row[name] = _narrow(kinds[i], value)
+        yield row
+
+
+def _format_number(number) -> str:
+    if number != number:  # NaN
+        return ""
+    return str(number)
+
+
+class _Column:
+    """
+    A column that narrows its type while rows stream in.
+
+    Starts as int64, widens to float64 on the first fractional or missing
+    value, and falls back to strings on the first non-numeric value (missing
+    values are then kept as the text the server sent). Numbers
+    are kept in array.array, which stores them unboxed at 8 bytes each.
+    """
+
+    def __init__(self):
+        self.kind = "int"
+        self.values = array("q")
+
+    def append(self, value: str):
+        if self.kind == "str":
+            self.values.append(value)
+            return
+
+        if value in _MISSING:
+            if self.kind == "int":
+                self._widen()
+            self.values.append(float("nan"))
+            return
+
+        kind, parsed = _narrow(self.kind, value)
+        if kind != self.kind:
+            if kind == "float":
+                self._widen()
+            else:
+                # Not a numeric column after all; values parsed so far go back to text
+                self.kind = "str"
+                self.values = [_format_number(number) for number in self.values]
+        self.values.append(parsed)
+
+    def _widen(self):
+        self.kind = "float"
+        self.values = array("d", self.values)
+
+    def finish(self):
+        if self.kind == "str":
+            return self.values
+        if np is not None:
+            return np.frombuffer(self.values, dtype=np.int64 if self.kind == "int" else np.float64)
+        return self.values
+
+
+def to_columns(text: str) -> dict:
+    """
+    Parse CSV text into one typed array per column.
+
+    Returns:
+        dict: {
+            "header": column names in file order,
+            "rows": number of records,
+            "columns": {name: values}
+        }
+        Numeric columns are int64 or float64 NumPy arrays (array.array when
+        NumPy is not installed) with NaN for missing values; other columns
+        are lists of strings. Rows keep the order the server sent them in.
+    """
+    reader = csv.reader(_iter_lines(text))
+    header = next(reader, None) or []
+    columns = [_Column() for _ in header]
+    count = 0
+    for record in reader:
+        if not record:
+            continue
+        if len(record) < len(columns):
+            record += [""] * (len(columns) - len(record))
+        for column, value in zip(columns, record):
+            column.append(value)
+        count += 1
+
+    return {
+        "header": header,
+        "rows": count,
+        "columns": {name: column.finish() for name, column in zip(header, columns)},
+    }
@@ -6,12 +6,20 @@ This creates a file for each tool following the code execution pattern.
 
 import sys
 import os
+import re
+import json
 from pathlib import Path
 
-from mcp_client import list_available_tools, ALPHA_VANTAGE_API_KEY
+from mcp_client import load_tool_manifest, ALPHA_VANTAGE_API_KEY, MCP_MANIFEST_PATH
+from tool_manifest import file_hash
+from tool_registry import INTERFACES_VERSION
 
 ALPHAVANTAGE_DIR = Path("alphavantage")
 
+# Tool files are named after the tool and import the client like this
+GENERATED_FILE_NAME = re.compile(r"^[A-Z][A-Z0-9_]*\.py$")
+GENERATED_MARKER = "from servers.mcp_client import call_mcp_tool"
+
 
 def generate_tool_file(tool: dict) -> str:
     """Generate Python code for a single tool."""
@@ -35,7 +43,7 @@ def generate_tool_file(tool: dict) -> str:
     params_doc = "\n".join(param_docs) if param_docs else "            No parameters required"
 
     code = f'''
-from servers.mcp_client import call_mcp_tool
+from servers.mcp_client import call_mcp_tool, call_tool_async
 
 
 def {tool_name}(params: dict = None) -> dict:
@@ -54,6 +62,17 @@ def {tool_name}(params: dict = None) -> dict:
     return call_mcp_tool("{tool_name}", params)
 
 
+async def {tool_name}_async(params: dict = None) -> dict:
+    """
+    Awaitable version of {tool_name}. Takes the same parameters.
+
+    Use it with asyncio.gather to run several tool calls concurrently.
+    """
+    if params is None:
+        params = {{}}
+    return await call_tool_async("{tool_name}", params)
+
+
 # Example usage (if run directly):
 if __name__ == "__main__":
     import json
@@ -68,15 +87,17 @@ if __name__ == "__main__":
 
 
 def generate_index_file(tools: list) -> str:
-    """Generate __init__.py that exports all tools."""
+    """Generate __init__.py that exports all tools, importing each one on first use."""
     
-    imports = []
+    modules = []
     exports = []
     
     for tool in tools:
         tool_name = tool.get("name", "unknown")
-        imports.append(f"from .{tool_name} import {tool_name}")
+        modules.append(f'    "{tool_name}": "{tool_name}",')
+        modules.append(f'    "{tool_name}_async": "{tool_name}",')
         exports.append(f'    "{tool_name}",')
+        exports.append(f'    "{tool_name}_async",')
     
     code = f'''"""
 Alpha Vantage MCP Tools
@@ -85,18 +106,422 @@ All available financial data tools from Alpha Vantage.
 Usage:
     from alphavantage import TIME_SERIES_DAILY
     result = TIME_SERIES_DAILY({{"symbol": "NVDA"}})
+
+Every tool also has an awaitable TOOL_async variant; the same functions are
+available under their plain names in the alphavantage.aio namespace.
+
+Tool modules are imported on first access, so using one tool does not load
+the other modules.
+"""
+
+import os
+import sys
+import types
+import importlib
+
+# With MCP_COMPACT_TOOLS=1, tools are served from the single-module table in
+# alphavantage.compact instead of importing one module per tool
+_COMPACT = os.getenv("MCP_COMPACT_TOOLS", "").lower() in ("1", "true", "yes")
+
+# Exported name -> module defining it
+_MODULES = {{
+{chr(10).join(modules)}
+}}
+
+__all__ = [
+{chr(10).join(exports)}
+]
+
+
+def _bind(namespace: dict, module_name: str, module):
+    """Expose a tool module's functions as package attributes."""
+    for name in (module_name, f"{{module_name}}_async"):
+        namespace[name] = getattr(module, name)
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    if _COMPACT:
+        compact = importlib.import_module(f"{{__name__}}.compact")
+        globals()[name] = compact.get_tool(name)
+        return globals()[name]
+    module = importlib.import_module(f"{{__name__}}.{{module_name}}")
+    _bind(globals(), module_name, module)
+    return globals()[name]
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+class _LazyPackage(types.ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a tool module binds it on the package under the tool's
+        # own name; keep the tool function there instead
+        if isinstance(value, types.ModuleType) and _MODULES.get(name) == name:
+            _bind(self.__dict__, name, value)
+        else:
+            super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _LazyPackage
+'''
+    
+    return code
+
+
+def generate_aio_file(tools: list) -> str:
+    """Generate aio/__init__.py that exports the async variant of every tool."""
+    
+    modules = []
+    exports = []
+    
+    for tool in tools:
+        tool_name = tool.get("name", "unknown")
+        modules.append(f'    "{tool_name}": "{tool_name}",')
+        exports.append(f'    "{tool_name}",')
+    
+    code = f'''"""
+Alpha Vantage MCP Tools (async)
+Awaitable versions of all Alpha Vantage tools, under their plain names.
+
+Usage:
+    import asyncio
+    from alphavantage import aio
+
+    async def main():
+        quote, overview = await asyncio.gather(
+            aio.GLOBAL_QUOTE({{"symbol": "NVDA"}}),
+            aio.COMPANY_OVERVIEW({{"symbol": "NVDA"}}),
+        )
 """
 
-{chr(10).join(imports)}
+import importlib
+
+# Exported name -> module defining its TOOL_async function
+_MODULES = {{
+{chr(10).join(modules)}
+}}
 
 __all__ = [
 {chr(10).join(exports)}
 ]
+
+
+def __getattr__(name):
+    module_name = _MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+    # Resolve through the parent package so its bindings stay consistent
+    package = importlib.import_module(__name__.rpartition(".")[0])
+    value = getattr(package, f"{{module_name}}_async")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 '''
     
     return code
 
 
+def _py_literal(value) -> str:
+    """Python source for a value built from tuples, dicts and strings, using double quotes."""
+    if isinstance(value, tuple):
+        items = ", ".join(_py_literal(item) for item in value)
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if isinstance(value, dict):
+        items = ", ".join(f"{_py_literal(k)}: {_py_literal(v)}" for k, v in value.items())
+        return f"{{{items}}}"
+    if isinstance(value, str):
+        return json.dumps(value, ensure_ascii=False)
+    return repr(value)
+
+
+def generate_compact_file(tools: list) -> str:
+    """Generate compact/__init__.py: every tool in one table plus a dispatcher."""
+    
+    entries = []
+    exports = []
+    
+    for tool in tools:
+        tool_name = tool.get("name", "unknown")
+        input_schema = tool.get("inputSchema", {})
+        properties = input_schema.get("properties", {})
+        required = [name for name in properties if name in input_schema.get("required", [])]
+        optional = [name for name in properties if name not in required]
+        types = {name: info.get("type", "any") for name, info in properties.items()}
+        description = tool.get("description", "No description available")
+        
+        entry = _py_literal((tuple(required), tuple(optional), types, description))
+        entries.append(f'    "{tool_name}": {entry},')
+        exports.append(f'    "{tool_name}",')
+        exports.append(f'    "{tool_name}_async",')
+    
+    code = f'''"""
+Alpha Vantage MCP Tools (compact)
+All tools from one table instead of one module per tool.
+
+Usage:
+    from alphavantage.compact import TIME_SERIES_DAILY, GLOBAL_QUOTE_async
+    result = TIME_SERIES_DAILY({{"symbol": "NVDA"}})
+
+The functions behave like the per-tool modules but are built on first
+access, so startup imports a single module. The per-tool files remain the
+place to read full parameter documentation.
+"""
+
+from servers.mcp_client import call_mcp_tool, call_tool_async
+
+# Tool name -> (required parameters, optional parameters, parameter types, description)
+TOOLS = {{
+{chr(10).join(entries)}
+}}
+
+__all__ = [
+{chr(10).join(exports)}
+]
+
+
+def _docstring(tool_name: str) -> str:
+    required, optional, types, description = TOOLS[tool_name]
+    params = [f"{{name}} (required, {{types[name]}})" for name in required]
+    params += [f"{{name}} (optional, {{types[name]}})" for name in optional]
+    lines = "\\n".join(f"    {{param}}" for param in params) or "    No parameters required"
+    return f"{{description}}\\n\\nParameters (pass as a dict):\\n{{lines}}"
+
+
+def get_tool(name: str):
+    """
+    Return the function for a tool, e.g. "GLOBAL_QUOTE" or "GLOBAL_QUOTE_async".
+
+    Raises:
+        AttributeError: if there is no such tool.
+    """
+    asynchronous = name.endswith("_async")
+    tool_name = name[:-len("_async")] if asynchronous else name
+    if tool_name not in TOOLS:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")
+
+    if asynchronous:
+        async def tool(params: dict = None) -> dict:
+            if params is None:
+                params = {{}}
+            return await call_tool_async(tool_name, params)
+    else:
+        def tool(params: dict = None) -> dict:
+            if params is None:
+                params = {{}}
+            return call_mcp_tool(tool_name, params)
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__module__ = __name__
+    tool.__doc__ = _docstring(tool_name)
+    return tool
+
+
+def __getattr__(name):
+    tool = get_tool(name)
+    globals()[name] = tool
+    return tool
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+'''
+    
+    return code
+
+
+# Value lists in parameter descriptions, e.g. "Strings json and csv are accepted"
+# or "The following values are supported: 1min, 5min, 15min"
+ENUM_PATTERNS = [
+    re.compile(r"Strings (.+?) are accepted"),
+    re.compile(r"(?:values|types) are supported: ([^.]+)"),
+    re.compile(r"Supported: ([^.]+)"),
+]
+
+# Formats named in parameter descriptions -> (regular expression, label)
+FORMAT_PATTERNS = [
+    ("YYYYQM", r"\d{4}Q[1-4]", "YYYYQM (e.g. 2024Q1)"),
+    ("YYYYMMDDTHHMM", r"\d{8}T\d{4}", "YYYYMMDDTHHMM (e.g. 20220410T0130)"),
+    ("YYYY-MM-DD", r"\d{4}-\d{2}-\d{2}", "YYYY-MM-DD"),
+    ("YYYY-MM", r"\d{4}-(0[1-9]|1[0-2])", "YYYY-MM (e.g. 2009-01)"),
+]
+
+# Numeric ranges in parameter descriptions
+RANGE_PATTERN = re.compile(r"Integers (\d+)\s*-\s*(\d+) are accepted")
+
+
+def parameter_rule(info: dict) -> dict:
+    """
+    Validation rule for one inputSchema property.
+
+    Uses the schema's own type, enum, pattern and bounds, and otherwise
+    recovers allowed values, formats and ranges that are only stated in the
+    description.
+    """
+    rule = {}
+    description = info.get("description", "")
+    
+    if info.get("type"):
+        rule["type"] = info["type"]
+    
+    if info.get("enum"):
+        rule["enum"] = tuple(info["enum"])
+    else:
+        for pattern in ENUM_PATTERNS:
+            match = pattern.search(description)
+            if match:
+                values = [v for v in re.split(r",\s*(?:and\s+|or\s+)?|\s+(?:and|or)\s+", match.group(1).strip()) if v]
+                if len(values) > 1 and all(re.fullmatch(r"[\w.-]+", v) for v in values):
+                    rule["enum"] = tuple(values)
+                break
+    
+    if info.get("pattern"):
+        rule["pattern"] = info["pattern"]
+    else:
+        for marker, regex, label in FORMAT_PATTERNS:
+            if marker in description:
+                rule["pattern"] = regex
+                rule["format"] = label
+                break
+    
+    for bound in ("minimum", "maximum"):
+        if bound in info:
+            rule[bound] = info[bound]
+    match = RANGE_PATTERN.search(description)
+    if match:
+        rule.setdefault("minimum", int(match.group(1)))
+        rule.setdefault("maximum", int(match.group(2)))
+    elif "Positive integers are accepted" in description:
+        rule.setdefault("minimum", 1)
+    
+    return rule
+
+
+def generate_validators_file(tools: list) -> str:
+    """Generate validators/__init__.py: parameter rules for every tool, compiled on first use."""
+    
+    entries = []
+    
+    for tool in tools:
+        tool_name = tool.get("name", "unknown")
+        input_schema = tool.get("inputSchema", {})
+        properties = input_schema.get("properties", {})
+        required = tuple(name for name in properties if name in input_schema.get("required", []))
+        
+        rules = []
+        for name, info in properties.items():
+            rules.append(f"        {_py_literal(name)}: {_py_literal(parameter_rule(info))},")
+        rules_code = "{\n" + "\n".join(rules) + "\n    }" if rules else "{}"
+        entries.append(f'    "{tool_name}": ({_py_literal(required)}, {rules_code}),')
+    
+    code = f'''"""
+Alpha Vantage MCP Tools (parameter validators)
+Parameter rules for every tool, generated from each tool's inputSchema.
+
+Usage:
+    from alphavantage.validators import validate
+    problems = validate("EARNINGS_CALL_TRANSCRIPT", {{"symbol": "IBM", "quarter": "2025-Q3"}})
+    # [{{"parameter": "quarter", "message": "must match the YYYYQM (e.g. 2024Q1) format", ...}}]
+
+mcp_client runs these checks before every call, so invalid calls fail
+locally with a structured error instead of a round-trip to the server.
+"""
+
+try:
+    from servers.param_validation import compile_validator
+except ImportError:
+    from param_validation import compile_validator
+
+# Tool name -> (required parameters, {{parameter: rule}})
+RULES = {{
+{chr(10).join(entries)}
+}}
+
+_validators = {{}}
+
+
+def validate(tool_name: str, params: dict) -> list:
+    """
+    Check params against the tool's rules.
+
+    Returns a list of {{"parameter", "message", "value"}} problems; empty if the
+    call is valid or the tool has no rules.
+    """
+    validator = _validators.get(tool_name)
+    if validator is None:
+        if tool_name not in RULES:
+            return []
+        validator = compile_validator(*RULES[tool_name])
+        _validators[tool_name] = validator
+    return validator(params)
+'''
+    
+    return code
+
+
+# Example values in parameter descriptions, e.g. 'Example: "IBM"' or 'For example: symbol=IBM'
+EXAMPLE_PATTERN = re.compile(r'(?:Example|e\.g\.)[:,]?\s*(?:\w+=)?"?([^",;\s)]+)', re.IGNORECASE)
+
+
+def example_value(param_name: str, param_info: dict):
+    """A plausible value for a parameter, from its description or allowed values."""
+    rule = parameter_rule(param_info)
+    match = EXAMPLE_PATTERN.search(param_info.get("description", ""))
+    if match:
+        value = match.group(1).rstrip(".")
+    elif rule.get("enum"):
+        value = rule["enum"][0]
+    else:
+        return f"<{param_name}>"
+    if rule.get("type") == "integer" and value.isdigit():
+        return int(value)
+    return value
+
+
+def generate_interface(tool: dict) -> str:
+    """Interface summary of a tool, in the format the Reader agent produces."""
+    
+    tool_name = tool.get("name", "unknown")
+    description = tool.get("description", "").strip().split("\n")[0]
+    input_schema = tool.get("inputSchema", {})
+    properties = input_schema.get("properties", {})
+    required = input_schema.get("required", [])
+    
+    lines = [f"TOOL: {tool_name}", f"DESCRIPTION: {description}", "PARAMETERS:"]
+    example = {}
+    for param_name, param_info in properties.items():
+        param_type = param_info.get("type", "any")
+        param_desc = param_info.get("description", "")
+        is_required = "REQUIRED" if param_name in required else "OPTIONAL"
+        lines.append(f"  - {param_name} ({is_required}, {param_type}): {param_desc}")
+        if param_name in required:
+            example[param_name] = example_value(param_name, param_info)
+    if not properties:
+        lines.append("  (none)")
+    lines.append(f"EXAMPLE_CALL: {tool_name}({json.dumps(example)})")
+    
+    return "\n".join(lines)
+
+
+def generate_interfaces_file(tools: list) -> str:
+    """Generate interfaces.json: each tool's interface summary and the hash of the file it describes."""
+    
+    interfaces = {
+        tool.get("name", "unknown"): {
+            "file_hash": file_hash(generate_tool_file(tool)),
+            "interface": generate_interface(tool),
+        }
+        for tool in tools
+    }
+    return json.dumps({"version": INTERFACES_VERSION, "tools": interfaces}, indent=2, ensure_ascii=False) + "\n"
+
+
 def generate_readme(tools: list) -> str:
     """Generate README with tool documentation."""
     
@@ -168,6 +593,24 @@ else:
     print(f"Error: {result['error']}")
 ```
 
+## Async Usage
+
+Every tool has an awaitable variant, either as `TOOL_async` or under its plain
+name in the `aio` namespace. Independent calls can then run concurrently:
+
+```python
+import asyncio
+from alphavantage import aio
+
+async def main():
+    quotes = await asyncio.gather(*[
+        aio.GLOBAL_QUOTE({"symbol": symbol})
+        for symbol in ["NVDA", "AMD", "INTC"]
+    ])
+
+asyncio.run(main())
+```
+
 ## Examples
 
 ### Get Daily Stock Data
@@ -205,54 +648,124 @@ See: https://www.anthropic.com/engineering/code-execution-with-mcp
     return readme
 
 
+def write_if_changed(path: Path, content: str) -> bool:
+    """Write content to path unless the file already holds exactly that.
+
+    Returns True if the file was written. Unchanged files keep their mtimes,
+    so .pyc caches and anything else keyed on them stay valid.
+    """
+    try:
+        with open(path, 'r') as f:
+            if f.read() == content:
+                return False
+    except FileNotFoundError:
+        pass
+    
+    with open(path, 'w') as f:
+        f.write(content)
+    return True
+
+
+def find_stale_tool_files(tools: list) -> list:
+    """Generated tool files in ALPHAVANTAGE_DIR for tools that are no longer listed."""
+    names = {tool.get("name") for tool in tools}
+    stale = []
+    for file_path in sorted(ALPHAVANTAGE_DIR.glob("*.py")):
+        if file_path.stem in names or not GENERATED_FILE_NAME.match(file_path.name):
+            continue
+        # Only remove files this generator wrote
+        with open(file_path, 'r') as f:
+            if GENERATED_MARKER in f.read():
+                stale.append(file_path)
+    return stale
+
+
 def main():
-    """Generate all tool files."""
+    """Generate all tool files.
+
+    Tools come from the manifest (see mcp_client.load_tool_manifest), which is
+    only re-fetched from the server when stale. Pass --refresh to force a check.
+    """
     
-    if not ALPHA_VANTAGE_API_KEY:
-        print("Error: ALPHA_VANTAGE_API_KEY environment variable not set")
-        print("Please create a .env file with:")
-        print("ALPHA_VANTAGE_API_KEY=your-key-here")
-        sys.exit(1)
+    refresh = True if "--refresh" in sys.argv[1:] else None
     
-    print("Fetching tools from Alpha Vantage MCP server...")
-    tools = list_available_tools()
+    print(f"Loading tool manifest ({MCP_MANIFEST_PATH})...")
+    try:
+        manifest = load_tool_manifest(refresh)
+    except Exception as e:
+        print(f"Error fetching tools: {e}")
+        if not ALPHA_VANTAGE_API_KEY:
+            print("Please create a .env file with:")
+            print("ALPHA_VANTAGE_API_KEY=your-key-here")
+        sys.exit(1)
     
-    if not tools or "error" in tools[0]:
-        print(f"Error fetching tools: {tools}")
+    tools = manifest["tools"]
+    if not tools:
+        print("Error fetching tools: the server returned no tools")
         sys.exit(1)
     
-    print(f"✓ Found {len(tools)} tools")
+    print(f"✓ Found {len(tools)} tools (manifest {manifest['hash'][:12]})")
     
     # Create alphavantage directory
     ALPHAVANTAGE_DIR.mkdir(exist_ok=True)
-    print(f"✓ Created {ALPHAVANTAGE_DIR}/ directory")
     
-    # Generate individual tool files
+    # Generate individual tool files, writing only those whose content changed
     print("\nGenerating tool files...")
-    for i, tool in enumerate(tools, 1):
+    added, changed = [], []
+    for tool in tools:
         tool_name = tool.get("name", "unknown")
-        print(f"  [{i}/{len(tools)}] {tool_name}")
-        
-        code = generate_tool_file(tool)
         file_path = ALPHAVANTAGE_DIR / f"{tool_name}.py"
+        existed = file_path.exists()
         
-        with open(file_path, 'w') as f:
-            f.write(code)
+        if write_if_changed(file_path, generate_tool_file(tool)):
+            (changed if existed else added).append(tool_name)
+    
+    # Remove wrappers for tools the server no longer lists
+    removed = []
+    for file_path in find_stale_tool_files(tools):
+        file_path.unlink()
+        removed.append(file_path.stem)
     
-    # Generate __init__.py for the package
-    init_file = ALPHAVANTAGE_DIR / "__init__.py"
-    with open(init_file, 'w') as f:
-        f.write(generate_index_file(tools))
-    print(f"\n✓ Generated {init_file}")
+    for label, names in (("+", added), ("~", changed), ("-", removed)):
+        for name in names:
+            print(f"  {label} {name}")
+    unchanged = len(tools) - len(added) - len(changed)
+    print(f"✓ {len(added)} added, {len(changed)} changed, {len(removed)} removed, {unchanged} unchanged")
+    
+    # Package modules and data generated from the whole tool list
+    aio_dir = ALPHAVANTAGE_DIR / "aio"
+    compact_dir = ALPHAVANTAGE_DIR / "compact"
+    validators_dir = ALPHAVANTAGE_DIR / "validators"
+    for directory in (aio_dir, compact_dir, validators_dir):
+        directory.mkdir(exist_ok=True)
+    artifacts = [
+        (ALPHAVANTAGE_DIR / "__init__.py", generate_index_file),
+        # The async namespace package
+        (aio_dir / "__init__.py", generate_aio_file),
+        # The single-module compact table
+        (compact_dir / "__init__.py", generate_compact_file),
+        # The parameter validators
+        (validators_dir / "__init__.py", generate_validators_file),
+        # The interface summaries the pipeline uses instead of the Reader agent
+        (ALPHAVANTAGE_DIR / "interfaces.json", generate_interfaces_file),
+        (ALPHAVANTAGE_DIR / "README.md", generate_readme),
+    ]
+    regenerated = []
+    for file_path, generate in artifacts:
+        if write_if_changed(file_path, generate(tools)):
+            regenerated.append(file_path)
+            print(f"✓ Generated {file_path}")
+        else:
+            print(f"  {file_path} unchanged")
     
-    # Generate README
-    readme_file = ALPHAVANTAGE_DIR / "README.md"
-    with open(readme_file, 'w') as f:
-        f.write(generate_readme(tools))
-    print(f"✓ Generated {readme_file}")
+    written = len(added) + len(changed) + len(regenerated)
+    if not (written or removed):
+        print("\n✓ Generated files are up to date")
+        return
     
     print(f"\n{'='*60}")
-    print(f"✓ Successfully generated {len(tools)} tool files!")
+    print(f"✓ Updated {len(added) + len(changed)} tool files and {len(regenerated)} package files, "
+          f"removed {len(removed)} tool files")
     print(f"{'='*60}")
     print("\nNext steps:")
     print("1. Try using a tool:")
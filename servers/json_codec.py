@@ -0,0 +1,66 @@
+"""
+JSON encoding/decoding for MCP payloads
+Uses orjson or msgspec when installed, the standard library otherwise
+"""
+
+import os
+import json
+
+# Force a backend with MCP_JSON_BACKEND=orjson|msgspec|json; by default the
+# fastest installed one is used
+_requested = os.getenv("MCP_JSON_BACKEND", "").lower()
+
+BACKEND = "json"
+_fast_loads = None
+_fast_dumps = None
+
+if _requested in ("", "orjson"):
+    try:
+        import orjson
+
+        BACKEND = "orjson"
+        _fast_loads = orjson.loads
+
+        def _fast_dumps(obj):
+            return orjson.dumps(obj).decode("utf-8")
+    except ImportError:
+        pass
+
+if BACKEND == "json" and _requested in ("", "msgspec"):
+    try:
+        import msgspec
+
+        BACKEND = "msgspec"
+        _fast_loads = msgspec.json.decode
+
+        def _fast_dumps(obj):
+            return msgspec.json.encode(obj).decode("utf-8")
+    except ImportError:
+        pass
+
+
+def loads(data):
+    """
+    Parse JSON from str or bytes.
+
+    Input the fast backend refuses (e.g. NaN literals, which the standard
+    library accepts) is retried with json.loads, so results match the
+    standard library. Raises json.JSONDecodeError for invalid JSON.
+    """
+    if _fast_loads is not None:
+        try:
+            return _fast_loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a compact JSON string."""
+    if _fast_dumps is not None:
+        try:
+            return _fast_dumps(obj)
+        except TypeError:
+            # e.g. non-string dict keys, which json.dumps coerces
+            pass
+    return json.dumps(obj, separators=(",", ":"))
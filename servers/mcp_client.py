@@ -5,8 +5,15 @@ Handles connection and communication with the Alpha Vantage MCP server
 
 import os
 import sys
+import copy
 import json
+import time
+import atexit
+import random
 import asyncio
+import sqlite3
+import itertools
+import threading
 from pathlib import Path
 
 # Load environment variables from .env file
@@ -23,15 +30,234 @@ except ImportError:
     print("Install with: pip install httpx")
     sys.exit(1)
 
+try:
+    from servers.rate_limiter import RateLimitExceeded, BucketStore, get_rate_limiter, configure_rate_limiter
+    from servers.response_cache import TTLCache, DiskCache, cache_key, ttl_for
+    from servers import json_codec, csv_decoder, tool_manifest
+    from servers.param_validation import describe_problems
+except ImportError:  # imported from inside servers/, e.g. by generate_tools.py
+    from rate_limiter import RateLimitExceeded, BucketStore, get_rate_limiter, configure_rate_limiter
+    from response_cache import TTLCache, DiskCache, cache_key, ttl_for
+    import json_codec
+    import csv_decoder
+    import tool_manifest
+    from param_validation import describe_problems
+
 # Get API key from environment
 ALPHA_VANTAGE_API_KEY = os.getenv('ALPHA_VANTAGE_API_KEY')
 
+# Client-side request budget per API key (unset or 0 disables that limit)
+ALPHA_VANTAGE_CALLS_PER_MINUTE = float(os.getenv("ALPHA_VANTAGE_CALLS_PER_MINUTE", "0"))
+ALPHA_VANTAGE_CALLS_PER_DAY = float(os.getenv("ALPHA_VANTAGE_CALLS_PER_DAY", "0"))
+
+# SQLite file holding that budget, so every process on the host (executor
+# processes, API workers) draws from the same buckets. Empty keeps a separate
+# budget per process. Opened lazily on first use.
+MCP_RATE_LIMIT_PATH = os.getenv(
+    "MCP_RATE_LIMIT_PATH",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "mcp_rate_limits.sqlite3")
+)
+
+_bucket_store = None
+
 # Server configuration - using HTTPS endpoint
 BASE_URL = "https://mcp.alphavantage.co"
 
+# Connection pool configuration (overridable per process via open_client)
+MCP_TIMEOUT = float(os.getenv("MCP_TIMEOUT", "30"))
+MCP_MAX_CONNECTIONS = int(os.getenv("MCP_MAX_CONNECTIONS", "20"))
+MCP_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("MCP_MAX_KEEPALIVE_CONNECTIONS", "10"))
+MCP_KEEPALIVE_EXPIRY = float(os.getenv("MCP_KEEPALIVE_EXPIRY", "30"))
+MCP_HTTP2 = os.getenv("MCP_HTTP2", "false").lower() in ("1", "true", "yes")
 
-async def list_tools_async():
-    """List all available tools from the Alpha Vantage MCP server."""
+# Retries for transient failures (connect/read errors, HTTP 5xx and 429),
+# with full-jitter exponential backoff between attempts
+MCP_MAX_RETRIES = int(os.getenv("MCP_MAX_RETRIES", "3"))
+MCP_RETRY_BASE_DELAY = float(os.getenv("MCP_RETRY_BASE_DELAY", "0.5"))
+MCP_RETRY_MAX_DELAY = float(os.getenv("MCP_RETRY_MAX_DELAY", "8"))
+
+# Default number of tool calls gather_tools keeps in flight at once
+MCP_GATHER_CONCURRENCY = int(os.getenv("MCP_GATHER_CONCURRENCY", "8"))
+
+# Maximum number of tools/call messages sent in one JSON-RPC batch POST
+MCP_BATCH_SIZE = int(os.getenv("MCP_BATCH_SIZE", "20"))
+
+# In-memory response cache (see response_cache.TOOL_TTLS for freshness policies)
+MCP_CACHE_ENABLED = os.getenv("MCP_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+MCP_CACHE_MAXSIZE = int(os.getenv("MCP_CACHE_MAXSIZE", "512"))
+
+_response_cache = TTLCache(maxsize=MCP_CACHE_MAXSIZE)
+
+# On-disk response cache shared by every process on the host (executor
+# subprocesses, API workers). Opened lazily on first use.
+MCP_DISK_CACHE_ENABLED = os.getenv("MCP_DISK_CACHE_ENABLED", "true").lower() in ("1", "true", "yes")
+MCP_DISK_CACHE_PATH = os.getenv(
+    "MCP_DISK_CACHE_PATH",
+    str(Path(__file__).resolve().parent.parent / ".cache" / "mcp_responses.sqlite3")
+)
+MCP_DISK_CACHE_MAX_MB = float(os.getenv("MCP_DISK_CACHE_MAX_MB", "512"))
+
+_disk_cache = None
+
+# Check call arguments against the generated per-tool rules before sending
+MCP_VALIDATE_PARAMS = os.getenv("MCP_VALIDATE_PARAMS", "true").lower() in ("1", "true", "yes")
+
+# Generated validators module (servers/alphavantage/validators), loaded on
+# first use; False once it is known to be unavailable
+_validators = None
+
+# Snapshot of tools/list, shipped next to the generated wrappers and
+# re-checked against the server once it is older than MCP_MANIFEST_MAX_AGE
+MCP_MANIFEST_PATH = os.getenv(
+    "MCP_MANIFEST_PATH",
+    str(Path(__file__).resolve().parent / "alphavantage" / "tools_manifest.json")
+)
+MCP_MANIFEST_MAX_AGE = float(os.getenv("MCP_MANIFEST_MAX_AGE", str(24 * 60 * 60)))
+
+# Tool calls currently on the wire, by cache key. Concurrent identical calls
+# in this process await the same request instead of sending their own; other
+# processes wait on a lease in the disk cache (see _fetch_shared).
+_inflight = {}
+
+# How often a process waiting on another process's identical call checks the disk cache
+MCP_INFLIGHT_POLL_INTERVAL = float(os.getenv("MCP_INFLIGHT_POLL_INTERVAL", "0.1"))
+
+# JSON-RPC request ids; unique per process so batched responses can be matched
+_request_ids = itertools.count(1)
+
+# Set to False once the server rejects a batch; later batches go out as single calls
+_batch_supported = True
+
+# Batch responses with these statuses mean the server does not take batches.
+# Other errors (bad key, throttling, outages) fail this batch only.
+_BATCH_UNSUPPORTED_STATUSES = (400, 404, 405, 501)
+
+# Process-wide pooled client. It lives on a single background event loop so
+# that sync callers and async callers on any other loop share one pool.
+_client = None
+_client_settings = {}
+
+_loop = None
+_loop_thread = None
+_loop_lock = threading.Lock()
+
+
+def _get_loop():
+    """Return the background client loop, starting its thread on first use."""
+    global _loop, _loop_thread
+
+    with _loop_lock:
+        if _loop is None or _loop.is_closed() or not _loop_thread.is_alive():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever,
+                name="mcp-client-loop",
+                daemon=True
+            )
+            _loop_thread.start()
+        return _loop
+
+
+def _on_client_loop() -> bool:
+    """Whether the caller is already running on the background client loop."""
+    try:
+        return asyncio.get_running_loop() is _loop
+    except RuntimeError:
+        return False
+
+
+def _run_sync(coro):
+    """Run a coroutine on the client loop and block until it finishes."""
+    if _on_client_loop():
+        coro.close()
+        raise RuntimeError("Synchronous MCP calls cannot be made from the client loop; await the async API instead")
+    return asyncio.run_coroutine_threadsafe(coro, _get_loop()).result()
+
+
+async def _run_async(coro):
+    """Await a coroutine on the client loop from whichever loop the caller is on."""
+    if _on_client_loop():
+        return await coro
+    return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, _get_loop()))
+
+
+def _build_client(settings: dict):
+    """Create a pooled AsyncClient from the given settings."""
+    http2 = settings.get("http2", MCP_HTTP2)
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            print("Warning: h2 package not installed. Falling back to HTTP/1.1.")
+            print("Install with: pip install 'httpx[http2]'")
+            http2 = False
+
+    limits = httpx.Limits(
+        max_connections=settings.get("max_connections", MCP_MAX_CONNECTIONS),
+        max_keepalive_connections=settings.get("max_keepalive_connections", MCP_MAX_KEEPALIVE_CONNECTIONS),
+        keepalive_expiry=settings.get("keepalive_expiry", MCP_KEEPALIVE_EXPIRY),
+    )
+    return httpx.AsyncClient(
+        base_url=BASE_URL,
+        timeout=settings.get("timeout", MCP_TIMEOUT),
+        limits=limits,
+        http2=http2,
+        headers={"Content-Type": "application/json"},
+    )
+
+
+async def _get_client():
+    """Return the shared pooled client. Must run on the client loop."""
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = _build_client(_client_settings)
+    return _client
+
+
+async def _open_client(settings: dict):
+    global _client_settings
+
+    if settings and settings != _client_settings:
+        await _close_client()
+        _client_settings = dict(settings)
+    await _get_client()
+
+
+async def _close_client():
+    global _client
+
+    client = _client
+    _client = None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+async def open_client_async(**settings):
+    """
+    Open the shared pooled client.
+
+    Accepts optional overrides for timeout, max_connections,
+    max_keepalive_connections, keepalive_expiry and http2. Calling it again
+    with new settings replaces the pool.
+    """
+    await _run_async(_open_client(settings))
+
+
+async def close_client_async():
+    """Close the shared pooled client and release its connections."""
+    if _loop is None or _loop.is_closed():
+        return
+    await _run_async(_close_client())
+
+
+async def _list_tools(etag: str = None):
+    """
+    Fetch tools/list from the server.
+
+    Returns (tools, etag). When etag is given it is sent as If-None-Match,
+    and tools is None if the server answers 304 Not Modified.
+    """
     if not ALPHA_VANTAGE_API_KEY:
         raise ValueError("ALPHA_VANTAGE_API_KEY environment variable not set")
 
@@ -39,43 +265,46 @@ async def list_tools_async():
         raise ValueError("Please replace placeholder with your actual Alpha Vantage API key in .env file")
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Make JSON-RPC request to list tools
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/list",
-                "params": {}
-            }
+        client = await _get_client()
 
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                json=payload,
-                params={"apikey": ALPHA_VANTAGE_API_KEY},
-                headers={"Content-Type": "application/json"}
-            )
-            response.raise_for_status()
+        # Make JSON-RPC request to list tools
+        payload = {
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "tools/list",
+            "params": {}
+        }
 
-            result = response.json()
+        response = await client.post(
+            "/mcp",
+            json=payload,
+            params={"apikey": ALPHA_VANTAGE_API_KEY},
+            headers={"If-None-Match": etag} if etag else None
+        )
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
 
-            if "error" in result:
-                raise ValueError(f"MCP Error: {result['error']}")
+        result = json_codec.loads(response.content)
 
-            # Extract tools from result
-            tools_data = result.get("result", {}).get("tools", [])
+        if "error" in result:
+            raise ValueError(f"MCP Error: {result['error']}")
 
-            # Convert to list of dicts for easier handling
-            tools = []
-            for tool in tools_data:
-                tool_dict = {
-                    "name": tool.get("name"),
-                    "description": tool.get("description"),
-                }
-                if "inputSchema" in tool:
-                    tool_dict["inputSchema"] = tool["inputSchema"]
-                tools.append(tool_dict)
+        # Extract tools from result
+        tools_data = result.get("result", {}).get("tools", [])
 
-            return tools
+        # Convert to list of dicts for easier handling
+        tools = []
+        for tool in tools_data:
+            tool_dict = {
+                "name": tool.get("name"),
+                "description": tool.get("description"),
+            }
+            if "inputSchema" in tool:
+                tool_dict["inputSchema"] = tool["inputSchema"]
+            tools.append(tool_dict)
+
+        return tools, response.headers.get("ETag")
 
     except Exception as e:
         import traceback
@@ -92,87 +321,829 @@ async def list_tools_async():
         raise
 
 
-async def call_tool_async(tool_name: str, arguments: dict):
-    """Call a specific MCP tool with given arguments."""
-    if not ALPHA_VANTAGE_API_KEY:
-        raise ValueError("ALPHA_VANTAGE_API_KEY environment variable not set")
+async def _load_tool_manifest(refresh: bool = None):
+    manifest = await asyncio.to_thread(tool_manifest.load_manifest, MCP_MANIFEST_PATH)
+
+    if refresh is None:
+        refresh = manifest is None or tool_manifest.is_stale(manifest, MCP_MANIFEST_MAX_AGE)
+    if not refresh:
+        if manifest is None:
+            raise FileNotFoundError(f"No tool manifest at {MCP_MANIFEST_PATH}")
+        return manifest
 
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            # Make JSON-RPC request to call tool
-            payload = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
-                }
-            }
+        tools, etag = await _list_tools(manifest.get("etag") if manifest else None)
+    except Exception as e:
+        if manifest is None:
+            raise
+        print(f"Warning: could not refresh tool manifest, using the copy from disk ({e})")
+        return manifest
 
-            response = await client.post(
-                f"{BASE_URL}/mcp",
-                json=payload,
-                params={"apikey": ALPHA_VANTAGE_API_KEY},
-                headers={"Content-Type": "application/json"}
+    if tools is None:
+        manifest = tool_manifest.touch_manifest(manifest, etag)
+    else:
+        manifest = tool_manifest.merge_manifest(manifest, tools, BASE_URL, etag)
+    await asyncio.to_thread(tool_manifest.save_manifest, MCP_MANIFEST_PATH, manifest)
+    return manifest
+
+
+class DeadlineExceeded(Exception):
+    """Raised when a call's deadline passes before it can complete."""
+
+
+def _default_deadline():
+    """
+    Deadline inherited from the environment, as epoch seconds.
+
+    The pipeline sets MCP_DEADLINE for the code it executes, so tool calls in
+    generated scripts never outlive the request that spawned them.
+    """
+    value = os.environ.get("MCP_DEADLINE")
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def _time_left(deadline):
+    """Seconds until deadline (epoch seconds), or None if there is no deadline."""
+    if deadline is None:
+        return None
+    return deadline - time.time()
+
+
+def _request_timeout(deadline):
+    """Per-attempt HTTP timeout, clipped to what is left of the deadline."""
+    time_left = _time_left(deadline)
+    if time_left is None:
+        return httpx.USE_CLIENT_DEFAULT
+    if time_left <= 0:
+        raise DeadlineExceeded("Deadline exceeded before the request could be sent")
+    return min(_client_settings.get("timeout", MCP_TIMEOUT), time_left)
+
+
+def _retry_delay(attempt: int, retry_after: float = None) -> float:
+    """Backoff before retry number `attempt` (0-based), with full jitter."""
+    delay = random.uniform(0, min(MCP_RETRY_MAX_DELAY, MCP_RETRY_BASE_DELAY * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, MCP_RETRY_MAX_DELAY))
+    return delay
+
+
+def _retry_after(response) -> float:
+    """Seconds from a Retry-After header, if the server sent one in that form."""
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except ValueError:
+        return None
+
+
+async def _post_with_retries(body, deadline, limiter):
+    """
+    POST a JSON-RPC body, retrying transient failures until MCP_MAX_RETRIES
+    or the deadline runs out. Returns the successful response.
+    """
+    client = await _get_client()
+    attempt = 0
+    while True:
+        retry_after = None
+        time_left = _time_left(deadline)
+        if time_left is not None and time_left <= 0:
+            raise DeadlineExceeded("Deadline exceeded before the request could be sent")
+        try:
+            await asyncio.wait_for(limiter.acquire(), time_left)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Deadline exceeded while waiting for rate limit budget")
+
+        try:
+            timeout = _request_timeout(deadline)
+        except DeadlineExceeded:
+            await limiter.refund()
+            raise
+
+        try:
+            # httpx applies the timeout to connect, write and read separately;
+            # wait_for makes the deadline a bound on the whole attempt
+            response = await asyncio.wait_for(
+                client.post(
+                    "/mcp",
+                    json=body,
+                    params={"apikey": ALPHA_VANTAGE_API_KEY},
+                    timeout=timeout
+                ),
+                _time_left(deadline)
             )
-            response.raise_for_status()
+            if response.status_code == 429 or response.status_code >= 500:
+                if response.status_code == 429:
+                    await limiter.throttled()
+                retry_after = _retry_after(response)
+                error = httpx.HTTPStatusError(
+                    f"Server error '{response.status_code} {response.reason_phrase}' for url '{response.url}'",
+                    request=response.request,
+                    response=response
+                )
+            else:
+                response.raise_for_status()
+                return response
+        except httpx.TransportError as e:
+            error = e
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded("Deadline exceeded while waiting for the server")
 
-            result = response.json()
+        if attempt >= MCP_MAX_RETRIES:
+            raise error
+        delay = _retry_delay(attempt, retry_after)
+        time_left = _time_left(deadline)
+        if time_left is not None and delay >= time_left:
+            # No time for another attempt; report the failure we have
+            raise error
+        await asyncio.sleep(delay)
+        attempt += 1
 
-            if "error" in result:
-                return {
-                    "error": result["error"].get("message", str(result["error"])),
+
+def _get_bucket_store():
+    """Return the shared rate limit store, or None if disabled or unavailable."""
+    global _bucket_store
+
+    if not MCP_RATE_LIMIT_PATH:
+        return None
+    if _bucket_store is None:
+        try:
+            _bucket_store = BucketStore(MCP_RATE_LIMIT_PATH)
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: shared rate limit store unavailable at {MCP_RATE_LIMIT_PATH}, "
+                  f"limiting per process: {e}")
+            _bucket_store = False
+    return _bucket_store or None
+
+
+def _rate_limiter():
+    """Return the rate limiter for the configured API key."""
+    return get_rate_limiter(
+        ALPHA_VANTAGE_API_KEY,
+        ALPHA_VANTAGE_CALLS_PER_MINUTE,
+        ALPHA_VANTAGE_CALLS_PER_DAY,
+        store=_get_bucket_store() if ALPHA_VANTAGE_CALLS_PER_MINUTE or ALPHA_VANTAGE_CALLS_PER_DAY else None
+    )
+
+
+def _is_rate_limit_note(result) -> bool:
+    """Whether a tool result is Alpha Vantage's throttling notice rather than data."""
+    if not isinstance(result, dict) or len(result) != 1:
+        return False
+    note = result.get("Note") or result.get("Information")
+    return isinstance(note, str) and ("rate limit" in note.lower() or "call frequency" in note.lower())
+
+
+def _tool_call_payload(tool_name: str, arguments: dict) -> dict:
+    """Build a tools/call JSON-RPC message with a fresh request id."""
+    return {
+        "jsonrpc": "2.0",
+        "id": next(_request_ids),
+        "method": "tools/call",
+        "params": {
+            "name": tool_name,
+            "arguments": arguments
+        }
+    }
+
+
+def _tool_payload(tool_name: str, arguments: dict, message: dict):
+    """
+    Extract the tool's result from a tools/call JSON-RPC response message.
+
+    Returns the result as text (JSON or plain, as the server sent it), or an
+    error dict. Keeping the text lets the cache store responses without
+    sharing mutable objects between callers.
+    """
+    if "error" in message:
+        error = message["error"]
+        return {
+            "error": error.get("message", str(error)) if isinstance(error, dict) else str(error),
+            "tool": tool_name,
+            "arguments": arguments
+        }
+
+    # Extract content from result
+    content_list = message.get("result", {}).get("content", [])
+
+    if not content_list:
+        return json_codec.dumps(message.get("result", {}))
+
+    # Process content array
+    results = []
+    for content in content_list:
+        if "text" in content:
+            results.append(content["text"])
+        elif "data" in content:
+            results.append(content["data"])
+
+    if len(results) == 1:
+        if isinstance(results[0], str):
+            return results[0]
+        return json_codec.dumps(results[0])
+
+    return json_codec.dumps(results if results else message.get("result", {}))
+
+
+# First characters a JSON document can start with; anything else (CSV, plain
+# text) is returned as text without attempting a parse
+_JSON_START = frozenset('{["-0123456789tfnNI')
+
+
+def _decode_payload(payload, decode: str = "auto"):
+    """
+    Turn a payload from _tool_payload into the value returned to callers.
+
+    decode="auto" parses JSON payloads and returns other text (e.g. CSV)
+    as-is; decode="raw" returns the payload text unparsed, for callers that
+    forward it without needing Python objects; decode="columns" turns a
+    time series response into NumPy arrays (see timeseries.to_columns).
+    For datatype=csv responses, decode="csv" parses typed column arrays and
+    decode="rows" returns a lazy iterator of row dicts (see csv_decoder).
+    Error dicts pass through.
+    """
+    if not isinstance(payload, str):
+        return payload
+    if decode == "raw":
+        return payload
+    if decode == "columns":
+        result = _decode_payload(payload)
+        if not _is_cacheable(result):
+            return result
+        # Imported here so NumPy is only loaded by callers that ask for columns
+        try:
+            from servers.timeseries import to_columns
+        except ImportError:
+            from timeseries import to_columns
+        return to_columns(result)
+    if decode in ("csv", "rows"):
+        # Errors and notices come back as JSON even when CSV was requested
+        if not csv_decoder.looks_like_csv(payload):
+            return _decode_payload(payload)
+        if decode == "csv":
+            return csv_decoder.to_columns(payload)
+        return csv_decoder.iter_rows(payload)
+    if decode != "auto":
+        raise ValueError(f"Unknown decode mode: {decode!r}")
+
+    stripped = payload.lstrip()
+    if not stripped or stripped[0] not in _JSON_START:
+        return payload
+    try:
+        return json_codec.loads(payload)
+    except json.JSONDecodeError:
+        return payload
+
+
+def _is_cacheable(result) -> bool:
+    """Whether a decoded result is real data rather than an error or notice."""
+    if not isinstance(result, dict):
+        return True
+    return not ("error" in result or "Error Message" in result or _is_rate_limit_note(result))
+
+
+def _get_disk_cache():
+    """Return the shared on-disk cache, or None if disabled or unavailable."""
+    global _disk_cache
+
+    if not MCP_CACHE_ENABLED or not MCP_DISK_CACHE_ENABLED:
+        return None
+    if _disk_cache is None:
+        try:
+            _disk_cache = DiskCache(MCP_DISK_CACHE_PATH, max_bytes=int(MCP_DISK_CACHE_MAX_MB * 1024 * 1024))
+        except (OSError, sqlite3.Error) as e:
+            print(f"Warning: disk cache unavailable at {MCP_DISK_CACHE_PATH}: {e}")
+            _disk_cache = False
+    return _disk_cache or None
+
+
+async def _cache_lookup(tool_name: str, arguments: dict):
+    """Return the cached payload for a call from memory or disk, or None."""
+    if not MCP_CACHE_ENABLED or ttl_for(tool_name, arguments) <= 0:
+        return None
+
+    key = cache_key(tool_name, arguments)
+    payload = _response_cache.get(key)
+    if payload is not None:
+        return payload
+
+    disk_cache = _get_disk_cache()
+    if disk_cache is None:
+        return None
+    try:
+        entry = await asyncio.to_thread(disk_cache.get, key)
+    except sqlite3.Error:
+        return None
+    if entry is None:
+        return None
+
+    # Promote to memory for the rest of its lifetime
+    payload, seconds_left = entry
+    _response_cache.set(key, payload, seconds_left)
+    return payload
+
+
+async def _cache_store(tool_name: str, arguments: dict, payload, result):
+    """Cache a freshly fetched payload if it holds data worth keeping."""
+    if not MCP_CACHE_ENABLED or not isinstance(payload, str) or not _is_cacheable(result):
+        return
+
+    key = cache_key(tool_name, arguments)
+    ttl = ttl_for(tool_name, arguments)
+    _response_cache.set(key, payload, ttl)
+
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None and ttl > 0:
+        try:
+            await asyncio.to_thread(disk_cache.set, key, payload, ttl, tool_name)
+        except sqlite3.Error as e:
+            print(f"Warning: failed to write disk cache: {e}")
+
+
+async def _fetch_tool(tool_name: str, arguments: dict, deadline: float = None):
+    """Call a tool over the network. Returns (payload, decoded result)."""
+    try:
+        # Make JSON-RPC request to call tool
+        message = _tool_call_payload(tool_name, arguments)
+
+        limiter = _rate_limiter()
+        response = await _post_with_retries(message, deadline, limiter)
+
+        payload = _tool_payload(tool_name, arguments, json_codec.loads(response.content))
+        result = _decode_payload(payload)
+        if _is_rate_limit_note(result):
+            await limiter.throttled()
+        await _cache_store(tool_name, arguments, payload, result)
+        return payload, result
+
+    except Exception as e:
+        error = {
+            "error": str(e),
+            "tool": tool_name,
+            "arguments": arguments
+        }
+        return error, error
+
+
+def _lease_seconds(deadline) -> float:
+    """How long a fetch may hold its lease: its deadline, or every attempt timing out."""
+    time_left = _time_left(deadline)
+    if time_left is not None:
+        return max(time_left, 0.0)
+    attempts = MCP_MAX_RETRIES + 1
+    return _client_settings.get("timeout", MCP_TIMEOUT) * attempts + MCP_RETRY_MAX_DELAY * MCP_MAX_RETRIES
+
+
+async def _fetch_shared(tool_name: str, arguments: dict, deadline: float = None):
+    """
+    _fetch_tool, coalesced with identical calls in other processes.
+
+    The first process to take the call's lease in the disk cache sends the
+    request; the others poll until its response is stored, or fetch it
+    themselves if the lease ends without one (e.g. the call failed, and
+    errors are not cached). Returns (payload, decoded result).
+    """
+    disk_cache = _get_disk_cache()
+    if disk_cache is None or ttl_for(tool_name, arguments) <= 0:
+        return await _fetch_tool(tool_name, arguments, deadline)
+
+    key = cache_key(tool_name, arguments)
+    while True:
+        try:
+            leased = await asyncio.to_thread(disk_cache.lease, key, _lease_seconds(deadline))
+        except sqlite3.Error:
+            return await _fetch_tool(tool_name, arguments, deadline)
+        if leased:
+            try:
+                return await _fetch_tool(tool_name, arguments, deadline)
+            finally:
+                try:
+                    await asyncio.to_thread(disk_cache.release, key)
+                except sqlite3.Error:
+                    pass  # the lease expires on its own
+
+        # Another process is fetching this call; wait for its response
+        while True:
+            time_left = _time_left(deadline)
+            if time_left is not None and time_left <= 0:
+                error = {
+                    "error": "Deadline exceeded while waiting for an identical in-flight call",
                     "tool": tool_name,
                     "arguments": arguments
                 }
+                return error, error
+            await asyncio.sleep(MCP_INFLIGHT_POLL_INTERVAL if time_left is None
+                                else min(MCP_INFLIGHT_POLL_INTERVAL, time_left))
+            try:
+                entry, still_leased = await asyncio.to_thread(disk_cache.poll, key)
+            except sqlite3.Error:
+                return await _fetch_tool(tool_name, arguments, deadline)
+            if entry is not None:
+                payload, seconds_left = entry
+                _response_cache.set(key, payload, seconds_left)
+                return payload, _decode_payload(payload)
+            if not still_leased:
+                break
 
-            # Extract content from result
-            content_list = result.get("result", {}).get("content", [])
 
-            if not content_list:
-                return result.get("result", {})
+def _get_validators():
+    """Return the generated validators module, or None if disabled or not generated."""
+    global _validators
 
-            # Process content array
-            results = []
-            for content in content_list:
-                if "text" in content:
-                    results.append(content["text"])
-                elif "data" in content:
-                    results.append(content["data"])
+    if not MCP_VALIDATE_PARAMS:
+        return None
+    if _validators is None:
+        try:
+            from servers.alphavantage import validators
+        except ImportError:
+            try:
+                from alphavantage import validators
+            except ImportError:
+                validators = False
+        _validators = validators
+    return _validators or None
 
-            if len(results) == 1:
-                # Try to parse as JSON if it's a string
-                if isinstance(results[0], str):
-                    try:
-                        return json.loads(results[0])
-                    except json.JSONDecodeError:
-                        return results[0]
-                return results[0]
 
-            return results if results else result.get("result", {})
+def _invalid_arguments(tool_name: str, arguments: dict):
+    """Return an error dict if the arguments break the tool's parameter rules, else None."""
+    validators = _get_validators()
+    if validators is None:
+        return None
+    problems = validators.validate(tool_name, arguments)
+    if not problems:
+        return None
+    return {
+        "error": describe_problems(tool_name, problems),
+        "tool": tool_name,
+        "arguments": arguments,
+        "invalid_parameters": problems
+    }
 
-    except Exception as e:
+
+async def _call_tool(tool_name: str, arguments: dict, deadline: float = None, decode: str = "auto"):
+    if not ALPHA_VANTAGE_API_KEY:
+        raise ValueError("ALPHA_VANTAGE_API_KEY environment variable not set")
+
+    invalid = _invalid_arguments(tool_name, arguments)
+    if invalid is not None:
+        return invalid
+
+    if deadline is None:
+        deadline = _default_deadline()
+
+    cached = await _cache_lookup(tool_name, arguments)
+    if cached is not None:
+        return _decode_payload(cached, decode)
+
+    # Coalesce with an identical call that is already in flight
+    key = cache_key(tool_name, arguments)
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_shared(tool_name, arguments, deadline))
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+        # Shielded so a cancelled caller does not cancel the request for the others
+        payload, result = await asyncio.shield(task)
+        return result if decode == "auto" else _decode_payload(payload, decode)
+
+    # The shared request runs on its starter's deadline; stop waiting at ours
+    try:
+        payload, _ = await asyncio.wait_for(asyncio.shield(task), _time_left(deadline))
+    except asyncio.TimeoutError:
         return {
-            "error": str(e),
+            "error": "Deadline exceeded while waiting for an identical in-flight call",
             "tool": tool_name,
             "arguments": arguments
         }
+    if isinstance(payload, dict):
+        return {**payload, "arguments": arguments}
+    return _decode_payload(payload, decode)
+
+
+async def _call_tools_batch(calls: list, deadline: float = None):
+    """
+    Send one JSON-RPC batch and match the responses back to the calls by id.
+
+    Returns one payload per call (see _tool_payload), or None if the batch
+    as a whole failed and the calls should be retried individually.
+    """
+    global _batch_supported
+
+    if not ALPHA_VANTAGE_API_KEY:
+        raise ValueError("ALPHA_VANTAGE_API_KEY environment variable not set")
+
+    requests = [_tool_call_payload(tool_name, arguments) for tool_name, arguments in calls]
+
+    limiter = _rate_limiter()
+    await asyncio.wait_for(limiter.acquire(len(requests)), _time_left(deadline))
+
+    # No retries here: a failed batch falls back to single calls, which retry.
+    # Those calls acquire their own budget, so a failed batch gives its back.
+    try:
+        client = await _get_client()
+        response = await asyncio.wait_for(
+            client.post(
+                "/mcp",
+                json=requests,
+                params={"apikey": ALPHA_VANTAGE_API_KEY},
+                timeout=_request_timeout(deadline)
+            ),
+            _time_left(deadline)
+        )
+        if response.status_code in _BATCH_UNSUPPORTED_STATUSES:
+            _batch_supported = False
+            await limiter.refund(len(requests))
+            return None
+        if response.status_code >= 400:
+            # Not a verdict on batching: the single calls retry or report it
+            await limiter.refund(len(requests))
+            if response.status_code == 429:
+                await limiter.throttled()
+            return None
+        messages = json_codec.loads(response.content)
+    except Exception:
+        await limiter.refund(len(requests))
+        return None
+
+    if not isinstance(messages, list):
+        # Servers without batch support answer with a single error object
+        _batch_supported = False
+        await limiter.refund(len(requests))
+        return None
+
+    by_id = {message.get("id"): message for message in messages if isinstance(message, dict)}
+    payloads = []
+    for (tool_name, arguments), request in zip(calls, requests):
+        message = by_id.get(request["id"])
+        if message is None:
+            payloads.append({
+                "error": f"No response for request id {request['id']} in batch",
+                "tool": tool_name,
+                "arguments": arguments
+            })
+        else:
+            payloads.append(_tool_payload(tool_name, arguments, message))
+    return payloads
+
+
+async def _call_tools_batched(calls: list, batch_size: int, deadline: float = None, decode: str = "auto"):
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+
+    if deadline is None:
+        deadline = _default_deadline()
+
+    calls = [
+        (tool_name, arguments if arguments is not None else {})
+        for tool_name, arguments in calls
+    ]
+
+    # Serve what we can from the cache and send each distinct remaining call once
+    results = [None] * len(calls)
+    duplicates = {}
+    for index, (tool_name, arguments) in enumerate(calls):
+        invalid = _invalid_arguments(tool_name, arguments)
+        if invalid is not None:
+            results[index] = invalid
+            continue
+        cached = await _cache_lookup(tool_name, arguments)
+        if cached is not None:
+            results[index] = _decode_payload(cached, decode)
+        else:
+            duplicates.setdefault(cache_key(tool_name, arguments), []).append(index)
+    pending = [indexes[0] for indexes in duplicates.values()]
+
+    async def run_chunk(indexes: list):
+        chunk = [calls[index] for index in indexes]
+        try:
+            payloads = await _call_tools_batch(chunk, deadline) if _batch_supported else None
+        except (RateLimitExceeded, DeadlineExceeded, asyncio.TimeoutError):
+            # Not enough budget for the whole batch; spend what is left call by call
+            payloads = None
+
+        if payloads is None:
+            # Fall back to pipelined single calls over the pool
+            chunk_results = await _gather_tools(chunk, MCP_GATHER_CONCURRENCY, deadline, decode)
+        else:
+            chunk_results = []
+            for (tool_name, arguments), payload in zip(chunk, payloads):
+                result = _decode_payload(payload)
+                await _cache_store(tool_name, arguments, payload, result)
+                if _is_rate_limit_note(result):
+                    await _rate_limiter().throttled()
+                chunk_results.append(result if decode == "auto" else _decode_payload(payload, decode))
+
+        for index, result in zip(indexes, chunk_results):
+            results[index] = result
+
+    chunks = [pending[i:i + batch_size] for i in range(0, len(pending), batch_size)]
+    await asyncio.gather(*[run_chunk(chunk) for chunk in chunks])
+
+    # Duplicates get their own copy of the first call's result
+    for indexes in duplicates.values():
+        first = indexes[0]
+        for index in indexes[1:]:
+            tool_name, arguments = calls[index]
+            result = results[first]
+            if isinstance(result, dict) and "error" in result:
+                results[index] = {**result, "arguments": arguments}
+            else:
+                results[index] = copy.deepcopy(result)
+    return results
+
+
+async def _gather_tools(calls: list, concurrency: int, deadline: float = None, decode: str = "auto"):
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run_one(tool_name: str, arguments: dict):
+        async with semaphore:
+            try:
+                return await _call_tool(tool_name, arguments, deadline, decode)
+            except Exception as e:
+                return {
+                    "error": str(e),
+                    "tool": tool_name,
+                    "arguments": arguments
+                }
+
+    return await asyncio.gather(*[
+        run_one(tool_name, arguments if arguments is not None else {})
+        for tool_name, arguments in calls
+    ])
+
+
+async def list_tools_async():
+    """List all available tools from the Alpha Vantage MCP server."""
+    tools, _ = await _run_async(_list_tools())
+    return tools
+
+
+async def load_tool_manifest_async(refresh: bool = None):
+    """
+    Return the tool manifest, refreshing it from the server only when needed.
+
+    The manifest ({"version", "hash", "tool_hashes", "tools", ...}) is read
+    from MCP_MANIFEST_PATH. With refresh=None it is re-fetched only if missing
+    or older than MCP_MANIFEST_MAX_AGE; refresh=True forces a check and
+    refresh=False never touches the network. A check sends the stored ETag,
+    so an unchanged manifest costs at most a 304. If the server cannot be
+    reached, a stale manifest is returned with a warning.
+    """
+    return await _run_async(_load_tool_manifest(refresh))
+
+
+async def call_tool_async(tool_name: str, arguments: dict, deadline: float = None, decode: str = "auto"):
+    """
+    Call a specific MCP tool with given arguments.
+
+    deadline is an absolute time in epoch seconds (time.time() based); retries
+    and waits stop once it passes. Defaults to the MCP_DEADLINE environment
+    variable, if set.
+
+    decode="raw" returns the response text without parsing it;
+    decode="columns" returns time series as NumPy arrays; decode="csv" and
+    decode="rows" parse datatype=csv responses into typed columns or a row
+    iterator.
+    """
+    return await _run_async(_call_tool(tool_name, arguments, deadline, decode))
+
+
+async def gather_tools_async(calls: list, concurrency: int = MCP_GATHER_CONCURRENCY, deadline: float = None,
+                             decode: str = "auto"):
+    """
+    Call many tools concurrently over the shared connection pool.
+
+    Args:
+        calls: Iterable of (tool_name, arguments) pairs.
+        concurrency: Maximum number of calls in flight at once.
+        deadline: Optional absolute deadline in epoch seconds for every call.
+        decode: "auto" to parse JSON responses, "raw" to return response
+            text, "columns" for time series as NumPy arrays, "csv" or
+            "rows" for datatype=csv responses as typed columns or an
+            iterator of row dicts.
+
+    Returns:
+        list: One result per call, in the same order. A call that fails yields
+        an {"error": ..., "tool": ..., "arguments": ...} dict in its slot.
+    """
+    return await _run_async(_gather_tools(list(calls), concurrency, deadline, decode))
+
+
+async def call_tools_batch_async(calls: list, batch_size: int = MCP_BATCH_SIZE, deadline: float = None,
+                                 decode: str = "auto"):
+    """
+    Call many tools using JSON-RPC 2.0 batch requests.
+
+    Calls are sent batch_size at a time, one HTTP POST per batch, and the
+    responses are matched back by request id. If the server rejects batching,
+    the calls are sent individually over the pool instead.
+
+    Args:
+        calls: Iterable of (tool_name, arguments) pairs.
+        batch_size: Maximum number of calls per POST.
+        deadline: Optional absolute deadline in epoch seconds for every call.
+        decode: "auto" to parse JSON responses, "raw" to return response
+            text, "columns" for time series as NumPy arrays, "csv" or
+            "rows" for datatype=csv responses as typed columns or an
+            iterator of row dicts.
+
+    Returns:
+        list: One result per call, in the same order, with error dicts for
+        calls that failed.
+    """
+    return await _run_async(_call_tools_batched(list(calls), batch_size, deadline, decode))
+
+
+def configure_rate_limit(calls_per_minute: float = None, calls_per_day: float = None, burst: float = None):
+    """
+    Set the client-side request budget for the configured API key.
+
+    Calls wait in arrival order for per-minute budget, with up to `burst`
+    calls (default: calls_per_minute) allowed back to back. Once the daily
+    budget is spent, calls fail with an error instead of reaching the server.
+    The budget is shared with other processes through MCP_RATE_LIMIT_PATH;
+    each process should configure the same limits.
+    """
+    configure_rate_limiter(
+        ALPHA_VANTAGE_API_KEY, calls_per_minute, calls_per_day, burst,
+        store=_get_bucket_store() if calls_per_minute or calls_per_day else None
+    )
+
+
+def rate_limit_status() -> dict:
+    """Remaining request budget for the configured API key."""
+    return _rate_limiter().status()
+
+
+def cache_stats() -> dict:
+    """Hit/miss statistics for the in-memory and on-disk response caches."""
+    disk_cache = _get_disk_cache()
+    return {
+        "memory": _response_cache.stats(),
+        "disk": disk_cache.stats() if disk_cache is not None else None,
+    }
+
+
+def clear_cache():
+    """Drop every cached tool response, in memory and on disk."""
+    _response_cache.clear()
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
+
+
+# Synchronous wrappers backed by the background client loop
+def open_client(**settings):
+    """Synchronous hook to configure and open the shared pooled client."""
+    _run_sync(_open_client(settings))
+
+
+def close_client():
+    """Close the shared pooled client and stop the background client loop."""
+    global _loop, _loop_thread
+
+    with _loop_lock:
+        loop, thread = _loop, _loop_thread
+        _loop = None
+        _loop_thread = None
+    if loop is None or loop.is_closed():
+        return
+
+    try:
+        asyncio.run_coroutine_threadsafe(_close_client(), loop).result(timeout=MCP_TIMEOUT)
+    except Exception:
+        pass
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=MCP_TIMEOUT)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(close_client)
 
 
-# Synchronous wrappers using asyncio
 def list_available_tools():
     """Synchronous wrapper for list_tools_async."""
     try:
-        return asyncio.run(list_tools_async())
+        tools, _ = _run_sync(_list_tools())
+        return tools
     except Exception as e:
         return [{"error": str(e)}]
 
 
-def call_mcp_tool(tool_name: str, arguments: dict):
+def load_tool_manifest(refresh: bool = None):
+    """Synchronous wrapper for load_tool_manifest_async."""
+    return _run_sync(_load_tool_manifest(refresh))
+
+
+def call_mcp_tool(tool_name: str, arguments: dict, deadline: float = None, decode: str = "auto"):
     """Synchronous wrapper for call_tool_async."""
     try:
-        return asyncio.run(call_tool_async(tool_name, arguments))
+        return _run_sync(_call_tool(tool_name, arguments, deadline, decode))
     except Exception as e:
         return {
             "error": str(e),
@@ -181,6 +1152,40 @@ def call_mcp_tool(tool_name: str, arguments: dict):
         }
 
 
+def gather_tools(calls: list, concurrency: int = MCP_GATHER_CONCURRENCY, deadline: float = None,
+                 decode: str = "auto"):
+    """Synchronous wrapper for gather_tools_async."""
+    calls = list(calls)
+    try:
+        return _run_sync(_gather_tools(calls, concurrency, deadline, decode))
+    except Exception as e:
+        return [
+            {
+                "error": str(e),
+                "tool": tool_name,
+                "arguments": arguments
+            }
+            for tool_name, arguments in calls
+        ]
+
+
+def call_tools_batch(calls: list, batch_size: int = MCP_BATCH_SIZE, deadline: float = None,
+                     decode: str = "auto"):
+    """Synchronous wrapper for call_tools_batch_async."""
+    calls = list(calls)
+    try:
+        return _run_sync(_call_tools_batched(calls, batch_size, deadline, decode))
+    except Exception as e:
+        return [
+            {
+                "error": str(e),
+                "tool": tool_name,
+                "arguments": arguments
+            }
+            for tool_name, arguments in calls
+        ]
+
+
 # Example usage
 if __name__ == "__main__":
     print("Testing MCP Client...")
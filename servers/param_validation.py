@@ -0,0 +1,135 @@
+"""
+Local parameter validation for Alpha Vantage MCP tool calls
+Turns per-tool parameter rules into fast checks, so bad calls are rejected
+before they cost a network round-trip
+"""
+
+import re
+
+# Booleans as the server's JSON Schema validation accepts them
+_BOOLEAN_STRINGS = frozenset(("true", "false", "1", "0", "yes", "no"))
+
+
+def _is_integer(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return True
+    if isinstance(value, float):
+        return value.is_integer()
+    if isinstance(value, str):
+        try:
+            int(value.strip())
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def _is_number(value) -> bool:
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, str):
+        try:
+            float(value.strip())
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def _is_boolean(value) -> bool:
+    if isinstance(value, bool):
+        return True
+    return isinstance(value, str) and value.strip().lower() in _BOOLEAN_STRINGS
+
+
+# JSON Schema type -> check. Numeric and boolean strings are accepted because
+# the server coerces them; strings must be strings.
+TYPE_CHECKS = {
+    "string": lambda value: isinstance(value, str),
+    "integer": _is_integer,
+    "number": _is_number,
+    "boolean": _is_boolean,
+    "array": lambda value: isinstance(value, (list, tuple)),
+    "object": lambda value: isinstance(value, dict),
+}
+
+
+def _compile_parameter(rule: dict):
+    """Build a check for one parameter. The check returns a problem message or None."""
+    types = rule.get("type")
+    types = (types,) if isinstance(types, str) else tuple(types or ())
+    type_checks = [TYPE_CHECKS[t] for t in types if t in TYPE_CHECKS]
+    expected = " or ".join(types)
+
+    allowed = rule.get("enum")
+    allowed_lower = frozenset(str(value).lower() for value in allowed) if allowed else None
+    allowed_text = ", ".join(str(value) for value in allowed) if allowed else ""
+
+    pattern = re.compile(rule["pattern"]) if rule.get("pattern") else None
+    pattern_text = rule.get("format") or rule.get("pattern")
+
+    minimum = rule.get("minimum")
+    maximum = rule.get("maximum")
+
+    def check(value):
+        if type_checks and not any(type_check(value) for type_check in type_checks):
+            return f"must be of type {expected}, got {type(value).__name__}"
+        if allowed_lower is not None and str(value).strip().lower() not in allowed_lower:
+            return f"must be one of: {allowed_text}"
+        if pattern is not None and not (isinstance(value, str) and pattern.fullmatch(value.strip())):
+            return f"must match the {pattern_text} format"
+        if (minimum is not None or maximum is not None) and _is_number(value):
+            number = float(value)
+            if minimum is not None and number < minimum:
+                return f"must be at least {minimum:g}"
+            if maximum is not None and number > maximum:
+                return f"must be at most {maximum:g}"
+        return None
+
+    return check
+
+
+def compile_validator(required: tuple, parameters: dict):
+    """
+    Compile parameter rules into a validator.
+
+    Args:
+        required: Names of required parameters.
+        parameters: {name: rule}, where a rule may hold "type" (a JSON
+            Schema type or list of types), "enum", "pattern" (matched
+            against the whole value) with an optional human-readable
+            "format", "minimum" and "maximum".
+
+    Returns:
+        A function taking the call's params dict and returning a list of
+        {"parameter", "message", "value"} problems, empty when the call is valid.
+        Parameters without a rule are passed through unchecked.
+    """
+    required = tuple(required)
+    checks = {name: _compile_parameter(rule) for name, rule in parameters.items()}
+
+    def validate(params: dict) -> list:
+        problems = []
+        for name in required:
+            if params.get(name) in (None, ""):
+                problems.append({"parameter": name, "message": "is required", "value": None})
+        for name, value in params.items():
+            check = checks.get(name)
+            if check is None or value in (None, ""):
+                continue
+            message = check(value)
+            if message is not None:
+                problems.append({"parameter": name, "message": message, "value": value})
+        return problems
+
+    return validate
+
+
+def describe_problems(tool_name: str, problems: list) -> str:
+    """One-line summary of validation problems, for the "error" field of an error dict."""
+    details = "; ".join(f"{problem['parameter']} {problem['message']}" for problem in problems)
+    return f"Invalid parameters for {tool_name}: {details}"
@@ -0,0 +1,300 @@
+"""
+Client-side rate limiting for Alpha Vantage API keys
+Token buckets that smooth bursts to the per-minute and per-day request quotas,
+optionally kept in a SQLite file so every process on the host shares them
+"""
+
+import os
+import time
+import asyncio
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request would exceed the daily budget of an API key."""
+
+
+class TokenBucket:
+    """A token bucket that refills continuously up to its capacity."""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock=time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self.clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self):
+        now = self.clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.refill_per_second)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available."""
+        elapsed = self.clock() - self._updated
+        return min(self.capacity, self._tokens + elapsed * self.refill_per_second)
+
+    def seconds_until_available(self) -> float:
+        """Seconds until one token is available (0 if one is available now)."""
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.refill_per_second
+
+    def take(self):
+        self._refill()
+        self._tokens -= 1
+
+    def give(self, count: float):
+        """Return tokens taken for requests that were never sent."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + count)
+
+    def drain(self):
+        """Empty the bucket, e.g. after the server reports throttling."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    def state(self) -> tuple:
+        return self._tokens, self._updated
+
+    def load(self, tokens: float, updated: float):
+        self._tokens = tokens
+        self._updated = updated
+
+    def reset(self):
+        """Start full, as a bucket nobody has drawn from."""
+        self._tokens = self.capacity
+        self._updated = self.clock()
+
+
+class BucketStore:
+    """
+    Token bucket state in a SQLite file that many processes can share.
+
+    Each update runs in a BEGIN IMMEDIATE transaction: the buckets are read,
+    changed and written back while holding the database's write lock, so
+    executor processes and API workers spend one budget per API key. Times
+    are wall-clock seconds, which every process agrees on.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._local = threading.local()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS buckets (
+                key TEXT NOT NULL,
+                bucket TEXT NOT NULL,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (key, bucket)
+            )
+        """)
+
+    def _connect(self):
+        """Return this thread's connection; a forked child opens its own."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None or self._local.pid != os.getpid():
+            # Autocommit mode, so the transactions below are exactly the ones we begin
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    def update(self, key: str, buckets: dict, fn):
+        """
+        Load buckets ({name: TokenBucket}) from the stored state for key,
+        call fn() on them and store the result, all under the write lock.
+
+        Returns fn's return value. If fn raises, nothing is written.
+        """
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            stored = {
+                bucket: (tokens, updated)
+                for bucket, tokens, updated in conn.execute(
+                    "SELECT bucket, tokens, updated FROM buckets WHERE key = ?", (key,)
+                )
+            }
+            for name, bucket in buckets.items():
+                if name in stored:
+                    bucket.load(*stored[name])
+                else:
+                    bucket.reset()
+            result = fn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO buckets (key, bucket, tokens, updated) VALUES (?, ?, ?, ?)",
+                [(key, name, *bucket.state()) for name, bucket in buckets.items()]
+            )
+            conn.execute("COMMIT")
+            return result
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+class RateLimiter:
+    """
+    Async rate limiter for one API key.
+
+    Requests wait in FIFO order for a per-minute token, so bursts are spread
+    out instead of being throttled server-side. When the per-day budget is
+    used up, acquire() raises RateLimitExceeded rather than waiting for hours.
+
+    With a BucketStore the buckets live in the store under `key` and are
+    shared with every process using it; FIFO order then holds within each
+    process, and processes take turns at the shared buckets.
+    """
+
+    def __init__(self, calls_per_minute: float = None, calls_per_day: float = None, burst: float = None,
+                 store: BucketStore = None, key: str = ""):
+        self.calls_per_minute = calls_per_minute
+        self.calls_per_day = calls_per_day
+        self.store = store
+        self.key = key
+        clock = time.time if store is not None else time.monotonic
+        self._minute = None
+        self._day = None
+        if calls_per_minute:
+            self._minute = TokenBucket(burst or calls_per_minute, calls_per_minute / 60.0, clock)
+        if calls_per_day:
+            self._day = TokenBucket(calls_per_day, calls_per_day / 86400.0, clock)
+        self._lock = None
+        self._waiting = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._minute is not None or self._day is not None
+
+    def _update(self, fn):
+        """Run fn against the buckets, inside the store's transaction when there is one."""
+        if self.store is None:
+            return fn()
+        buckets = {name: bucket for name, bucket in (("minute", self._minute), ("day", self._day)) if bucket}
+        return self.store.update(self.key, buckets, fn)
+
+    async def _update_async(self, fn):
+        """
+        _update for the event loop. The store's transaction can wait up to its
+        busy timeout for other processes, so it runs in a thread; the
+        in-memory buckets are updated in place.
+        """
+        if self.store is None:
+            return fn()
+        return await asyncio.to_thread(self._update, fn)
+
+    def _check_day(self, count: int):
+        if self._day is not None and self._day.tokens < count:
+            raise RateLimitExceeded(
+                f"Daily request budget exhausted ({self.calls_per_day:g} calls/day)"
+            )
+
+    def _try_take(self) -> float:
+        """Take one request's budget, or return the seconds to wait for a minute token."""
+        self._check_day(1)
+        if self._minute is not None:
+            delay = self._minute.seconds_until_available()
+            if delay > 0:
+                return delay
+            self._minute.take()
+        if self._day is not None:
+            self._day.take()
+        return 0.0
+
+    async def acquire(self, count: int = 1):
+        """Wait for budget for `count` requests, in arrival order."""
+        if not self.enabled:
+            return
+
+        # Created lazily so the lock binds to the loop that uses it
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        pending = count
+        self._waiting += count
+        try:
+            async with self._lock:
+                # Check the whole request up front so a refused batch spends nothing
+                await self._update_async(lambda: self._check_day(count))
+                while pending:
+                    delay = await self._update_async(self._try_take)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                        continue
+                    pending -= 1
+                    self._waiting -= 1
+        except BaseException:
+            # Refused or cancelled (e.g. by a deadline) part way through: give back what was taken
+            await self.refund(count - pending)
+            raise
+        finally:
+            self._waiting -= pending
+
+    async def refund(self, count: int = 1):
+        """Give back budget acquired for requests that never reached the server."""
+        if count <= 0 or not self.enabled:
+            return
+
+        def give():
+            if self._minute is not None:
+                self._minute.give(count)
+            if self._day is not None:
+                self._day.give(count)
+
+        await self._update_async(give)
+
+    async def throttled(self):
+        """Record that the server throttled a request; pause until the minute budget refills."""
+        if self._minute is not None:
+            await self._update_async(self._minute.drain)
+
+    def status(self) -> dict:
+        """Remaining budget for this key."""
+        minute, day = self._update(lambda: (
+            self._minute.tokens if self._minute is not None else None,
+            self._day.tokens if self._day is not None else None,
+        )) if self.enabled else (None, None)
+        return {
+            "calls_per_minute": self.calls_per_minute,
+            "calls_per_day": self.calls_per_day,
+            "remaining_minute": int(minute) if minute is not None else None,
+            "remaining_day": int(day) if day is not None else None,
+            "waiting": self._waiting,
+            "shared": self.store is not None,
+        }
+
+
+# One limiter per API key, shared by every caller in the process
+_limiters = {}
+
+
+def _store_key(api_key: str) -> str:
+    """Key for an API key's buckets in a store, so the key itself is not written to disk."""
+    return hashlib.sha256((api_key or "").encode("utf-8")).hexdigest()[:32]
+
+
+def get_rate_limiter(api_key: str, calls_per_minute: float = None, calls_per_day: float = None,
+                     store: BucketStore = None) -> RateLimiter:
+    """Return the limiter for an API key, creating it with the given budget on first use."""
+    limiter = _limiters.get(api_key)
+    if limiter is None:
+        limiter = RateLimiter(calls_per_minute, calls_per_day, store=store, key=_store_key(api_key))
+        _limiters[api_key] = limiter
+    return limiter
+
+
+def configure_rate_limiter(api_key: str, calls_per_minute: float = None, calls_per_day: float = None,
+                           burst: float = None, store: BucketStore = None) -> RateLimiter:
+    """Replace the limiter for an API key with a new budget."""
+    limiter = RateLimiter(calls_per_minute, calls_per_day, burst, store=store, key=_store_key(api_key))
+    _limiters[api_key] = limiter
+    return limiter
@@ -0,0 +1,404 @@
+"""
+Response cache for Alpha Vantage MCP tool calls
+In-memory LRU cache and a SQLite cache shared across processes, with
+per-tool freshness policies
+"""
+
+import json
+import time
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from collections import OrderedDict
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+DAY = 24 * HOUR
+
+# How long a response stays fresh, per tool. 0 disables caching for the tool.
+TOOL_TTLS = {
+    # Quotes and market snapshots
+    "GLOBAL_QUOTE": 30,
+    "REALTIME_BULK_QUOTES": 15,
+    "REALTIME_OPTIONS": 30,
+    "CURRENCY_EXCHANGE_RATE": 30,
+    "MARKET_STATUS": MINUTE,
+    "TOP_GAINERS_LOSERS": 5 * MINUTE,
+    "NEWS_SENTIMENT": 5 * MINUTE,
+    "INSIDER_TRANSACTIONS": 6 * HOUR,
+    "ANALYTICS_FIXED_WINDOW": 15 * MINUTE,
+    "ANALYTICS_SLIDING_WINDOW": 15 * MINUTE,
+
+    # Core time series (intraday tools fall back to INTERVAL_TTLS)
+    "TIME_SERIES_DAILY": 15 * MINUTE,
+    "TIME_SERIES_DAILY_ADJUSTED": 15 * MINUTE,
+    "TIME_SERIES_WEEKLY": HOUR,
+    "TIME_SERIES_WEEKLY_ADJUSTED": HOUR,
+    "TIME_SERIES_MONTHLY": HOUR,
+    "TIME_SERIES_MONTHLY_ADJUSTED": HOUR,
+    "FX_DAILY": 15 * MINUTE,
+    "FX_WEEKLY": HOUR,
+    "FX_MONTHLY": HOUR,
+    "DIGITAL_CURRENCY_DAILY": 15 * MINUTE,
+    "DIGITAL_CURRENCY_WEEKLY": HOUR,
+    "DIGITAL_CURRENCY_MONTHLY": HOUR,
+    "HISTORICAL_OPTIONS": DAY,
+
+    # Fundamentals change at most once a quarter
+    "COMPANY_OVERVIEW": DAY,
+    "ETF_PROFILE": DAY,
+    "INCOME_STATEMENT": 7 * DAY,
+    "BALANCE_SHEET": 7 * DAY,
+    "CASH_FLOW": 7 * DAY,
+    "EARNINGS": DAY,
+    "EARNINGS_ESTIMATES": DAY,
+    "DIVIDENDS": DAY,
+    "SPLITS": DAY,
+    "EARNINGS_CALL_TRANSCRIPT": 30 * DAY,
+    "LISTING_STATUS": DAY,
+    "EARNINGS_CALENDAR": 12 * HOUR,
+    "IPO_CALENDAR": 12 * HOUR,
+    "SYMBOL_SEARCH": DAY,
+
+    # Economic series, by release cadence
+    "REAL_GDP": 7 * DAY,
+    "REAL_GDP_PER_CAPITA": 7 * DAY,
+    "INFLATION": 30 * DAY,
+    "CPI": DAY,
+    "RETAIL_SALES": DAY,
+    "DURABLES": DAY,
+    "UNEMPLOYMENT": DAY,
+    "NONFARM_PAYROLL": DAY,
+    "FEDERAL_FUNDS_RATE": 6 * HOUR,
+    "TREASURY_YIELD": 6 * HOUR,
+
+    # Commodities
+    "WTI": 6 * HOUR,
+    "BRENT": 6 * HOUR,
+    "NATURAL_GAS": 6 * HOUR,
+    "COPPER": DAY,
+    "ALUMINUM": DAY,
+    "WHEAT": DAY,
+    "CORN": DAY,
+    "COTTON": DAY,
+    "SUGAR": DAY,
+    "COFFEE": DAY,
+    "ALL_COMMODITIES": DAY,
+
+    # Utility tools are never cached
+    "PING": 0,
+    "ADD_TWO_NUMBERS": 0,
+}
+
+# Tools without an entry above (intraday series, technical indicators) are
+# cached according to the bar interval they request
+INTERVAL_TTLS = {
+    "1min": MINUTE,
+    "5min": MINUTE,
+    "15min": 5 * MINUTE,
+    "30min": 5 * MINUTE,
+    "60min": 5 * MINUTE,
+    "daily": 15 * MINUTE,
+    "weekly": HOUR,
+    "monthly": HOUR,
+    "quarterly": DAY,
+    "annual": DAY,
+}
+
+DEFAULT_TTL = 5 * MINUTE
+
+
+def ttl_for(tool_name: str, arguments: dict) -> float:
+    """Seconds a response to this call stays fresh."""
+    if tool_name in TOOL_TTLS:
+        return TOOL_TTLS[tool_name]
+    interval = str(arguments.get("interval", "")).lower()
+    return INTERVAL_TTLS.get(interval, DEFAULT_TTL)
+
+
+# Arguments holding tickers or currency codes, which the API treats case-insensitively
+SYMBOL_ARGUMENTS = {
+    "symbol",
+    "symbols",
+    "tickers",
+    "from_symbol",
+    "to_symbol",
+    "from_currency",
+    "to_currency",
+    "market",
+}
+
+
+def normalize_arguments(arguments: dict) -> dict:
+    """Normalize call arguments so equivalent calls compare equal (e.g. "nvda" and "NVDA")."""
+    normalized = {}
+    for name, value in arguments.items():
+        if isinstance(value, str):
+            value = value.strip()
+            if name in SYMBOL_ARGUMENTS:
+                value = ",".join(part.strip() for part in value.upper().split(","))
+        normalized[name] = value
+    return normalized
+
+
+def cache_key(tool_name: str, arguments: dict) -> str:
+    """Canonical key for a tool call, independent of argument order and symbol case."""
+    return json.dumps(
+        [tool_name, normalize_arguments(arguments)],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str
+    )
+
+
+class TTLCache:
+    """
+    LRU cache whose entries expire after a per-entry TTL.
+
+    Values are the tool's text payloads, so the size bound is measured in
+    characters as well as entries.
+    """
+
+    def __init__(self, maxsize: int = 512, max_chars: int = 128 * 1024 * 1024):
+        self.maxsize = maxsize
+        self.max_chars = max_chars
+        self._entries = OrderedDict()
+        self._chars = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str):
+        """Return the cached value for key, or None if absent or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.expirations += 1
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: str, value: str, ttl: float):
+        """Store value under key for ttl seconds, evicting least recently used entries."""
+        if ttl <= 0 or len(value) > self.max_chars:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, time.monotonic() + ttl)
+        self._chars += len(value)
+        while len(self._entries) > self.maxsize or self._chars > self.max_chars:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def _remove(self, key: str):
+        value, _ = self._entries.pop(key)
+        self._chars -= len(value)
+
+    def clear(self):
+        self._entries.clear()
+        self._chars = 0
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "chars": self._chars,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+
+class DiskCache:
+    """
+    SQLite-backed response cache that many processes can share.
+
+    Entries are keyed by a SHA-256 of the canonical call key and expire by
+    wall-clock time, so executor subprocesses and API workers reuse each
+    other's responses. Leases on calls being fetched let those processes
+    wait for each other's requests as well. When the stored payloads exceed max_bytes, expired
+    entries go first, then the least recently used.
+    """
+
+    # Only rewrite an entry's access time when it is older than this, so
+    # frequent hits do not turn every read into a write.
+    TOUCH_INTERVAL = 60
+
+    # Check the size bound every this many writes
+    EVICT_EVERY = 32
+
+    def __init__(self, path, max_bytes: int = 512 * 1024 * 1024):
+        self.path = Path(path)
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._writes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                tool TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS inflight (
+                key TEXT PRIMARY KEY,
+                expires_at REAL NOT NULL
+            )
+        """)
+        conn.commit()
+
+    def _connect(self):
+        """Return this thread's connection (sqlite3 connections are per-thread)."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _hash(key: str) -> str:
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        """Return (payload, seconds_left) for a fresh entry, or None."""
+        conn = self._connect()
+        digest = self._hash(key)
+        now = time.time()
+        row = conn.execute(
+            "SELECT payload, expires_at, accessed_at FROM responses WHERE key = ?",
+            (digest,)
+        ).fetchone()
+        if row is None or row[1] <= now:
+            self.misses += 1
+            return None
+        payload, expires_at, accessed_at = row
+        if now - accessed_at > self.TOUCH_INTERVAL:
+            conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, digest))
+            conn.commit()
+        self.hits += 1
+        return payload, expires_at - now
+
+    def set(self, key: str, value: str, ttl: float, tool: str = ""):
+        """Store value under key for ttl seconds."""
+        size = len(value.encode("utf-8"))
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        conn = self._connect()
+        now = time.time()
+        conn.execute(
+            "INSERT OR REPLACE INTO responses (key, tool, payload, size, expires_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (self._hash(key), tool, value, size, now + ttl, now)
+        )
+        conn.commit()
+
+        self._writes += 1
+        if self._writes % self.EVICT_EVERY == 0:
+            self.evict()
+
+    def lease(self, key: str, seconds: float) -> bool:
+        """
+        Claim the fetch of key for up to `seconds`, so other processes wait
+        for its response instead of sending the same request.
+
+        Returns False if another process holds an unexpired lease. A lease
+        left behind by a process that died expires on its own.
+        """
+        conn = self._connect()
+        now = time.time()
+        cursor = conn.execute(
+            "INSERT INTO inflight (key, expires_at) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET expires_at = excluded.expires_at "
+            "WHERE inflight.expires_at <= ?",
+            (self._hash(key), now + seconds, now)
+        )
+        conn.commit()
+        return cursor.rowcount == 1
+
+    def release(self, key: str):
+        """Give up a lease taken with lease()."""
+        conn = self._connect()
+        conn.execute("DELETE FROM inflight WHERE key = ?", (self._hash(key),))
+        conn.commit()
+
+    def poll(self, key: str):
+        """
+        Check on a call another process is fetching, without counting a lookup.
+
+        Returns (entry, leased): entry is (payload, seconds_left) once a fresh
+        response is stored, else None; leased is whether the fetch is still
+        claimed.
+        """
+        conn = self._connect()
+        digest = self._hash(key)
+        now = time.time()
+        row = conn.execute(
+            "SELECT payload, expires_at FROM responses WHERE key = ? AND expires_at > ?",
+            (digest, now)
+        ).fetchone()
+        leased = conn.execute(
+            "SELECT 1 FROM inflight WHERE key = ? AND expires_at > ?",
+            (digest, now)
+        ).fetchone() is not None
+        return ((row[0], row[1] - now) if row else None), leased
+
+    def evict(self):
+        """Drop expired entries, then least recently used ones until under max_bytes."""
+        conn = self._connect()
+        cursor = conn.execute("DELETE FROM responses WHERE expires_at <= ?", (time.time(),))
+        self.evictions += cursor.rowcount
+        conn.execute("DELETE FROM inflight WHERE expires_at <= ?", (time.time(),))
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total > self.max_bytes:
+            excess = total - self.max_bytes
+            doomed = []
+            for digest, size in conn.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+                doomed.append((digest,))
+                excess -= size
+                if excess <= 0:
+                    break
+            conn.executemany("DELETE FROM responses WHERE key = ?", doomed)
+            self.evictions += len(doomed)
+        conn.commit()
+
+    def clear(self):
+        conn = self._connect()
+        conn.execute("DELETE FROM responses")
+        conn.commit()
+
+    def stats(self) -> dict:
+        conn = self._connect()
+        entries, size = conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses").fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "path": str(self.path),
+            "entries": entries,
+            "bytes": size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "evictions": self.evictions,
+        }
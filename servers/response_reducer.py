@@ -0,0 +1,439 @@
+"""
+Deterministic reduction of tool responses before the Parser agent
+Keeps the rows and fields a query needs (latest bars plus summary statistics,
+top articles, relevant transcript passages) within a token budget
+"""
+
+import os
+import re
+import json
+import math
+from datetime import datetime, timedelta
+
+try:
+    from servers.timeseries import find_series
+    from servers.csv_decoder import looks_like_csv
+    from servers.tool_selector import tokenize
+    from servers.code_executor import dump_results
+except ImportError:  # imported from inside servers/
+    from timeseries import find_series
+    from csv_decoder import looks_like_csv
+    from tool_selector import tokenize
+    from code_executor import dump_results
+
+# Approximate size the Parser prompt may spend on the response; 0 disables reduction
+RESPONSE_TOKEN_BUDGET = int(os.getenv("RESPONSE_TOKEN_BUDGET", "4000"))
+
+# Rough characters per token for JSON and English text
+CHARS_PER_TOKEN = 4
+
+# Defaults when the query does not say how many
+DEFAULT_BARS = 30
+DEFAULT_ARTICLES = 10
+MAX_SUMMARY_CHARS = 300
+MAX_PASSAGE_CHARS = 1500
+
+# Bars kept on each side of a date the query names, so a weekend or holiday
+# still has the sessions around it
+NEIGHBOR_BARS = 2
+
+# "last 5 days", "past 10 trading days", "latest 3 articles", "top 20"
+_COUNT = re.compile(
+    r"\b(?:last|past|latest|recent|top|first)\s+(\d{1,4})\b(?:\s+(?:trading\s+)?([a-z]+))?",
+    re.IGNORECASE
+)
+
+# Units that make a count a period rather than a number of items, in days
+# (months and years at their average length)
+_TIME_UNITS = {
+    "minute": 1 / 1440, "min": 1 / 1440, "hour": 1 / 24, "day": 1, "session": 1,
+    "week": 7, "month": 30.44, "quarter": 91.31, "year": 365.25,
+}
+
+
+# Dates a query names: "2023-03-15", "2024-03", "March 15, 2024", "15 Mar 2024", "March 2024"
+_ISO_DATE = re.compile(r"\b(\d{4})-(\d{2})(?:-(\d{2}))?\b")
+_MONTH_NAMES = ("jan", "feb", "mar", "apr", "may", "jun", "jul", "aug", "sep", "oct", "nov", "dec")
+_MONTH_DATE = re.compile(
+    r"\b(?:(\d{1,2})(?:st|nd|rd|th)?\s+)?"
+    r"(jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*\.?"
+    r"(?:\s+(\d{1,2})(?:st|nd|rd|th)?\b)?,?\s+(\d{4})\b",
+    re.IGNORECASE
+)
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def _dumps(value) -> str:
+    return dump_results([value])
+
+
+def _fits(value, budget: int) -> bool:
+    return estimate_tokens(_dumps(value)) <= budget
+
+
+def _requested_count(query: str):
+    """(count, time unit) the query asks for; the unit is None for plain counts like "top 20"."""
+    match = _COUNT.search(query)
+    if not match:
+        return None, None
+    unit = (match.group(2) or "").lower()
+    unit = unit[:-1] if unit.endswith("s") else unit
+    return int(match.group(1)), unit if unit in _TIME_UNITS else None
+
+
+def _requested_items(query: str):
+    """How many items the query asks for; a period ("past 6 months") is not a number of items."""
+    count, unit = _requested_count(query)
+    return None if unit else count
+
+
+def _parse_date(value):
+    try:
+        return datetime.fromisoformat(str(value)[:19])
+    except ValueError:
+        return None
+
+
+def _number(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+# ============================================================================
+# Tool families
+# ============================================================================
+
+def _field_stats(rows: list) -> dict:
+    """Summary statistics per numeric field over rows ordered newest first."""
+    stats = {}
+    fields = list(rows[0][1]) if rows else []
+    for field in fields:
+        values = [_number(values.get(field)) for _, values in rows]
+        values = [value for value in values if value is not None]
+        if not values:
+            continue
+        latest, oldest = values[0], values[-1]
+        stats[field] = {
+            "latest": latest,
+            "oldest": oldest,
+            "min": min(values),
+            "max": max(values),
+            "mean": round(sum(values) / len(values), 6),
+            "change_pct": round((latest - oldest) / oldest * 100, 4) if oldest else None,
+        }
+    return stats
+
+
+def _requested_rows(rows: list, query: str):
+    """
+    The bars, newest first, for the period the query asks for, or None if it asks for none.
+
+    A count in the series' own interval ("last 5 days" of daily bars) or with
+    no unit is that many bars; any other period ("past 6 months" of daily
+    bars) is every bar dated within it of the latest one.
+    """
+    count, unit = _requested_count(query)
+    if not count:
+        return None
+    if unit is None:
+        return rows[:count]
+
+    dates = [_parse_date(date) for date, _ in rows]
+    if len(dates) < 2 or None in dates:
+        return None
+    gaps = sorted((newer - older).total_seconds() / 86400 for newer, older in zip(dates, dates[1:]))
+    interval = gaps[len(gaps) // 2]
+    length = _TIME_UNITS[unit]
+    if interval > 0 and 0.5 <= length / interval <= 2:
+        return rows[:count]
+    since = dates[0] - timedelta(days=count * length)
+    return [row for row, date in zip(rows, dates) if date > since]
+
+
+def _span(year, month, day=None):
+    """[start, end) of a day, or of a month when day is None; None for impossible dates."""
+    try:
+        start = datetime(int(year), int(month), int(day or 1))
+    except ValueError:
+        return None
+    if day:
+        return start, start + timedelta(days=1)
+    return start, datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
+
+
+def _named_spans(query: str) -> list:
+    """The days and months a query names, as [start, end) pairs."""
+    spans = [_span(*match.groups()) for match in _ISO_DATE.finditer(query)]
+    for match in _MONTH_DATE.finditer(query):
+        before, month, after, year = match.groups()
+        spans.append(_span(year, _MONTH_NAMES.index(month.lower()[:3]) + 1, before or after))
+    return [span for span in spans if span]
+
+
+def _dated_rows(rows: list, query: str):
+    """
+    The bars, newest first, dated within the days and months the query names,
+    each with NEIGHBOR_BARS bars on either side; None if it names no dates.
+
+    A date between bars (a weekend, or outside the series) keeps the bars
+    nearest to it.
+    """
+    spans = _named_spans(query)
+    if not spans:
+        return None
+    dates = [_parse_date(date) for date, _ in rows]
+    if None in dates:
+        return None
+
+    keep = set()
+    for start, end in spans:
+        inside = [i for i, date in enumerate(dates) if start <= date < end]
+        if not inside:
+            # Rows are newest first: the first one older than the span sits just after it
+            after = next((i for i, date in enumerate(dates) if date < start), len(rows))
+            inside = [after - 1, after]
+        for i in range(min(inside) - NEIGHBOR_BARS, max(inside) + NEIGHBOR_BARS + 1):
+            if 0 <= i < len(rows):
+                keep.add(i)
+    return [rows[i] for i in sorted(keep)]
+
+
+def reduce_time_series(result: dict, query: str, budget: int):
+    """
+    The bars the query asks for (around the dates it names, or for the period
+    it gives, else the latest DEFAULT_BARS) plus statistics over those bars.
+    """
+    key, series = find_series(result)
+    if isinstance(series, dict):
+        rows = [(date, series[date]) for date in sorted(series, reverse=True)]
+    else:
+        rows = sorted(
+            ((row.get("date"), {k: v for k, v in row.items() if k != "date"}) for row in series),
+            key=lambda row: row[0] or "",
+            reverse=True
+        )
+
+    meta = {k: v for k, v in result.items() if k != key}
+    requested = _dated_rows(rows, query)
+    dated = requested is not None
+    if not dated:
+        requested = _requested_rows(rows, query)
+    window = rows if requested is None else requested
+    summary = {
+        "bars": len(window),
+        "from": window[-1][0] if window else None,
+        "to": window[0][0] if window else None,
+        "fields": _field_stats(window),
+    }
+
+    count = DEFAULT_BARS if requested is None else max(len(requested), 1)
+    while True:
+        kept = window[:count]
+        reduced = dict(meta)
+        reduced["summary"] = summary
+        reduced[key] = dict(kept) if isinstance(series, dict) else [{"date": date, **values} for date, values in kept]
+        if count <= 1 or _fits(reduced, budget):
+            break
+        count //= 2
+    if dated:
+        return reduced, f"kept {len(kept)} of {len(rows)} bars around the dates in the query, with statistics over them"
+    covered = "all of them" if requested is None else f"the {len(window)} requested"
+    return reduced, f"kept the latest {len(kept)} of {len(rows)} bars, with statistics over {covered}"
+
+
+def _article_score(article: dict, terms: set) -> float:
+    words = set(tokenize(f"{article.get('title', '')} {article.get('summary', '')}"))
+    score = float(len(words & terms))
+    for ticker in article.get("ticker_sentiment", []):
+        if ticker.get("ticker", "").lower() in terms:
+            score += 2 + (_number(ticker.get("relevance_score")) or 0)
+    return score
+
+
+def _slim_article(article: dict, terms: set) -> dict:
+    tickers = article.get("ticker_sentiment", [])
+    matching = [t for t in tickers if t.get("ticker", "").lower() in terms] or tickers[:3]
+    summary = article.get("summary", "")
+    return {
+        "title": article.get("title"),
+        "url": article.get("url"),
+        "time_published": article.get("time_published"),
+        "source": article.get("source"),
+        "summary": summary[:MAX_SUMMARY_CHARS] + ("..." if len(summary) > MAX_SUMMARY_CHARS else ""),
+        "overall_sentiment_score": article.get("overall_sentiment_score"),
+        "overall_sentiment_label": article.get("overall_sentiment_label"),
+        "ticker_sentiment": matching,
+    }
+
+
+def reduce_news(result: dict, query: str, budget: int):
+    """Top-k articles by overlap with the query and ticker relevance, with trimmed fields."""
+    feed = result["feed"]
+    terms = set(tokenize(query))
+    ranked = sorted(
+        enumerate(feed),
+        key=lambda item: (-_article_score(item[1], terms), item[0])
+    )
+    meta = {k: v for k, v in result.items() if k != "feed"}
+
+    count = _requested_items(query) or DEFAULT_ARTICLES
+    while True:
+        kept = [_slim_article(article, terms) for _, article in ranked[:count]]
+        reduced = dict(meta)
+        reduced["items_total"] = len(feed)
+        reduced["feed"] = kept
+        if count <= 1 or _fits(reduced, budget):
+            break
+        count //= 2
+    return reduced, f"kept the {len(kept)} most relevant of {len(feed)} articles, with trimmed summaries"
+
+
+def reduce_transcript(result: dict, query: str, budget: int):
+    """The passages that best match the query, in their original order."""
+    passages = result["transcript"]
+    # Words every query for a transcript shares say nothing about relevance
+    terms = set(tokenize(query)) - set(tokenize("earnings call transcript quarter"))
+    documents = [tokenize(passage.get("content", "")) for passage in passages]
+    # Terms found in most passages (e.g. the company name) carry little weight
+    weights = {}
+    for term in terms:
+        frequency = sum(1 for words in documents if term in words)
+        if frequency:
+            weights[term] = math.log(len(documents) / frequency)
+    scored = []
+    for index, words in enumerate(documents):
+        score = sum(weights.get(word, 0.0) for word in words) / (1 + len(words)) ** 0.5
+        scored.append((score, index))
+    if not any(score for score, _ in scored):
+        # Nothing specific asked: the prepared remarks come first
+        scored = [(-index, index) for _, index in scored]
+    scored.sort(key=lambda item: (-item[0], item[1]))
+
+    meta = {k: v for k, v in result.items() if k != "transcript"}
+    chosen = []
+    used = estimate_tokens(_dumps(meta)) + 20
+    for _, index in scored:
+        passage = dict(passages[index])
+        content = passage.get("content", "")
+        if len(content) > MAX_PASSAGE_CHARS:
+            passage["content"] = content[:MAX_PASSAGE_CHARS] + "..."
+        cost = estimate_tokens(_dumps(passage))
+        if used + cost > budget and chosen:
+            continue
+        chosen.append((index, passage))
+        used += cost
+
+    reduced = dict(meta)
+    reduced["passages_total"] = len(passages)
+    reduced["transcript"] = [passage for _, passage in sorted(chosen, key=lambda item: item[0])]
+    return reduced, f"kept {len(chosen)} of {len(passages)} transcript passages relevant to the query"
+
+
+def reduce_csv(text: str, query: str, budget: int):
+    """Header and the first rows (the newest, in Alpha Vantage CSV), up to the budget."""
+    lines = text.strip().splitlines()
+    header, rows = lines[0], lines[1:]
+    limit = _requested_items(query)
+    kept = [header]
+    used = estimate_tokens(header)
+    for row in rows[:limit] if limit else rows:
+        cost = estimate_tokens(row) + 1
+        if used + cost > budget:
+            break
+        kept.append(row)
+        used += cost
+    return "\n".join(kept), f"kept the first {len(kept) - 1} of {len(rows)} CSV rows"
+
+
+def _truncate(value, items: int, chars: int):
+    """Cap every list at items entries and every string at chars characters."""
+    if isinstance(value, dict):
+        return {k: _truncate(v, items, chars) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_truncate(v, items, chars) for v in value[:items]]
+    if isinstance(value, str) and len(value) > chars:
+        return value[:chars] + "..."
+    return value
+
+
+def reduce_generic(value, query: str, budget: int):
+    """Shorten lists and long strings until the response fits."""
+    items, chars = _requested_items(query) or 50, 2000
+    reduced = _truncate(value, items, chars)
+    while not _fits(reduced, budget) and (items > 1 or chars > 100):
+        items, chars = max(items // 2, 1), max(chars // 2, 100)
+        reduced = _truncate(value, items, chars)
+    return reduced, f"lists cut to {items} items and text to {chars} characters"
+
+
+def _reducer_for(value):
+    """Pick the reducer for a response by its shape."""
+    if isinstance(value, dict):
+        if find_series(value)[0] is not None:
+            return reduce_time_series
+        if isinstance(value.get("feed"), list):
+            return reduce_news
+        if isinstance(value.get("transcript"), list):
+            return reduce_transcript
+    return reduce_generic
+
+
+# ============================================================================
+# Entry point
+# ============================================================================
+
+def reduce_response(payload, query: str, budget: int = None):
+    """
+    Fit a tool response into the Parser agent's token budget.
+
+    Args:
+        payload: The emitted result object, or the text the code printed.
+        query: The user's query; it sets how many rows are kept and which
+            articles or passages count as relevant.
+        budget: Token budget; defaults to RESPONSE_TOKEN_BUDGET (0 disables).
+
+    Returns:
+        (text, note): the text for the Parser prompt, and a short description
+        of what was dropped, or None if the response already fit.
+    """
+    budget = RESPONSE_TOKEN_BUDGET if budget is None else budget
+    text = payload if isinstance(payload, str) else _dumps(payload)
+    if budget <= 0 or estimate_tokens(text) <= budget:
+        return text, None
+
+    if isinstance(payload, str):
+        if looks_like_csv(payload):
+            return reduce_csv(payload, query, budget)
+        try:
+            payload = json.loads(payload)
+        except ValueError:
+            return payload[:budget * CHARS_PER_TOKEN], "text cut to the token budget"
+
+    reduced, note = _reducer_for(payload)(payload, query, budget)
+    if not _fits(reduced, budget):
+        reduced, extra = reduce_generic(reduced, query, budget)
+        note = f"{note}; {extra}"
+    return _dumps(reduced), note
+
+
+def reduce_results(results: list, query: str, budget: int = None):
+    """reduce_response for everything a snippet emitted, sharing the budget between results."""
+    budget = RESPONSE_TOKEN_BUDGET if budget is None else budget
+    if len(results) == 1:
+        return reduce_response(results[0], query, budget)
+
+    # At least one token each: a share of 0 would turn reduction off
+    share = max(budget // len(results), 1) if budget > 0 else 0
+    texts, notes = [], []
+    for index, result in enumerate(results):
+        text, note = reduce_response(result, query, share)
+        # Text results (CSV, plain output) stay strings in the JSON array
+        texts.append(json.dumps(text, ensure_ascii=False) if isinstance(result, str) else text)
+        if note:
+            notes.append(f"result {index + 1}: {note}")
+    return "[" + ",".join(texts) + "]", "; ".join(notes) or None
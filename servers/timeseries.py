@@ -0,0 +1,120 @@
+"""
+Columnar decoding of Alpha Vantage time series responses
+Turns date-keyed dicts of string values into NumPy arrays
+"""
+
+import re
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# "1. open" -> "open", "5. adjusted close" -> "adjusted_close"
+_FIELD_PREFIX = re.compile(r"^\d+[a-z]?\.\s*")
+
+# Fields stored as int64 when every value is integral
+_INTEGER_FIELDS = ("volume",)
+
+
+def _field_name(key: str) -> str:
+    return _FIELD_PREFIX.sub("", key).strip().lower().replace(" ", "_")
+
+
+def _to_float_array(values: list):
+    """Parse numeric strings into float64, mapping blanks and "." to NaN."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        out = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                out[i] = float(value)
+            except (TypeError, ValueError):
+                out[i] = np.nan
+        return out
+
+
+def _to_column(name: str, values: list):
+    if any(token in name for token in _INTEGER_FIELDS):
+        try:
+            return np.array(values, dtype=np.int64)
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return _to_float_array(values)
+
+
+def _to_index(dates: list):
+    """Parse date strings into datetime64, at day resolution when there is no time part."""
+    unit = "D" if all(len(date) <= 10 for date in dates) else "s"
+    return np.array(dates, dtype=f"datetime64[{unit}]")
+
+
+def find_series(result: dict):
+    """
+    Locate the time series in a response.
+
+    Returns (key, series) where series is either a date-keyed dict of rows
+    (stock, FX, crypto and technical indicator tools) or a list of
+    {"date": ..., "value": ...} rows (economic and commodity tools).
+    Returns (None, None) if the response holds no time series.
+    """
+    if not isinstance(result, dict):
+        return None, None
+
+    data = result.get("data")
+    if isinstance(data, list) and data and isinstance(data[0], dict) and "date" in data[0]:
+        return "data", data
+
+    for key, value in result.items():
+        if ("Time Series" in key or "Technical Analysis" in key) and isinstance(value, dict):
+            return key, value
+    return None, None
+
+
+def to_columns(result: dict) -> dict:
+    """
+    Convert a time series response into columns.
+
+    Returns:
+        dict: {
+            "meta": everything in the response except the series itself,
+            "index": datetime64 array of timestamps, oldest first,
+            "columns": {field: float64 or int64 array}
+        }
+        Field names drop Alpha Vantage's numbering, e.g. "4. close" -> "close".
+
+    Raises:
+        ImportError: if NumPy is not installed.
+        ValueError: if the response does not contain a time series.
+    """
+    if np is None:
+        raise ImportError("Columnar decoding requires numpy. Install with: pip install numpy")
+
+    key, series = find_series(result)
+    if key is None:
+        raise ValueError("Response does not contain a time series")
+
+    meta = {k: v for k, v in result.items() if k != key}
+
+    if isinstance(series, list):
+        # Economic / commodity series: [{"date": ..., "value": ...}, ...]
+        rows = sorted(series, key=lambda row: row["date"])
+        dates = [row["date"] for row in rows]
+        fields = [field for field in rows[0] if field != "date"]
+    else:
+        # Date-keyed rows; Alpha Vantage sends newest first
+        dates = sorted(series)
+        rows = [series[date] for date in dates]
+        fields = list(rows[0]) if rows else []
+
+    columns = {}
+    for field in fields:
+        name = _field_name(field)
+        columns[name] = _to_column(name, [row.get(field) for row in rows])
+
+    return {
+        "meta": meta,
+        "index": _to_index(dates),
+        "columns": columns,
+    }
@@ -0,0 +1,107 @@
+"""
+Tool manifest for the Alpha Vantage MCP server
+A versioned snapshot of tools/list (names, descriptions, inputSchemas) with
+content hashes, so code generation and startup can skip the network
+"""
+
+import os
+import json
+import time
+import hashlib
+from pathlib import Path
+
+# Bump when the manifest layout changes; older manifests are ignored
+MANIFEST_VERSION = 1
+
+
+def _canonical(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def tool_hash(tool: dict) -> str:
+    """SHA-256 of one tool's definition, independent of key order."""
+    return hashlib.sha256(_canonical(tool).encode("utf-8")).hexdigest()
+
+
+def tools_hash(tools: list) -> str:
+    """SHA-256 of a whole tool list, independent of tool and key order."""
+    digest = hashlib.sha256()
+    for tool in sorted(tools, key=lambda t: t.get("name") or ""):
+        digest.update(tool_hash(tool).encode("ascii"))
+    return digest.hexdigest()
+
+
+def file_hash(content: str) -> str:
+    """SHA-256 of a generated file's text, to tell whether an artifact derived from it is current."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def build_manifest(tools: list, server: str = "", etag: str = None) -> dict:
+    """Wrap a tools/list result in a manifest, keeping the server's tool order."""
+    now = time.time()
+    return {
+        "version": MANIFEST_VERSION,
+        "server": server,
+        "hash": tools_hash(tools),
+        "updated_at": now,
+        "checked_at": now,
+        "etag": etag,
+        "tool_hashes": {tool.get("name"): tool_hash(tool) for tool in tools},
+        "tools": tools,
+    }
+
+
+def load_manifest(path):
+    """Read a manifest, or return None if it is missing, unreadable or from another version."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if not isinstance(manifest.get("tools"), list):
+        return None
+    return manifest
+
+
+def save_manifest(path, manifest: dict):
+    """Write a manifest atomically, so concurrent readers never see a partial file."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        # Key order is kept: parameter order in inputSchema drives the generated docs
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
+
+
+def is_stale(manifest: dict, max_age: float) -> bool:
+    """Whether a manifest was last checked against the server more than max_age seconds ago."""
+    if max_age <= 0:
+        return True
+    return time.time() - manifest.get("checked_at", 0) > max_age
+
+
+def merge_manifest(old: dict, tools: list, server: str = "", etag: str = None) -> dict:
+    """
+    Fold a fresh tools/list result into an existing manifest.
+
+    If the content hash is unchanged, only checked_at (and the ETag) move,
+    so updated_at records when the tools last actually changed.
+    """
+    new = build_manifest(tools, server, etag)
+    if old is not None and old.get("hash") == new["hash"]:
+        new["updated_at"] = old.get("updated_at", new["updated_at"])
+    return new
+
+
+def touch_manifest(manifest: dict, etag: str = None) -> dict:
+    """Record that the server confirmed the manifest is current (e.g. HTTP 304)."""
+    manifest = dict(manifest)
+    manifest["checked_at"] = time.time()
+    if etag:
+        manifest["etag"] = etag
+    return manifest
+
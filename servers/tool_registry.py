@@ -0,0 +1,110 @@
+"""
+In-process registry of the Alpha Vantage tools
+Built once per process from the generated package and the tool manifest,
+so tool discovery needs no LLM call, subprocess or network request
+"""
+
+import os
+import json
+
+try:
+    from servers import tool_manifest
+    from servers.mcp_client import MCP_MANIFEST_PATH
+except ImportError:  # imported from inside servers/
+    import tool_manifest
+    from mcp_client import MCP_MANIFEST_PATH
+
+TOOLS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "alphavantage")
+
+# Interface summaries written by generate_tools.py, keyed by tool and file hash
+INTERFACES_PATH = os.path.join(TOOLS_DIR, "interfaces.json")
+
+# Bump when the interfaces file layout changes; older files are ignored
+INTERFACES_VERSION = 1
+
+_registry = None
+_interfaces = None
+
+
+def _generated_tool_names() -> list:
+    """Names of the tools that have a generated wrapper module."""
+    try:
+        from servers import alphavantage
+        names = [name for name in alphavantage.__all__ if not name.endswith("_async")]
+    except ImportError:
+        # Package missing or not importable; fall back to the files themselves
+        names = [
+            filename[:-3] for filename in os.listdir(TOOLS_DIR)
+            if filename.endswith(".py") and filename != "__init__.py"
+        ]
+    return sorted(names)
+
+
+def build_registry() -> dict:
+    """
+    Build the registry from what is on disk.
+
+    Tool names come from the generated package, so every entry has a wrapper
+    module to read and import. Descriptions, input schemas and content hashes
+    are added from the manifest when it is available.
+
+    Returns:
+        dict: {name: {"name", "description", "inputSchema", "hash"}}, sorted by name.
+    """
+    manifest = tool_manifest.load_manifest(MCP_MANIFEST_PATH) or {}
+    definitions = {tool.get("name"): tool for tool in manifest.get("tools", [])}
+    hashes = manifest.get("tool_hashes", {})
+
+    registry = {}
+    for name in _generated_tool_names():
+        definition = definitions.get(name, {})
+        registry[name] = {
+            "name": name,
+            "description": definition.get("description", ""),
+            "inputSchema": definition.get("inputSchema", {}),
+            "hash": hashes.get(name),
+        }
+    return registry
+
+
+def get_registry(refresh: bool = False) -> dict:
+    """Return the process-wide registry, building it on first use (or when refresh=True)."""
+    global _registry
+
+    if _registry is None or refresh:
+        _registry = build_registry()
+    return _registry
+
+
+def tool_names() -> list:
+    """Sorted names of all available tools."""
+    return list(get_registry())
+
+
+def load_interfaces() -> dict:
+    """Read the generated interface summaries: {name: {"file_hash", "interface"}}, or {} if unavailable."""
+    try:
+        with open(INTERFACES_PATH, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INTERFACES_VERSION:
+        return {}
+    return data.get("tools", {})
+
+
+def get_interface(tool_name: str, tool_content: str):
+    """
+    Return the precomputed interface summary for a tool.
+
+    Returns None when there is no summary or it was generated from a
+    different version of the tool file than tool_content.
+    """
+    global _interfaces
+
+    if _interfaces is None:
+        _interfaces = load_interfaces()
+    entry = _interfaces.get(tool_name)
+    if not entry or entry.get("file_hash") != tool_manifest.file_hash(tool_content):
+        return None
+    return entry.get("interface")
@@ -0,0 +1,254 @@
+"""
+Local tool selection for the Alpha Vantage tools
+Ranks tools against a query with BM25 over names, descriptions and parameter
+docs plus phrase rules, so most queries need no selection LLM call
+"""
+
+import os
+import re
+import math
+
+try:
+    from servers.tool_registry import get_registry
+except ImportError:  # imported from inside servers/
+    from tool_registry import get_registry
+
+# A pick is confident when the top score beats the runner-up by this fraction
+# of the top score; closer calls are left to the LLM
+TOOL_SELECTOR_MARGIN = float(os.getenv("TOOL_SELECTOR_MARGIN", "0.25"))
+
+# Without a phrase rule or the tool's name in the query, a pick also needs
+# this BM25 score, so a lone generic word ("price") cannot settle it
+TOOL_SELECTOR_MIN_SCORE = float(os.getenv("TOOL_SELECTOR_MIN_SCORE", "8.0"))
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Field weights: each token of a field counts this many times in the document
+NAME_WEIGHT = 3
+DESCRIPTION_WEIGHT = 2
+PARAMETER_WEIGHT = 1
+
+# Phrases that pick one tool over similar ones, as in the selection prompt.
+# Phrases are matched word for word, stopwords included ("trading at"), and a
+# match adds RULE_BOOST per phrase word, so longer phrases win.
+DISTINCTION_RULES = [
+    ("earnings transcript", "EARNINGS_CALL_TRANSCRIPT"),
+    ("earnings call", "EARNINGS_CALL_TRANSCRIPT"),
+    ("transcript", "EARNINGS_CALL_TRANSCRIPT"),
+    ("earnings calendar", "EARNINGS_CALENDAR"),
+    ("earnings estimates", "EARNINGS_ESTIMATES"),
+    ("current price", "GLOBAL_QUOTE"),
+    ("stock price", "GLOBAL_QUOTE"),
+    ("share price", "GLOBAL_QUOTE"),
+    ("trading at", "GLOBAL_QUOTE"),
+    ("quote", "GLOBAL_QUOTE"),
+    ("historical prices", "TIME_SERIES_DAILY"),
+    ("time series", "TIME_SERIES_DAILY"),
+    ("intraday", "TIME_SERIES_INTRADAY"),
+    ("company overview", "COMPANY_OVERVIEW"),
+    ("company info", "COMPANY_OVERVIEW"),
+    ("news", "NEWS_SENTIMENT"),
+    ("sentiment", "NEWS_SENTIMENT"),
+    ("symbol search", "SYMBOL_SEARCH"),
+    ("ticker search", "SYMBOL_SEARCH"),
+    ("search symbol", "SYMBOL_SEARCH"),
+    ("search ticker", "SYMBOL_SEARCH"),
+]
+RULE_BOOST = 4.0
+
+# Every word of a tool's name appearing in order in the query (e.g. "rsi",
+# "real gdp per capita") adds this much per name word
+NAME_MATCH_BOOST = 3.0
+
+_STOPWORDS = frozenset((
+    "a", "an", "and", "are", "as", "at", "be", "by", "can", "do", "for", "from",
+    "get", "give", "how", "i", "in", "is", "it", "me", "my", "of", "on", "or",
+    "please", "show", "tell", "that", "the", "this", "to", "what", "whats",
+    "which", "with", "you", "returns", "api", "values",
+))
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Example values in descriptions ("For example: symbol=IBM", "(e.g., "AAPL stock
+# price daily")"). Their tickers are rare words, so indexing them would make any
+# query naming that ticker match the tool.
+_EXAMPLE = re.compile(
+    r"\(\s*e\.g\.[^)]*\)|\be\.g\.[^.;\n]*|\b(?:for example|example)\b:?[^\n]*?(?:\.(?:\s|$)|$)",
+    re.IGNORECASE
+)
+
+# Upper-case words in a query, i.e. likely tickers
+_UPPER_WORD = re.compile(r"\b[A-Z][A-Z0-9]{0,4}(?:\.[A-Z])?\b")
+
+_selector = None
+
+
+def _stem(token: str) -> str:
+    """Crude plural folding, enough to match "prices" with "price"."""
+    if len(token) > 4 and token.endswith("ies"):
+        return token[:-3] + "y"
+    if len(token) > 3 and token.endswith("s") and token[-2] not in "sui":
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list:
+    """Lowercased, plural-folded word tokens of text, without stopwords."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower()) if token not in _STOPWORDS]
+
+
+def _words(text: str) -> list:
+    """Lowercased, plural-folded words of text, stopwords kept, for phrase rules."""
+    return [_stem(token) for token in _TOKEN.findall(text.lower())]
+
+
+def _contains(tokens: list, phrase: list) -> bool:
+    """Whether phrase appears as a contiguous run in tokens."""
+    n = len(phrase)
+    return any(tokens[i:i + n] == phrase for i in range(len(tokens) - n + 1))
+
+
+def _strip_examples(text: str) -> str:
+    return _EXAMPLE.sub(" ", text)
+
+
+def _document(entry: dict) -> list:
+    """Weighted token list for one registry entry, without example values."""
+    tokens = tokenize(entry["name"].replace("_", " ")) * NAME_WEIGHT
+    tokens += tokenize(_strip_examples(entry.get("description", ""))) * DESCRIPTION_WEIGHT
+    properties = entry.get("inputSchema", {}).get("properties", {})
+    for name, info in properties.items():
+        tokens += tokenize(name.replace("_", " ")) * PARAMETER_WEIGHT
+        tokens += tokenize(_strip_examples(info.get("description", ""))) * PARAMETER_WEIGHT
+    return tokens
+
+
+def _acronyms(entry: dict) -> set:
+    """Upper-case words a tool's name and description use as terms (RSI, GDP, EPS, ...)."""
+    words = {part.lower() for part in entry["name"].split("_")}
+    words.update(word.lower() for word in _UPPER_WORD.findall(_strip_examples(entry.get("description", ""))))
+    return words
+
+
+class ToolSelector:
+    """
+    BM25 ranking over an inverted index of the tool registry.
+
+    The index maps each term to {tool: term frequency}; scoring a query
+    only touches the postings of its own terms.
+    """
+
+    def __init__(self, registry: dict):
+        self.index = {}
+        self.lengths = {}
+        self.name_tokens = {}
+        self.acronyms = set()
+        for name, entry in registry.items():
+            self.acronyms |= _acronyms(entry)
+            tokens = _document(entry)
+            self.lengths[name] = len(tokens)
+            self.name_tokens[name] = tokenize(name.replace("_", " "))
+            for token in tokens:
+                postings = self.index.setdefault(token, {})
+                postings[name] = postings.get(name, 0) + 1
+
+        count = len(self.lengths)
+        self.average_length = sum(self.lengths.values()) / count if count else 0.0
+        self.idf = {
+            token: math.log(1 + (count - len(postings) + 0.5) / (len(postings) + 0.5))
+            for token, postings in self.index.items()
+        }
+        self.rules = [(_words(phrase), tool) for phrase, tool in DISTINCTION_RULES if tool in registry]
+
+    def query_terms(self, query: str) -> list:
+        """Query tokens without tickers: upper-case words the tools do not use as terms."""
+        tickers = {
+            word.lower() for word in _UPPER_WORD.findall(query)
+            if word.lower() not in self.acronyms
+        }
+        return [term for term in tokenize(query) if term not in tickers]
+
+    def rank(self, query: str, candidates=None) -> list:
+        """
+        Score tools against a query.
+
+        Args:
+            query: Natural language query.
+            candidates: Optional collection of tool names to restrict the ranking to.
+
+        Returns:
+            list: (tool name, score) pairs with a positive score, best first.
+        """
+        return self._rank(query, candidates)[0]
+
+    def _rank(self, query: str, candidates=None):
+        """rank(), plus the set of tools a phrase rule or their own name matched."""
+        terms = self.query_terms(query)
+        matched = set()
+        scores = {}
+
+        for term in set(terms):
+            postings = self.index.get(term)
+            if not postings:
+                continue
+            idf = self.idf[term]
+            for name, frequency in postings.items():
+                norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[name] / self.average_length)
+                scores[name] = scores.get(name, 0.0) + idf * frequency * (BM25_K1 + 1) / (frequency + norm)
+
+        for name, tokens in self.name_tokens.items():
+            if tokens and _contains(terms, tokens):
+                scores[name] = scores.get(name, 0.0) + NAME_MATCH_BOOST * len(tokens)
+                matched.add(name)
+
+        # Only the longest matching rule phrase counts for each tool
+        words = _words(query)
+        boosts = {}
+        for phrase, tool in self.rules:
+            if phrase and _contains(words, phrase):
+                boosts[tool] = max(boosts.get(tool, 0.0), RULE_BOOST * len(phrase))
+        for tool, boost in boosts.items():
+            scores[tool] = scores.get(tool, 0.0) + boost
+        matched.update(boosts)
+
+        if candidates is not None:
+            candidates = set(candidates)
+            scores = {name: score for name, score in scores.items() if name in candidates}
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0])), matched
+
+    def select(self, query: str, candidates=None):
+        """
+        Pick a tool when the ranking is clear.
+
+        Returns:
+            (tool name or None, ranked (name, score) pairs). The name is None
+            when nothing matched, the runner-up is within TOOL_SELECTOR_MARGIN
+            of the top score, or the top tool has neither a rule or name match
+            nor TOOL_SELECTOR_MIN_SCORE.
+        """
+        ranked, matched = self._rank(query, candidates)
+        if not ranked:
+            return None, ranked
+        best, top = ranked[0]
+        runner_up = ranked[1][1] if len(ranked) > 1 else 0.0
+        if top - runner_up < TOOL_SELECTOR_MARGIN * top:
+            return None, ranked
+        if best not in matched and top < TOOL_SELECTOR_MIN_SCORE:
+            return None, ranked
+        return best, ranked
+
+
+def get_selector(refresh: bool = False) -> ToolSelector:
+    """Return the process-wide selector, indexing the registry on first use (or when refresh=True)."""
+    global _selector
+
+    if _selector is None or refresh:
+        _selector = ToolSelector(get_registry(refresh))
+    return _selector
+
+
+def select_tool(query: str, candidates=None):
+    """Shortcut for get_selector().select(query, candidates)."""
+    return get_selector().select(query, candidates)
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Tests for the generated-code executors
+"""
+
+import os
+import sys
+import time
+
+from servers import code_executor
+from servers.code_executor import WorkerPoolExecutor
+
+
+def test_child_finishing_before_the_reply_is_read(tmp_path, monkeypatch):
+    """A snippet that is done before the pool starts reading must not look like a timeout."""
+    send = code_executor._WorkerServer._send
+
+    def slow_send(self, job):
+        send(self, job)
+        time.sleep(0.5)
+
+    monkeypatch.setattr(code_executor._WorkerServer, "_send", slow_send)
+    executor = WorkerPoolExecutor(1)
+    try:
+        for _ in range(2):
+            start = time.monotonic()
+            result = executor.run("print('fast')", str(tmp_path), timeout=3)
+            assert result["success"], result["stderr"]
+            assert result["stdout"] == "fast\n"
+            assert time.monotonic() - start < 2
+    finally:
+        executor.close()
+
+
+def test_timeout_kills_the_snippet_and_keeps_the_server(tmp_path):
+    executor = WorkerPoolExecutor(1)
+    try:
+        server = executor.servers.queue[0]
+        result = executor.run("import time\ntime.sleep(30)", str(tmp_path), timeout=1)
+        assert not result["success"]
+        assert result["stderr"] == "Execution timed out after 1 seconds"
+
+        result = executor.run("print('next')", str(tmp_path), timeout=3)
+        assert result["stdout"] == "next\n"
+        assert executor.servers.queue[0] is server
+    finally:
+        executor.close()
+
+
+def test_exit_codes_match_a_subprocess(tmp_path):
+    executor = WorkerPoolExecutor(1)
+    try:
+        result = executor.run("import sys\nsys.exit(3)", str(tmp_path), timeout=3)
+        assert result["returncode"] == 3
+        result = executor.run("raise ValueError('boom')", str(tmp_path), timeout=3)
+        assert result["returncode"] == 1
+        assert "ValueError: boom" in result["stderr"]
+    finally:
+        executor.close()
+
+
+def test_results_come_back_as_data(tmp_path):
+    """emit() sends JSON: no snippet code runs in the pipeline, and broken results are reported."""
+    code = "\n".join([
+        "import os",
+        "from servers.code_executor import emit",
+        "class Hook:",
+        "    def __reduce__(self):",
+        "        return (os.system, ('touch hooked',))",
+        "emit({'rows': [1, 2], 'hook': Hook()})",
+        "with open(os.environ['CODE_RESULT_PATH'], 'a') as f:",
+        "    f.write('{\"cut')",
+    ])
+    env = dict(os.environ, PYTHONPATH=code_executor.PROJECT_DIR)
+    for executor in (code_executor.SubprocessExecutor(), WorkerPoolExecutor(1)):
+        try:
+            result = executor.run(code, str(tmp_path), timeout=5, env=env)
+        finally:
+            executor.close()
+        assert result["success"], result["stderr"]
+        assert result["results"][0]["rows"] == [1, 2]
+        assert isinstance(result["results"][0]["hook"], str)
+        assert "result 2 could not be decoded" in result["stderr"]
+    assert not (tmp_path / "hooked").exists()
+
+
+def test_results_emitted_before_a_timeout_are_kept(tmp_path):
+    code = "from servers.code_executor import emit\nimport time\nemit({'partial': 1})\ntime.sleep(30)"
+    env = dict(os.environ, PYTHONPATH=code_executor.PROJECT_DIR)
+    for executor in (code_executor.SubprocessExecutor(), WorkerPoolExecutor(1)):
+        try:
+            result = executor.run(code, str(tmp_path), timeout=1, env=env)
+        finally:
+            executor.close()
+        assert result["stderr"] == "Execution timed out after 1 seconds"
+        assert result["results"] == [{"partial": 1}]
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
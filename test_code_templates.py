@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for template code generation
+"""
+
+import sys
+
+import pytest
+
+from servers.code_templates import extract_params
+from servers.tool_registry import get_registry
+
+
+def params_for(query: str, tool_name: str):
+    registry = get_registry()
+    return extract_params(query, tool_name, registry[tool_name]["inputSchema"], list(registry))
+
+
+@pytest.mark.parametrize("query,tool,expected", [
+    ("What is the 2 year treasury yield?", "TREASURY_YIELD", {"maturity": "2year"}),
+    ("weekly 30-year treasury yield", "TREASURY_YIELD", {"interval": "weekly", "maturity": "30year"}),
+    ("Show quarterly real GDP", "REAL_GDP", {"interval": "quarterly"}),
+    ("CPI semiannual", "CPI", {"interval": "semiannual"}),
+    ("CPI semi-annual data", "CPI", {"interval": "semiannual"}),
+    ("IBM intraday 5 min", "TIME_SERIES_INTRADAY", {"symbol": "IBM", "interval": "5min"}),
+    ("IBM daily prices", "TIME_SERIES_DAILY", {"symbol": "IBM"}),
+    ("IBM news from 2024-01-05", "NEWS_SENTIMENT",
+     {"tickers": "IBM", "time_from": "20240105T0000", "time_to": "20240105T2359"}),
+    ("EUR to USD exchange rate", "CURRENCY_EXCHANGE_RATE", {"from_currency": "EUR", "to_currency": "USD"}),
+])
+def test_enum_values_are_extracted(query, tool, expected):
+    assert params_for(query, tool) == expected
+
+
+@pytest.mark.parametrize("query,tool", [
+    # A span nothing takes: the server would serve the 3 month default
+    ("earnings calendar for the next 12 months", "EARNINGS_CALENDAR"),
+    # A frequency the tool does not take
+    ("IBM weekly prices", "TIME_SERIES_DAILY"),
+    # Two values of one enum
+    ("federal funds rate daily and weekly", "FEDERAL_FUNDS_RATE"),
+    # Dates, relative times and currencies the quote cannot take
+    ("NVDA quote a year ago", "GLOBAL_QUOTE"),
+    ("AAPL stock price yesterday", "GLOBAL_QUOTE"),
+    ("IBM stock price in EUR", "GLOBAL_QUOTE"),
+    ("IBM price in March 2024", "GLOBAL_QUOTE"),
+    ("AAPL income statement for last year", "INCOME_STATEMENT"),
+])
+def test_unconsumed_mentions_go_to_the_coder(query, tool):
+    assert params_for(query, tool) is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
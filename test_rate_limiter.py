@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Tests for the client-side rate limiter
+"""
+
+import sys
+import asyncio
+import sqlite3
+import subprocess
+
+from servers.rate_limiter import BucketStore, RateLimiter, RateLimitExceeded
+
+# Spends budget from the shared store until the daily budget runs out
+SPENDER = """
+import sys, asyncio
+from servers.rate_limiter import BucketStore, RateLimiter, RateLimitExceeded
+
+async def spend():
+    limiter = RateLimiter(calls_per_day=10, store=BucketStore(sys.argv[1]), key="test")
+    spent = 0
+    while True:
+        try:
+            await limiter.acquire()
+        except RateLimitExceeded:
+            return spent
+        spent += 1
+
+print(asyncio.run(spend()))
+"""
+
+
+def test_budget_is_shared_between_processes(tmp_path):
+    """Two processes on one store spend one daily budget between them."""
+    path = str(tmp_path / "limits.sqlite3")
+    processes = [
+        subprocess.Popen([sys.executable, "-c", SPENDER, path], stdout=subprocess.PIPE, text=True)
+        for _ in range(2)
+    ]
+    spent = [int(process.communicate(timeout=30)[0]) for process in processes]
+
+    assert sum(spent) == 10
+    limiter = RateLimiter(calls_per_day=10, store=BucketStore(path), key="test")
+    assert limiter.status()["remaining_day"] == 0
+
+
+def test_refund_returns_budget_to_the_store(tmp_path):
+    store = BucketStore(tmp_path / "limits.sqlite3")
+    first = RateLimiter(calls_per_day=5, store=store, key="test")
+    second = RateLimiter(calls_per_day=5, store=store, key="test")
+
+    asyncio.run(first.acquire(3))
+    assert second.status()["remaining_day"] == 2
+    asyncio.run(second.refund(3))
+    assert first.status()["remaining_day"] == 5
+
+
+def test_refused_batch_spends_nothing(tmp_path):
+    limiter = RateLimiter(calls_per_day=3, store=BucketStore(tmp_path / "limits.sqlite3"), key="test")
+
+    try:
+        asyncio.run(limiter.acquire(4))
+    except RateLimitExceeded:
+        pass
+    else:
+        raise AssertionError("acquire(4) should exceed a budget of 3")
+    assert limiter.status()["remaining_day"] == 3
+
+
+def test_locked_store_does_not_block_the_event_loop(tmp_path):
+    """While another process holds the store's lock, other tasks keep running."""
+    path = tmp_path / "limits.sqlite3"
+    limiter = RateLimiter(calls_per_day=5, store=BucketStore(path), key="test")
+    other = sqlite3.connect(path, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+
+    async def run():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.05)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        acquire = asyncio.create_task(limiter.acquire())
+        await asyncio.sleep(0.5)
+        assert not acquire.done()
+        other.execute("COMMIT")
+        await acquire
+        ticker.cancel()
+        return ticks
+
+    assert asyncio.run(run()) >= 5
+    assert limiter.status()["remaining_day"] == 4
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Tests for response reduction before the Parser agent
+"""
+
+import sys
+import json
+from datetime import date, timedelta
+
+import pytest
+
+from servers.response_reducer import reduce_response, reduce_results
+
+# Two and a half years of weekday closes ending 2025-06-20
+START = date(2023, 1, 2)
+DAYS = [START + timedelta(days=i) for i in range(901)]
+DAILY = {
+    "Meta Data": {"2. Symbol": "IBM"},
+    "Time Series (Daily)": {str(day): {"4. close": str(100 + i)} for i, day in enumerate(DAYS) if day.weekday() < 5},
+}
+
+
+def summary_for(query: str):
+    text, _ = reduce_response(DAILY, query, budget=3000)
+    return json.loads(text)["summary"]
+
+
+@pytest.mark.parametrize("query,bars", [
+    ("IBM last 5 days", 5),
+    ("IBM last 10 trading days", 10),
+    ("IBM top 20", 20),
+    ("IBM last 2 weeks", 10),
+])
+def test_counts_in_bars(query, bars):
+    assert summary_for(query)["bars"] == bars
+
+
+def test_periods_are_dates_not_bars():
+    """"past 6 months" of daily bars is about 130 bars, and the statistics cover just those."""
+    summary = summary_for("IBM over the past 6 months")
+    assert 125 <= summary["bars"] <= 135
+    assert summary["from"] >= "2024-12-20"
+    assert summary["to"] == "2025-06-20"
+
+
+@pytest.mark.parametrize("query,wanted", [
+    ("What was IBM's close on 2023-03-15?", ["2023-03-15"]),
+    ("IBM close on March 15, 2023", ["2023-03-15"]),
+    ("IBM close in March 2024", ["2024-03-01", "2024-03-15", "2024-03-29"]),
+    ("IBM in 2024-03 vs 15 Mar 2023", ["2024-03-29", "2023-03-15"]),
+    # A Saturday keeps the Friday before and the Monday after
+    ("IBM on 2023-03-18", ["2023-03-17", "2023-03-20"]),
+])
+def test_named_dates_keep_their_bars(query, wanted):
+    text, note = reduce_response(DAILY, query, budget=3000)
+    bars = json.loads(text)["Time Series (Daily)"]
+    assert all(day in bars for day in wanted)
+    assert "2025-06-20" not in bars
+    assert "around the dates" in note
+
+
+def test_periods_do_not_count_articles():
+    feed = [{"title": f"Story {i}", "summary": "words " * 100} for i in range(50)]
+    text, _ = reduce_response({"feed": feed}, "IBM news from the past 3 days", budget=2000)
+    assert len(json.loads(text)["feed"]) > 3
+
+
+def test_results_share_the_budget_as_json():
+    csv = "timestamp,close\n" + "\n".join(f"2024-01-{i % 28 + 1:02d},1.0" for i in range(5000))
+    text, note = reduce_results([csv, {"rows": list(range(5000))}, "plain " * 1000], "IBM", budget=3)
+    results = json.loads(text)
+    assert results[0].startswith("timestamp,close")
+    assert len(results[1]["rows"]) < 5000
+    assert isinstance(results[2], str)
+    assert note
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Regression tests for local tool selection
+"""
+
+import sys
+
+import pytest
+
+from servers.tool_selector import get_selector
+
+# Queries the selector must settle on its own
+CONFIDENT = [
+    ("AAPL stock price today", "GLOBAL_QUOTE"),
+    ("How much is TSLA trading at?", "GLOBAL_QUOTE"),
+    ("What is NVDA trading at right now?", "GLOBAL_QUOTE"),
+    ("What is Microsoft stock price", "GLOBAL_QUOTE"),
+    ("Get the current price of IBM", "GLOBAL_QUOTE"),
+    ("search ticker for Tesla", "SYMBOL_SEARCH"),
+    ("news about NVDA", "NEWS_SENTIMENT"),
+    ("earnings call transcript for IBM Q2 2024", "EARNINGS_CALL_TRANSCRIPT"),
+    ("RSI for AAPL", "RSI"),
+    ("AAPL income statement", "INCOME_STATEMENT"),
+    ("WTI crude oil price", "WTI"),
+    ("natural gas price", "NATURAL_GAS"),
+]
+
+# Queries that mention a price but need crypto, commodity or analyst data
+LEFT_TO_LLM = [
+    "bitcoin price",
+    "ETH price",
+    "price of gold",
+    "price target for NVDA",
+]
+
+
+@pytest.mark.parametrize("query,tool", CONFIDENT)
+def test_confident_selection(query, tool):
+    selected, _ = get_selector().select(query)
+    assert selected == tool
+
+
+@pytest.mark.parametrize("query", LEFT_TO_LLM)
+def test_generic_price_queries_go_to_the_llm(query):
+    selected, _ = get_selector().select(query)
+    assert selected is None
+
+
+def test_example_tickers_do_not_select_search():
+    """SEARCH documents "AAPL stock price daily" as an example query; naming AAPL must not favour it."""
+    ranked = dict(get_selector().rank("AAPL"))
+    assert "SEARCH" not in ranked
+
+
+def test_acronyms_still_count_as_terms():
+    """Upper-case words the tools use (RSI, GDP) are terms, not tickers."""
+    selector = get_selector()
+    assert "rsi" in selector.query_terms("RSI for AAPL")
+    assert "aapl" not in selector.query_terms("RSI for AAPL")
+    assert selector.select("Show quarterly real GDP")[0] == "REAL_GDP"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))